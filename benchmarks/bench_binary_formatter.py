@@ -0,0 +1,49 @@
+"""
+Compares the per-record cost and size of BinaryFormatter.encode with the text formatters, for records
+carrying every detail a text formatter can render.
+
+Run from the repository root: python -m benchmarks.bench_binary_formatter
+"""
+import inspect
+import timeit
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.formatters import BinaryFormatter, DefaultFormatter, JSONFormatter
+
+NUMBER = 20000
+DETAILED_FORMAT = '%(time)s :: %(level_name)s :: %(logger_name)s :: %(thread_name)s :: %(process_id)d :: ' \
+                  '%(module_name)s.%(function_name)s :: %(message)s'
+
+
+def main() -> None:
+    """Runs the benchmark and prints records per second and bytes per record for every formatter."""
+    record = Record(
+        message='Request handled in 12 ms for client 10.0.0.1',
+        logger_name='BenchmarkLogger',
+        level_number=20,
+        caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+    )
+    text_formatters = {
+        'default': DefaultFormatter(),
+        'detailed': DefaultFormatter(DETAILED_FORMAT),
+        'json': JSONFormatter({
+            'time': '%(time)s', 'level': '%(level_name)s', 'logger': '%(logger_name)s', 'thread': '%(thread_name)s',
+            'process': '%(process_id)d', 'function': '%(function_name)s', 'message': '%(message)s'
+        })
+    }
+
+    for label, formatter in text_formatters.items():
+        elapsed = min(timeit.repeat(lambda: formatter.format(record), number=NUMBER, repeat=5))
+        size = len(formatter.format(record).encode('utf-8')) + 1
+        print(f'{label:<22} {NUMBER / elapsed:>10,.0f} records/s   {size:>4} bytes/record')
+
+    for label, formatter in (('binary', BinaryFormatter()), ('binary without caller', BinaryFormatter(False))):
+        table = {}
+        formatter.encode(record, table)
+        elapsed = min(timeit.repeat(lambda: formatter.encode(record, table), number=NUMBER, repeat=5))
+        size = len(formatter.encode(record, table))
+        print(f'{label:<22} {NUMBER / elapsed:>10,.0f} records/s   {size:>4} bytes/record')
+
+
+if __name__ == '__main__':
+    main()
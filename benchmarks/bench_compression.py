@@ -0,0 +1,92 @@
+"""
+Measures the per-record emit latency of a FileHandler while idle and while a Compressor is
+compressing a large closed log segment in the background.
+
+Run from the repository root: python -m benchmarks.bench_compression
+"""
+import inspect
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Compressor, FileHandler, FlushPolicy
+
+RECORDS = 20000
+SEGMENT_SIZE = 64 * 1024 * 1024
+
+
+def measure(handler: FileHandler, record: Record) -> list:
+    """
+    Emits records one by one and returns the latency of every emit.
+
+    :param handler: Handler to emit the records to.
+    :type handler: FileHandler
+    :param record: Record to emit.
+    :type record: Record
+    :return: Emit latencies in microseconds.
+    :rtype: list
+    """
+    latencies = []
+    for _ in range(RECORDS):
+        start = time.perf_counter_ns()
+        handler.emit(record, True)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    """
+    Prints the median, 99th percentile and maximum of the given latencies.
+
+    :param label: Label of the measurement.
+    :type label: str
+    :param latencies: Emit latencies in microseconds.
+    :type latencies: list
+    """
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'{label:<12} p50 {percentiles[49]:7.2f} us   p99 {percentiles[98]:7.2f} us   max {max(latencies):9.2f} us')
+
+
+def main() -> None:
+    """Runs the benchmark and prints the emit latencies with and without a compression running."""
+    directory = tempfile.mkdtemp()
+    try:
+        segment = os.path.join(directory, 'segment.log')
+        with open(segment, 'w', encoding='UTF-8') as file:
+            line = '2024-03-22 23:48:30 :: INFO :: Request handled in 12 ms for client 10.0.0.1\n'
+            file.write(line * (SEGMENT_SIZE // len(line)))
+
+        handler = FileHandler(
+            formatter=DefaultFormatter(),
+            file_name=os.path.join(directory, 'app.log'),
+            keep_open=True,
+            flush_policy=FlushPolicy(records=100)
+        )
+        record = Record(
+            message='Request handled',
+            logger_name='BenchmarkLogger',
+            level_number=20,
+            caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+        )
+
+        report('idle', measure(handler, record))
+
+        compressor = Compressor(codec=Compressor.GZIP, level=9)
+        future = compressor.compress(segment)
+        latencies = measure(handler, record)
+        running = not future.done()
+        compressor.shutdown()
+        report('compressing', latencies)
+        print(f'compression still running at the end of the measurement: {running}')
+
+        handler.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
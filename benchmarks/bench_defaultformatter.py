@@ -0,0 +1,75 @@
+"""
+Measures the per-record cost of DefaultFormatter.format against the previous implementation,
+which called str.replace on the whole format string once for every known token.
+
+Run from the repository root: python -m benchmarks.bench_defaultformatter
+"""
+import inspect
+import timeit
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.formatters import DefaultFormatter, DEFAULT_FORMAT
+
+NUMBER = 20000
+FORMATS = {
+    'default': DEFAULT_FORMAT,
+    'message only': '%(message)s',
+    'detailed': '%(time)s :: %(level_name)s :: %(logger_name)s :: %(module_name)s.%(function_name)s :: %(message)s'
+}
+
+
+def legacy_format(formatter: DefaultFormatter, record: Record) -> str:
+    """
+    Formats the record the way DefaultFormatter did before format strings were compiled,
+    extracting every log attribute and replacing each token on the whole string.
+
+    :param formatter: Formatter providing the format string and date format.
+    :type formatter: DefaultFormatter
+    :param record: Log record to format.
+    :type record: Record
+    :return: Formatted log message.
+    :rtype: str
+    """
+    log_attributes = {
+        '%(time)s': formatter.format_time(record.time.timetuple(), formatter.date_format),
+        '%(message)s': record.message,
+        '%(logger_name)s': record.logger_name,
+        '%(level_name)s': record.level_name,
+        '%(level_number)d': record.level_number,
+        '%(file_name)s': record.file_name,
+        '%(class_name)s': record.class_name,
+        '%(function_name)s': record.function_name,
+        '%(module_name)s': record.module_name,
+        '%(path_name)s': record.path_name,
+        '%(exec_info)s': formatter.format_exception(record.exec_info),
+        '%(stack_info)s': record.stack_info,
+        '%(thread)d': record.thread,
+        '%(thread_name)s': record.thread_name,
+        '%(process_id)d': record.process_id
+    }
+
+    formatted_message = formatter.format_str
+    for token, value in log_attributes.items():
+        formatted_message = formatted_message.replace(token, str(value))
+    return formatted_message
+
+
+def main() -> None:
+    """Runs the benchmark for each format string and prints the cost per record."""
+    record = Record(
+        message='Benchmark message',
+        logger_name='BenchmarkLogger',
+        level_number=20,
+        caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+    )
+
+    print(f'{"format":<14}{"legacy (us)":>14}{"compiled (us)":>16}')
+    for name, format_str in FORMATS.items():
+        formatter = DefaultFormatter(format_str)
+        legacy = min(timeit.repeat(lambda: legacy_format(formatter, record), number=NUMBER, repeat=5))
+        compiled = min(timeit.repeat(lambda: formatter.format(record), number=NUMBER, repeat=5))
+        print(f'{name:<14}{legacy / NUMBER * 1e6:>14.2f}{compiled / NUMBER * 1e6:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
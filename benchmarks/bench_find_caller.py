@@ -0,0 +1,99 @@
+"""
+Compares the throughput of Logger.find_caller with the caller details resolved on every call
+against the memoized CallerFrame.get_caller_details.
+
+Run from the repository root: python -m benchmarks.bench_find_caller
+"""
+import inspect
+import os
+import timeit
+from types import FrameType
+
+from pyloggermanager import CallerFrame, Logger
+
+NUMBER = 20000
+
+
+def legacy_get_caller_details(frame: FrameType) -> CallerFrame:
+    """
+    Retrieves caller details the way CallerFrame.get_caller_details did before memoization.
+
+    :param frame: Frame object containing caller information.
+    :type frame: FrameType
+    :return: Caller details
+    :rtype: CallerFrame
+    """
+    caller_frame = CallerFrame()
+
+    while frame:
+        caller_frame.file_name = os.path.splitext(os.path.basename(frame.f_globals.get('__file__', '')))[0]
+        caller_frame.module_name = os.path.splitext(caller_frame.file_name)[0]
+        caller_frame.path_name = frame.f_globals.get('__file__', '')
+
+        if 'self' in frame.f_locals:
+            caller_frame.class_name = frame.f_locals['self'].__class__.__name__
+            caller_frame.function_name = frame.f_code.co_name
+            break
+
+        frame = frame.f_back
+
+    return caller_frame
+
+
+def legacy_is_internal_frame(frame: FrameType) -> bool:
+    """
+    Checks if the frame is internal to the logger the way Logger._is_internal_frame did before memoization.
+
+    :param frame: The frame to check.
+    :type frame: FrameType
+    :return: True if the frame is internal to the logger.
+    :rtype: bool
+    """
+    file_name = os.path.normcase(frame.f_code.co_filename)
+    return file_name == os.path.normcase(inspect.getfile(Logger)) or (
+            'importlib' in file_name and '_bootstrap' in file_name
+    )
+
+
+class Service:
+    """Calls find_caller from a helper function below a method, as application code would."""
+
+    def __init__(self, logger: Logger) -> None:
+        self.logger = logger
+
+    def run(self) -> None:
+        helper(self.logger)
+
+
+def helper(logger: Logger) -> None:
+    """
+    Calls find_caller a few frames below a method.
+
+    :param logger: Logger used to find the caller.
+    :type logger: Logger
+    """
+    logger.find_caller()
+
+
+def main() -> None:
+    """Runs the benchmark and prints find_caller calls per second for both implementations."""
+    service = Service(Logger(name='BenchmarkLogger'))
+
+    memoized = min(timeit.repeat(service.run, number=NUMBER, repeat=5))
+
+    get_caller_details = CallerFrame.__dict__['get_caller_details']
+    is_internal_frame = Logger.__dict__['_is_internal_frame']
+    CallerFrame.get_caller_details = staticmethod(legacy_get_caller_details)
+    Logger._is_internal_frame = staticmethod(legacy_is_internal_frame)
+    try:
+        legacy = min(timeit.repeat(service.run, number=NUMBER, repeat=5))
+    finally:
+        CallerFrame.get_caller_details = get_caller_details
+        Logger._is_internal_frame = is_internal_frame
+
+    print(f'legacy:   {NUMBER / legacy:,.0f} calls/s')
+    print(f'memoized: {NUMBER / memoized:,.0f} calls/s')
+
+
+if __name__ == '__main__':
+    main()
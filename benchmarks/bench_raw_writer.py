@@ -0,0 +1,75 @@
+"""
+Compares the throughput of a FileHandler writing through a text stream with one writing through a raw
+O_APPEND file descriptor, for records flushed one by one, flushed every 100 records and handled in
+batches of 100 records.
+
+Run from the repository root: python -m benchmarks.bench_raw_writer
+"""
+import inspect
+import os
+import shutil
+import tempfile
+import time
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import FileHandler, FlushPolicy
+
+RECORDS = 50000
+BATCH_SIZE = 100
+
+
+def measure(handler: FileHandler, record: Record, batch: bool) -> float:
+    """
+    Writes records through the handler and returns the number of records written per second.
+
+    :param handler: Handler to write the records with.
+    :type handler: FileHandler
+    :param record: Record to write.
+    :type record: Record
+    :param batch: Handle the records in batches instead of one by one.
+    :type batch: bool
+    :return: Records written per second.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    if batch:
+        records = [record] * BATCH_SIZE
+        for _ in range(RECORDS // BATCH_SIZE):
+            handler.handle_batch(records, True)
+    else:
+        for _ in range(RECORDS):
+            handler.handle(record, True)
+    handler.close()
+    return RECORDS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Runs the benchmark and prints the throughput of the text and raw writers."""
+    directory = tempfile.mkdtemp()
+    try:
+        record = Record(
+            message='Request handled in 12 ms for client 10.0.0.1',
+            logger_name='BenchmarkLogger',
+            level_number=20,
+            caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+        )
+        scenarios = (
+            ('flush every record', None, False),
+            ('flush every 100', FlushPolicy(records=BATCH_SIZE), False),
+            (f'batches of {BATCH_SIZE}', None, True)
+        )
+
+        for label, flush_policy, batch in scenarios:
+            for raw in (False, True):
+                handler = FileHandler(
+                    formatter=DefaultFormatter(), file_name=os.path.join(directory, f'{raw}.log'), keep_open=True,
+                    flush_policy=flush_policy, raw=raw
+                )
+                print(f'{label:<20} {"raw" if raw else "text":<5} {measure(handler, record, batch):>10,.0f} records/s')
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
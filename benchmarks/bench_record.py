@@ -0,0 +1,51 @@
+"""
+Measures the construction time of Record objects and the memory held per record when a
+workload keeps records in a buffer.
+
+Run from the repository root: python -m benchmarks.bench_record
+"""
+import inspect
+import timeit
+import tracemalloc
+
+from pyloggermanager import CallerFrame, Record
+
+NUMBER = 20000
+BUFFERED = 10000
+
+
+def make_record(caller_frame: CallerFrame) -> Record:
+    """
+    Creates a record the way Logger.make_record does.
+
+    :param caller_frame: Caller frame details of the record.
+    :type caller_frame: CallerFrame
+    :return: New log record.
+    :rtype: Record
+    """
+    return Record(
+        message='Benchmark message',
+        logger_name='BenchmarkLogger',
+        level_number=20,
+        caller_frame=caller_frame
+    )
+
+
+def main() -> None:
+    """Runs the benchmark and prints construction time and memory per record."""
+    caller_frame = CallerFrame.get_caller_details(inspect.currentframe())
+
+    construction = min(timeit.repeat(lambda: make_record(caller_frame), number=NUMBER, repeat=5))
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    buffer = [make_record(caller_frame) for _ in range(BUFFERED)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f'construction: {construction / NUMBER * 1e6:.2f} us/record')
+    print(f'memory:       {(after - before) / len(buffer):.0f} bytes/record')
+
+
+if __name__ == '__main__':
+    main()
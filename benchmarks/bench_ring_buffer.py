@@ -0,0 +1,83 @@
+"""
+Compares the per-record emit latency of a RingBufferHandler with a FileHandler writing every record
+to the file and a FileHandler buffering records in memory.
+
+Run from the repository root: python -m benchmarks.bench_ring_buffer
+"""
+import inspect
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import FileHandler, FlushPolicy, Handler, RingBufferHandler
+
+RECORDS = 50000
+
+
+def measure(handler: Handler, record: Record) -> list:
+    """
+    Emits records one by one and returns the latency of every emit.
+
+    :param handler: Handler to emit the records to.
+    :type handler: Handler
+    :param record: Record to emit.
+    :type record: Record
+    :return: Emit latencies in microseconds.
+    :rtype: list
+    """
+    latencies = []
+    for _ in range(RECORDS):
+        start = time.perf_counter_ns()
+        handler.emit(record, True)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    return latencies
+
+
+def report(label: str, latencies: list) -> None:
+    """
+    Prints the median, 99th percentile and maximum of the given latencies.
+
+    :param label: Label of the measurement.
+    :type label: str
+    :param latencies: Emit latencies in microseconds.
+    :type latencies: list
+    """
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'{label:<14} p50 {percentiles[49]:7.2f} us   p99 {percentiles[98]:7.2f} us   max {max(latencies):9.2f} us')
+
+
+def main() -> None:
+    """Runs the benchmark and prints the emit latencies of every handler."""
+    directory = tempfile.mkdtemp()
+    try:
+        formatter = DefaultFormatter()
+        record = Record(
+            message='Request handled',
+            logger_name='BenchmarkLogger',
+            level_number=10,
+            caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+        )
+        handlers = {
+            'file flushed': FileHandler(
+                formatter=formatter, file_name=os.path.join(directory, 'flushed.log'), keep_open=True
+            ),
+            'file buffered': FileHandler(
+                formatter=formatter, file_name=os.path.join(directory, 'buffered.log'), keep_open=True,
+                flush_policy=FlushPolicy(records=1000)
+            ),
+            'ring buffer': RingBufferHandler(formatter=formatter, file_name=os.path.join(directory, 'flight.ring'))
+        }
+
+        for label, handler in handlers.items():
+            report(label, measure(handler, record))
+            handler.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
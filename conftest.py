@@ -1,3 +1,10 @@
+import os
+import sys
+
+# Lets the tests of every directory import the helpers of tests/utilityclass.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tests'))
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Custom pytest hook to modify the collection of test items.
@@ -10,6 +10,8 @@ __all__ = [
     "RootLogger",
     "load_config",
     "get_logger",
+    "get_last_resort",
+    "set_last_resort",
     "critical",
     "debug",
     "error",
@@ -18,6 +20,7 @@ __all__ = [
     "log",
     "disable",
     "shutdown",
+    "shutdown_async",
     "formatters",
     "handlers",
     "streams",
@@ -51,4 +54,5 @@ from pyloggermanager import formatters
 from pyloggermanager import handlers
 from pyloggermanager import streams
 from pyloggermanager.__main__ import CallerFrame, FileMode, Lock, LogLevel, Record, Logger, Manager, \
-    Registry, RootLogger, load_config, get_logger, critical, debug, error, info, warning, log, disable, shutdown
+    Registry, RootLogger, load_config, get_logger, get_last_resort, set_last_resort, critical, debug, error, info, \
+    warning, log, disable, shutdown, shutdown_async
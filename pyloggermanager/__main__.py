@@ -1,5 +1,7 @@
+import asyncio
 import inspect
 import io
+import itertools
 import json
 import os
 import random
@@ -7,12 +9,16 @@ import string
 import sys
 import threading
 import traceback
+import warnings
+import weakref
 from datetime import datetime
 from types import FrameType, TracebackType, NoneType
 from typing import Any, Optional, Tuple, Type, Union
 
 from pyloggermanager.formatters import Formatter, DefaultFormatter, DEFAULT_FORMAT, DATE_FORMAT
-from pyloggermanager.handlers import Handler, StderrHandler, FileHandler, StreamHandler
+from pyloggermanager.handlers import AsyncHandler, Handler, StderrHandler, FileHandler, StreamHandler
+from pyloggermanager.handlers.__main__ import _after_fork_in_child as _after_fork_in_child_handlers, \
+    _before_fork as _before_fork_handlers
 from pyloggermanager.streams import Stream
 
 
@@ -23,6 +29,11 @@ class CallerFrame:
     method to retrieve caller details from a given frame.
     """
 
+    # Caller details resolved per code object: (file_name, module_name, path_name, may_have_self).
+    # Code objects are weakly referenced, so entries of reloaded or discarded modules are dropped
+    # together with their old code objects.
+    _cache = weakref.WeakKeyDictionary()
+
     def __init__(self):
         """Initializes the 'CallerFrame' object with default attribute values."""
         self.class_name = 'Unknown Class'
@@ -31,6 +42,41 @@ class CallerFrame:
         self.module_name = 'Unknown Module'
         self.path_name = 'Unknown Path'
 
+    @classmethod
+    def _resolve_code(cls, frame: FrameType) -> Tuple[str, str, str, bool]:
+        """
+        Returns the cached file name, module name, path name and whether the frame can hold a
+        'self' local for the code object of the given frame, resolving them on first use.
+
+        :param frame: Frame object containing caller information.
+        :type frame: FrameType
+        :return: File name, module name, path name and 'self' flag.
+        :rtype: Tuple[str, str, str, bool]
+        """
+        code = frame.f_code
+        details = cls._cache.get(code)
+        if details is None:
+            path_name = frame.f_globals.get('__file__', '') or ''
+            # Extract file name without extension
+            file_name = os.path.splitext(os.path.basename(path_name))[0]
+            module_name = os.path.splitext(file_name)[0]
+            # Optimized (function) frames only expose 'self' when the code defines such a name,
+            # other frames (module or class bodies) keep their locals in a plain dictionary
+            may_have_self = not code.co_flags & inspect.CO_OPTIMIZED or 'self' in (
+                    code.co_varnames + code.co_cellvars + code.co_freevars
+            )
+            details = (file_name, module_name, path_name, may_have_self)
+            cls._cache[code] = details
+        return details
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clears the cached caller details, e.g. after the '__file__' of a module has been changed
+        without reloading it.
+        """
+        cls._cache.clear()
+
     @classmethod
     def get_caller_details(cls, frame: FrameType) -> 'CallerFrame':
         """
@@ -47,16 +93,18 @@ class CallerFrame:
         caller_frame = cls()
 
         while frame:
-            # Extract file name without extension
-            caller_frame.file_name = os.path.splitext(os.path.basename(frame.f_globals.get('__file__', '')))[0]
-            caller_frame.module_name = os.path.splitext(caller_frame.file_name)[0]
-            caller_frame.path_name = frame.f_globals.get('__file__', '')
+            file_name, module_name, path_name, may_have_self = cls._resolve_code(frame)
+            caller_frame.file_name = file_name
+            caller_frame.module_name = module_name
+            caller_frame.path_name = path_name
 
             # Check if the frame contains 'self' in locals (indicating a method call)
-            if 'self' in frame.f_locals:
-                caller_frame.class_name = frame.f_locals['self'].__class__.__name__
-                caller_frame.function_name = frame.f_code.co_name
-                break
+            if may_have_self:
+                f_locals = frame.f_locals
+                if 'self' in f_locals:
+                    caller_frame.class_name = f_locals['self'].__class__.__name__
+                    caller_frame.function_name = frame.f_code.co_name
+                    break
 
             frame = frame.f_back
 
@@ -234,9 +282,13 @@ class Lock:
     """
     This class provides a simple interface to manage locks using the Python threading module.
     It allows acquiring, creating, checking if a lock is locked, and releasing locks.
+    Locks created by the registry are kept until the process exits, while locks registered by
+    their owner (logger, manager or handler) are held weakly, so they are discarded as soon as
+    their owner no longer references them.
     """
 
-    _locks = {}  # Dictionary to store locks created by their names
+    _locks = weakref.WeakValueDictionary()  # Weak mapping of lock names to every registered lock
+    _created_locks = {}  # Strong references to the locks created by the registry
 
     @classmethod
     def _get_lock(cls, name: str) -> threading.RLock:
@@ -248,10 +300,10 @@ class Lock:
         :return: The lock object.
         :rtype: threading.RLock
         """
-        if name.upper() in cls._locks:
-            return cls._locks[name.upper()]
-        else:
+        lock = cls._locks.get(name.upper())
+        if lock is None:
             raise ValueError(f'Lock with name "{name}" not found.')
+        return lock
 
     @classmethod
     def acquire(cls, name: str, blocking: bool = True, timeout: float = -1) -> bool:
@@ -267,20 +319,29 @@ class Lock:
         :return: True if the lock was acquired successfully, False otherwise.
         :rtype: bool
         """
-        lock = cls._get_lock(name)
-        with lock:
-            return lock.acquire(blocking, timeout)
+        return cls._get_lock(name).acquire(blocking, timeout)
 
     @classmethod
-    def create(cls, name: str) -> None:
+    def create(cls, name: str, lock: threading.RLock = None) -> threading.RLock:
         """
-        Creates a new lock with the given name.
+        Creates a new lock with the given name, or registers the provided lock under that name.
+        A created lock is kept by the registry, while a provided lock is only referenced weakly, so
+        its owner must hold on to it.
 
         :param name: Name of the lock to create.
         :type name: str
-        :return: None
+        :param lock: Existing lock to register under the name. Defaults to None.
+        :type lock: threading.RLock
+        :return: The lock registered under the given name.
+        :rtype: threading.RLock
         """
-        cls._locks[name.upper()] = threading.RLock()
+        name = name.upper()
+        if lock is None:
+            lock = cls._created_locks[name] = threading.RLock()
+        else:
+            cls._created_locks.pop(name, None)
+        cls._locks[name] = lock
+        return lock
 
     @staticmethod
     def generate_name(length: int = 10) -> str:
@@ -538,8 +599,15 @@ class Record:
     Represents a log record with various attributes such as message, logger name,
     level name, caller frame information, execution information, stack information, and
     thread/process details. Provides methods to serialize the record to a dictionary and JSON format.
+    Records use slots to stay compact, and derived details (level name, thread name, process id and
+    caller details) are only resolved when first accessed.
     """
 
+    __slots__ = (
+        '_time', '_message', '_args', '_formatted', '_logger_name', '_level_number', '_level_name', '_caller_frame',
+        '_exec_info', '_stack_info', '_thread', '_thread_object', '_thread_name', '_process_id'
+    )
+
     def __init__(
             self,
             message: str,
@@ -547,7 +615,8 @@ class Record:
             level_number: int,
             caller_frame: "CallerFrame",
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
-            stack_info: Optional[str] = None
+            stack_info: Optional[str] = None,
+            args: tuple | dict = None
     ) -> None:
         """
         Constructs a new 'Record' object with the provided parameters.
@@ -564,18 +633,23 @@ class Record:
         :type exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]], optional
         :param stack_info: Stack information, defaults to None
         :type stack_info: Optional[str], optional
+        :param args: Arguments interpolated into the message with the '%' operator when the message is
+            first read, defaults to None
+        :type args: tuple | dict, optional
         """
         if not isinstance(message, str):
             raise TypeError('message should be a string.')
+        elif not isinstance(args, (tuple, dict, NoneType)):
+            raise TypeError('args should be a tuple or a dict.')
         elif not isinstance(logger_name, str):
             raise TypeError('logger_name should be a string.')
         elif not isinstance(level_number, int):
             raise TypeError('level_number should be an integer.')
         elif not isinstance(caller_frame, CallerFrame):
             raise TypeError('caller_frame should be of CallerFrame type.')
-        elif not isinstance(stack_info, Union[str, NoneType]):
+        elif not isinstance(stack_info, (str, NoneType)):
             raise TypeError('stack_info should be a string.')
-        elif not isinstance(exec_info, Union[Tuple, NoneType]):
+        elif not isinstance(exec_info, (tuple, NoneType)):
             if exec_info:
                 if not len(exec_info) == 3 or isinstance(exec_info[0], type) or \
                         isinstance(exec_info[0], BaseException) or \
@@ -585,21 +659,65 @@ class Record:
                         'exec_info should be of Tuple[Type[BaseException], BaseException, Optional[TracebackType]]'
                     )
 
+        if level_number not in LogLevel._level_to_name:
+            raise ValueError(f'Invalid level: {level_number}')
+
+        thread = threading.current_thread()
         self._time = datetime.utcnow()
         self._message = message
+        self._args = args
+        self._formatted = None if args else message
         self._logger_name = logger_name
-        self._level_number = LogLevel.check_level(level_number)
-        self._level_name = LogLevel.get_level(self._level_number)
-        self._file_name = caller_frame.file_name
-        self._class_name = caller_frame.class_name
-        self._function_name = caller_frame.function_name
-        self._module_name = caller_frame.module_name
-        self._path_name = caller_frame.path_name
+        self._level_number = level_number
+        self._level_name = None
+        self._caller_frame = caller_frame
         self._exec_info = exec_info
         self._stack_info = stack_info
-        self._thread = threading.get_ident() if threading else None
-        self._thread_name = threading.current_thread().name if threading else None
-        self._process_id = os.getpid() if hasattr(os, 'getpid') else None
+        self._thread = thread.ident
+        self._thread_object = thread
+        self._thread_name = None
+        self._process_id = _process_id
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the record for pickling, with every lazily computed detail resolved.
+
+        :return: State of the record.
+        :rtype: dict
+        """
+        state = {name: getattr(self, name) for name in self.__slots__ if name != '_thread_object'}
+        state.update(
+            _message=self.message, _args=None, _formatted=self.message, _level_name=self.level_name,
+            _thread_name=self.thread_name, _process_id=self.process_id
+        )
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the state of a pickled record.
+
+        :param state: State of the record.
+        :type state: dict
+        """
+        self._thread_object = None
+        self._formatted = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _set_caller_detail(self, name: str, value: str) -> None:
+        """
+        Overrides one caller detail on a private copy of the caller frame, as caller frames may
+        be shared between records.
+
+        :param name: Name of the caller detail.
+        :type name: str
+        :param value: New value of the caller detail.
+        :type value: str
+        """
+        caller_frame = CallerFrame()
+        caller_frame.__dict__.update(self._caller_frame.__dict__)
+        setattr(caller_frame, name, value)
+        self._caller_frame = caller_frame
 
     @property
     def time(self) -> datetime:
@@ -611,9 +729,18 @@ class Record:
     @property
     def message(self) -> str:
         """
-        Property representing the log message.
+        Property representing the log message. When the record was created with arguments, they are
+        interpolated into the message the first time it is read and the result is kept for later reads.
+        The template and arguments are never modified, so concurrent first reads interpolate the same
+        message and publish the same result.
         """
-        return self._message
+        message = self._formatted
+        if message is None:
+            message, args = self._message, self._args
+            if args:
+                message = message % args
+            self._formatted = message
+        return message
 
     @message.setter
     def message(self, value: str) -> None:
@@ -627,6 +754,8 @@ class Record:
             raise TypeError('message should be a string.')
 
         self._message = value
+        self._args = None
+        self._formatted = value
 
     @property
     def logger_name(self) -> str:
@@ -667,13 +796,15 @@ class Record:
             raise TypeError('level_number should be an integer.')
 
         self._level_number = LogLevel.check_level(value)
-        self._level_name = LogLevel.get_level(value)
+        self._level_name = None
 
     @property
     def level_name(self) -> str:
         """
         Property representing the name of the log level.
         """
+        if self._level_name is None:
+            self._level_name = LogLevel.get_level(self._level_number)
         return self._level_name
 
     @property
@@ -681,7 +812,7 @@ class Record:
         """
         Property representing the name of the file where the log occurred.
         """
-        return self._file_name
+        return self._caller_frame.file_name
 
     @file_name.setter
     def file_name(self, value: str) -> None:
@@ -694,14 +825,14 @@ class Record:
         if not isinstance(value, str):
             raise TypeError('file_name should be a string.')
 
-        self._file_name = value
+        self._set_caller_detail('file_name', value)
 
     @property
     def class_name(self) -> str:
         """
         Property representing the name of the class where the log occurred.
         """
-        return self._class_name
+        return self._caller_frame.class_name
 
     @class_name.setter
     def class_name(self, value: str) -> None:
@@ -714,14 +845,14 @@ class Record:
         if not isinstance(value, str):
             raise TypeError('class_name should be a string.')
 
-        self._class_name = value
+        self._set_caller_detail('class_name', value)
 
     @property
     def function_name(self) -> str:
         """
         Property representing the name of the function/method where the log occurred.
         """
-        return self._function_name
+        return self._caller_frame.function_name
 
     @function_name.setter
     def function_name(self, value: str) -> None:
@@ -734,14 +865,14 @@ class Record:
         if not isinstance(value, str):
             raise TypeError('function_name should be a string.')
 
-        self._function_name = value
+        self._set_caller_detail('function_name', value)
 
     @property
     def module_name(self) -> str:
         """
         Property representing the name of the module where the log occurred.
         """
-        return self._module_name
+        return self._caller_frame.module_name
 
     @module_name.setter
     def module_name(self, value: str) -> None:
@@ -754,14 +885,14 @@ class Record:
         if not isinstance(value, str):
             raise TypeError('module_name should be a string.')
 
-        self._module_name = value
+        self._set_caller_detail('module_name', value)
 
     @property
     def path_name(self) -> str:
         """
         Property representing the path of the file where the log occurred.
         """
-        return self._path_name
+        return self._caller_frame.path_name
 
     @path_name.setter
     def path_name(self, value: str) -> None:
@@ -774,7 +905,7 @@ class Record:
         if not isinstance(value, str):
             raise TypeError('path_name should be a string.')
 
-        self._path_name = value
+        self._set_caller_detail('path_name', value)
 
     @property
     def exec_info(self) -> Tuple[Type[BaseException], BaseException, Optional[TracebackType]] | None:
@@ -791,7 +922,7 @@ class Record:
         :param value: New execution information
         :type value: Tuple[Type, BaseException, Optional[TracebackType]]
         """
-        if not isinstance(value, Union[Tuple, NoneType]):
+        if not isinstance(value, (tuple, NoneType)):
             if value:
                 if not len(value) == 3 or isinstance(value[0], type) or \
                         isinstance(value[0], BaseException) or \
@@ -835,6 +966,8 @@ class Record:
         """
         Property representing the name of the thread associated with the log record.
         """
+        if self._thread_name is None and self._thread_object is not None:
+            self._thread_name = self._thread_object.name
         return self._thread_name
 
     @property
@@ -895,6 +1028,15 @@ class Logger:
     Represents a logger object with various attributes and methods for logging message.
     """
 
+    # Whether the code object of a frame is internal to the logger, resolved once per code object
+    _internal_codes = weakref.WeakKeyDictionary()
+
+    # Generation of the logging configuration, renewed whenever levels, the disable level, handlers,
+    # handler levels, parents or propagation change so that the cached level decisions and handler
+    # chains of every logger are discarded on their next use
+    _generations = itertools.count(1)
+    _generation = 0
+
     def __init__(self, name: str, level: int = LogLevel.INFO) -> None:
         """
         Initializes a new Logger object.
@@ -915,9 +1057,12 @@ class Logger:
         self._parent = None
         self._propagate = True
         self._handlers = []
+        self._handler_chain = (None, (), None)
         self._cache = {}
+        self._cache_generation = Logger._generation
         self._disabled = False
-        self._lock_name = None
+        self._lock_name = Lock.generate_name()
+        self._lock = Lock.create(self._lock_name, threading.RLock())
         self._manager = Manager(self)
 
     @property
@@ -941,7 +1086,12 @@ class Logger:
         if not isinstance(value, dict):
             raise TypeError('cache should be a dict.')
 
-        self._cache = value
+        self._acquire_lock()
+        try:
+            self._cache = value
+            self._cache_generation = Logger._generation
+        finally:
+            self._release_lock()
 
     @property
     def disabled(self) -> bool:
@@ -982,6 +1132,7 @@ class Logger:
             raise TypeError('handlers should be a list.')
 
         self._handlers = value
+        Logger._invalidate_caches()
 
     @property
     def level(self) -> int:
@@ -1002,7 +1153,7 @@ class Logger:
             raise TypeError('level should be an integer.')
 
         self._level = LogLevel.check_level(value)
-        self.manager.clear_cache()
+        Logger._invalidate_caches()
 
     @property
     def lock_name(self) -> str:
@@ -1026,6 +1177,7 @@ class Logger:
             raise TypeError('lock_name should be a string.')
 
         self._lock_name = value
+        self._create_lock()
 
     @property
     def manager(self) -> 'Manager':
@@ -1046,6 +1198,7 @@ class Logger:
             raise TypeError('manager should be of Manager type.')
 
         self._manager = value
+        Logger._invalidate_caches()
 
     @property
     def name(self) -> str:
@@ -1086,6 +1239,28 @@ class Logger:
             raise TypeError('logger should be of Logger type.')
 
         self._parent = value
+        Logger._invalidate_caches()
+
+    @property
+    def propagate(self) -> bool:
+        """
+        Whether records are passed on to the handlers of the parent loggers.
+        """
+        return self._propagate
+
+    @propagate.setter
+    def propagate(self, value: bool) -> None:
+        """
+        Sets whether records are passed on to the handlers of the parent loggers.
+
+        :param value: The new propagation flag for the logger.
+        :type value: bool
+        """
+        if not isinstance(value, bool):
+            raise TypeError('propagate should be a boolean.')
+
+        self._propagate = value
+        Logger._invalidate_caches()
 
     @property
     def root(self) -> 'Logger':
@@ -1109,21 +1284,61 @@ class Logger:
 
     def _acquire_lock(self) -> None:
         """
-        Acquires a lock for thread safety.
+        Acquires the logger's lock for thread safety.
 
         :return: None
         """
-        self.lock_name = Lock.generate_name()
-        self._create_lock()
-        Lock.acquire(self.lock_name)
+        self._lock.acquire()
 
     def _create_lock(self) -> None:
         """
-        Creates a lock.
+        Registers the logger's lock under the current lock name.
 
         :return: None
         """
-        Lock.create(self.lock_name)
+        self._lock = Lock.create(self._lock_name, self._lock)
+
+    def _get_handler_chain(self) -> tuple:
+        """
+        Returns the handlers of the logger and its ancestors, up to the first logger that does not
+        propagate, as a tuple of (handler, level) pairs. The chain is cached and only rebuilt after
+        the logger hierarchy has changed, together with the lowest level whose records need caller details.
+
+        :return: The handlers reachable from the logger together with their levels.
+        :rtype: tuple
+        """
+        generation, handler_chain, _ = self._handler_chain
+        if generation != Logger._generation:
+            # Read the generation before walking, so changes made during the walk trigger a rebuild
+            generation = Logger._generation
+            handler_chain = []
+            caller = self
+            while caller:
+                handler_chain.extend((handler, handler.level) for handler in caller._handlers)
+                if not caller._propagate:
+                    break
+                caller = caller.parent
+
+            handler_chain = tuple(handler_chain)
+            caller_levels = [handler_level for handler, handler_level in handler_chain if handler.needs_caller]
+            if not handler_chain:
+                last_resort = get_last_resort()
+                if last_resort is not None and last_resort.needs_caller:
+                    caller_levels.append(last_resort.level)
+            self._handler_chain = (generation, handler_chain, min(caller_levels, default=None))
+
+        return handler_chain
+
+    @staticmethod
+    def _invalidate_caches() -> None:
+        """
+        Renews the generation of the logging configuration, so the cached level decisions and
+        handler chains of all loggers are discarded on their next use. Called whenever the handlers,
+        their levels or their formatters change.
+
+        :return: None
+        """
+        Logger._generation = next(Logger._generations)
 
     @staticmethod
     def _is_internal_frame(frame: FrameType) -> bool:
@@ -1138,10 +1353,15 @@ class Logger:
         if not isinstance(frame, FrameType):
             raise TypeError('frame should be of FrameType type.')
 
-        file_name = os.path.normcase(frame.f_code.co_filename)
-        return file_name == os.path.normcase(inspect.getfile(Logger)) or (
-                'importlib' in file_name and '_bootstrap' in file_name
-        )
+        code = frame.f_code
+        is_internal = Logger._internal_codes.get(code)
+        if is_internal is None:
+            file_name = os.path.normcase(code.co_filename)
+            is_internal = file_name == os.path.normcase(inspect.getfile(Logger)) or (
+                    'importlib' in file_name and '_bootstrap' in file_name
+            )
+            Logger._internal_codes[code] = is_internal
+        return is_internal
 
     def _log(
             self,
@@ -1150,7 +1370,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message at the specified level with additional information.
@@ -1167,10 +1388,14 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if not isinstance(message, str):
             raise TypeError('message should be a string.')
+        elif not isinstance(args, (tuple, dict, NoneType)):
+            raise TypeError('args should be a tuple or a dict.')
         elif not isinstance(level, int):
             raise TypeError('level should be an integer.')
         elif not isinstance(ignore_display, bool):
@@ -1190,7 +1415,7 @@ class Logger:
                     )
 
         s_info = None
-        if os.path.normcase(inspect.getfile(Logger)):
+        if stack_info or self._needs_caller(level):
             caller_frame, s_info = self.find_caller(stack_info, stack_level)
         else:
             caller_frame = CallerFrame()
@@ -1201,16 +1426,36 @@ class Logger:
             elif not isinstance(exec_info, tuple):
                 exec_info = sys.exc_info()
 
-        record = self.make_record(self.name, level, message, caller_frame, exec_info, s_info)
+        record = self.make_record(self.name, level, message, caller_frame, exec_info, s_info, args)
         self.handle(record, ignore_display)
 
+    def _needs_caller(self, level: int) -> bool:
+        """
+        Checks if any handler reachable from the logger that accepts the given level uses the
+        caller details of a record, so the caller's frames are only walked when needed. Without any
+        reachable handler, the last resort handler that would receive the record is checked instead.
+        The answer is cached with the handler chain, as the lowest level needing caller details.
+
+        :param level: The log level.
+        :type level: int
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        handler_state = self._handler_chain
+        if handler_state[0] != Logger._generation:
+            self._get_handler_chain()
+            handler_state = self._handler_chain
+
+        caller_level = handler_state[2]
+        return caller_level is not None and level >= caller_level
+
     def _release_lock(self) -> None:
         """
         Releases the lock acquired for thread safety.
 
         :return: None
         """
-        Lock.release(self.lock_name)
+        self._lock.release()
 
     def add_handler(self, handler: Handler) -> None:
         """
@@ -1226,6 +1471,7 @@ class Logger:
         try:
             if handler not in self._handlers:
                 self._handlers.append(handler)
+                Logger._invalidate_caches()
         finally:
             self._release_lock()
 
@@ -1244,36 +1490,28 @@ class Logger:
         elif not isinstance(ignore_display, bool):
             raise TypeError('ignore_display should be a boolean.')
 
-        # Initialize callers_found to track the number of callers
-        callers_found = 0
+        # Handlers of the logger and its ancestors, flattened with their levels
+        handler_chain = self._get_handler_chain()
 
-        # Traverse through the logger and its ancestors
-        caller = self
-        while caller:
-            # Iterate through handlers associated with the current logger
-            for handler in caller._handlers:
-                # Increment callers_found for each handler found
-                callers_found += 1
-                # Check if the log record level is equal to or higher than the handler level
-                if record.level_number >= handler.level:
-                    # Call the handler's handle method with the log record
-                    handler.handle(record, ignore_display)
-
-            # Check if propagation should stop
-            if not caller._propagate:
-                caller = None
-            else:
-                # Move to the parent logger
-                caller = caller.parent
+        level_number = record.level_number
+        for handler, handler_level in handler_chain:
+            # Check if the log record level is equal to or higher than the handler level
+            if level_number >= handler_level:
+                # Call the handler's handle method with the log record
+                handler.handle(record, ignore_display)
 
         # If no handlers were found in the traversal
-        if callers_found == 0:
-            # Create a default stderr handler
-            stderr_handler = StderrHandler(LogLevel.WARNING)
-            # Check if the log record level is equal to or higher than the stderr handler level
-            if stderr_handler and record.level_number >= stderr_handler.level:
-                # Call the stderr handler's handle method with the log record
-                stderr_handler.handle(record, ignore_display)
+        if not handler_chain:
+            global _last_resort_warned
+            if not _last_resort_warned:
+                _last_resort_warned = True
+                warnings.warn(f'No handlers could be found for logger "{self.name}".', RuntimeWarning, stacklevel=2)
+
+            # Fall back to the shared last resort handler, unless it has been disabled
+            last_resort = get_last_resort()
+            if last_resort and level_number >= last_resort.level:
+                # Call the last resort handler's handle method with the log record
+                last_resort.handle(record, ignore_display)
 
     def critical(
             self,
@@ -1281,7 +1519,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message with CRITICAL level.
@@ -1296,10 +1535,12 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if self.is_enabled_for(LogLevel.CRITICAL):
-            self._log(LogLevel.CRITICAL, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(LogLevel.CRITICAL, message, ignore_display, exec_info, stack_info, stack_level, args)
 
     def debug(
             self,
@@ -1307,7 +1548,8 @@ class Logger:
             ignore_display: bool = True,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message with DEBUG level.
@@ -1322,10 +1564,12 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if self.is_enabled_for(LogLevel.DEBUG):
-            self._log(LogLevel.DEBUG, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(LogLevel.DEBUG, message, ignore_display, exec_info, stack_info, stack_level, args)
 
     def error(
             self,
@@ -1333,7 +1577,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message with ERROR level.
@@ -1348,10 +1593,12 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if self.is_enabled_for(LogLevel.ERROR):
-            self._log(LogLevel.ERROR, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(LogLevel.ERROR, message, ignore_display, exec_info, stack_info, stack_level, args)
 
     def find_caller(self, stack_info: bool = False, stack_level: int = 1) -> Tuple[CallerFrame, str]:
         """
@@ -1451,15 +1698,7 @@ class Logger:
         :return: True if the logger or any ancestor has handlers, False otherwise.
         :rtype: bool
         """
-        caller = self
-        while caller:
-            if caller._handlers:
-                return True
-            if not caller._propagate:
-                break
-            else:
-                caller = caller.parent
-        return False
+        return bool(self._get_handler_chain())
 
     def info(
             self,
@@ -1467,7 +1706,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message with INFO level.
@@ -1482,10 +1722,12 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if self.is_enabled_for(LogLevel.INFO):
-            self._log(LogLevel.INFO, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(LogLevel.INFO, message, ignore_display, exec_info, stack_info, stack_level, args)
 
     def is_enabled_for(self, level: int) -> bool:
         """
@@ -1503,23 +1745,32 @@ class Logger:
             # Logging is disabled
             return False
 
-        try:
-            # Check the cache for the level's enabled status
-            return self._cache[level]
-        except KeyError:
-            # Level not found in cache, calculate and cache the result
-            self._acquire_lock()
+        # Check the cache for the level's enabled status, valid while the configuration is unchanged
+        if self._cache_generation == Logger._generation:
             try:
-                # Check if the manager's disable level is greater than or equal to the specified level
-                if self.manager.disable >= level:
-                    is_enabled = self._cache[level] = False  # Logging is disabled for this level
-                else:
-                    # Check if the effective level is greater than or equal to the specified level
-                    is_enabled = self._cache[level] = (level >= self.get_effective_level())
-            finally:
-                self._release_lock()  # Release the lock
+                return self._cache[level]
+            except KeyError:
+                pass
+
+        # Level not found in cache, calculate and cache the result
+        self._acquire_lock()
+        try:
+            generation = Logger._generation
+            if self._cache_generation != generation:
+                # Discard the decisions made under an older configuration
+                self._cache = {}
+                self._cache_generation = generation
+
+            # Check if the manager's disable level is greater than or equal to the specified level
+            if self.manager.disable >= level:
+                is_enabled = self._cache[level] = False  # Logging is disabled for this level
+            else:
+                # Check if the effective level is greater than or equal to the specified level
+                is_enabled = self._cache[level] = (level >= self.get_effective_level())
+        finally:
+            self._release_lock()  # Release the lock
 
-            return is_enabled
+        return is_enabled
 
     def log(
             self,
@@ -1528,7 +1779,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message at the specified level.
@@ -1545,11 +1797,13 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         :raises TypeError: If the specified log level is not an integer.
         """
         if self.is_enabled_for(level):
-            self._log(level, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(level, message, ignore_display, exec_info, stack_info, stack_level, args)
 
     @staticmethod
     def make_record(
@@ -1558,7 +1812,8 @@ class Logger:
             message: str,
             caller_frame: Optional[CallerFrame] = None,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
-            stack_info: Optional[str] = None
+            stack_info: Optional[str] = None,
+            args: tuple | dict = None
     ) -> Record:
         """
         Creates a Record object with specified attributes.
@@ -1569,6 +1824,7 @@ class Logger:
         :param caller_frame: Caller frame details.
         :param exec_info: Execution information.
         :param stack_info: Stack information.
+        :param args: Arguments interpolated into the message.
         :return: Record object.
         """
         return Record(
@@ -1577,7 +1833,8 @@ class Logger:
             level_number=level,
             caller_frame=caller_frame,
             exec_info=exec_info,
-            stack_info=stack_info
+            stack_info=stack_info,
+            args=args
         )
 
     def remove_handler(self, handler: Handler) -> None:
@@ -1594,6 +1851,7 @@ class Logger:
         try:
             if handler in self._handlers:
                 self._handlers.remove(handler)
+                Logger._invalidate_caches()
         finally:
             self._release_lock()
 
@@ -1603,7 +1861,8 @@ class Logger:
             ignore_display: bool = False,
             exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
             stack_info: bool = False,
-            stack_level: int = 1
+            stack_level: int = 1,
+            args: tuple | dict = None
     ) -> None:
         """
         Logs a message with WARNING level.
@@ -1618,10 +1877,12 @@ class Logger:
         :type stack_info: bool, optional
         :param stack_level: The level of stack information to include.
         :type stack_level: int, optional
+        :param args: Arguments interpolated into the message, only when a handler formats the record.
+        :type args: tuple | dict, optional
         :return: None
         """
         if self.is_enabled_for(LogLevel.WARNING):
-            self._log(LogLevel.WARNING, message, ignore_display, exec_info, stack_info, stack_level)
+            self._log(LogLevel.WARNING, message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 class Manager:
@@ -1644,7 +1905,8 @@ class Manager:
         self._logger_dict = {}
         self._logger_class = None
         self._record_factory = None
-        self._lock_name = None
+        self._lock_name = Lock.generate_name()
+        self._lock = Lock.create(self._lock_name, threading.RLock())
 
     @property
     def disable(self) -> int:
@@ -1668,6 +1930,7 @@ class Manager:
             raise TypeError('disable should be an integer.')
 
         self._disable = value
+        Logger._invalidate_caches()
 
     @property
     def lock_name(self) -> str:
@@ -1691,6 +1954,7 @@ class Manager:
             raise TypeError('lock_name should be a string.')
 
         self._lock_name = value
+        self._create_lock()
 
     @property
     def logger_class(self) -> Logger:
@@ -1786,19 +2050,17 @@ class Manager:
 
     def _acquire_lock(self) -> None:
         """
-        Private method to acquire a lock for thread safety.
+        Private method to acquire the manager's lock for thread safety.
         :return: None
         """
-        self._lock_name = Lock.generate_name()
-        self._create_lock()
-        Lock.acquire(self._lock_name)
+        self._lock.acquire()
 
     def _create_lock(self) -> None:
         """
-        Private method to create a lock.
+        Private method to register the manager's lock under the current lock name.
         :return: None
         """
-        Lock.create(self._lock_name)
+        self._lock = Lock.create(self._lock_name, self._lock)
 
     def _fix_up_children(self, registry: 'Registry', logger: Logger) -> None:
         """
@@ -1885,27 +2147,16 @@ class Manager:
         Private method to release the lock acquired for thread safety.
         :return: None
         """
-        Lock.release(self._lock_name)
+        self._lock.release()
 
     def clear_cache(self) -> None:
         """
         Clear the cache for all loggers and the root logger.
-        This method acquires a lock for thread safety while clearing the cache.
+        Renewing the configuration generation discards every logger's cached level decisions on
+        their next use, without walking the loggers.
         :return: None
         """
-        # Acquire a lock for thread safety
-        self._acquire_lock()
-        try:
-            # Clear the cache for all loggers in the logger dictionary
-            for logger in self.logger_dict.values():
-                if isinstance(logger, Logger):
-                    logger.cache.clear()
-
-            # Clear the cache for the root logger
-            self.root.cache.clear()
-        finally:
-            # Release the lock after clearing the cache
-            self._release_lock()
+        Logger._invalidate_caches()
 
     def get_logger(self, name: str) -> Logger:
         """
@@ -2058,30 +2309,40 @@ _logger_class.root = _root_logger
 # Create a manager instance with the root logger
 _logger_class.manager = Manager(_logger_class.root)
 
-# Default lock name (empty string)
-_lock_name = ''
+# Module level lock name and the lock guarding configuration changes
+_lock_name = Lock.generate_name()
+_lock = Lock.create(_lock_name, threading.RLock())
+
+# Handler used for records of loggers without any handler, shared by all loggers. The default
+# StderrHandler is created on first use, as handlers cannot be created while the package is imported.
+_last_resort = None
+_last_resort_default = True
+
+# Whether the warning about loggers without handlers has been emitted
+_last_resort_warned = False
+
+# Identifier of the current process stamped on records, refreshed in child processes after a fork
+_process_id = os.getpid()
 
 
 def _acquire_lock() -> None:
     """
-    Private method to acquire a lock for thread safety.
+    Private method to acquire the module level lock for thread safety.
 
     :return: None
     """
-    global _lock_name
-
-    _lock_name = Lock.generate_name()
-    _create_lock()
-    Lock.acquire(_lock_name)
+    _lock.acquire()
 
 
 def _create_lock() -> None:
     """
-    Private method to create a lock.
+    Private method to create the module level lock.
 
     :return: None
     """
-    Lock.create(_lock_name)
+    global _lock
+
+    _lock = Lock.create(_lock_name, threading.RLock())
 
 
 def _release_lock() -> None:
@@ -2090,7 +2351,52 @@ def _release_lock() -> None:
 
     :return: None
     """
-    Lock.release(_lock_name)
+    _lock.release()
+
+
+def _before_fork() -> None:
+    """
+    Private method preparing the package for a fork of the process. Flushes the open file streams of
+    the handlers, so the output buffered before the fork is written ahead of the output of the child,
+    and holds the module level lock, so the child does not inherit a configuration change halfway
+    through.
+
+    :return: None
+    """
+    _before_fork_handlers()
+    _acquire_lock()
+
+
+def _after_fork_in_parent() -> None:
+    """
+    Private method releasing the module level lock held for a fork in the parent process.
+
+    :return: None
+    """
+    _release_lock()
+
+
+def _after_fork_in_child() -> None:
+    """
+    Private method resetting the state a child process inherits from its parent after a fork.
+    Reinitializes every lock, as a lock held by another thread of the parent would never be released
+    in the child, caches the process ID of the child and lets the handlers detach shared file streams
+    and restart their background threads.
+
+    :return: None
+    """
+    global _process_id
+
+    _process_id = os.getpid()
+    for lock in list(Lock._locks.values()):
+        lock._at_fork_reinit()
+    _after_fork_in_child_handlers()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(
+        before=_before_fork, after_in_parent=_after_fork_in_parent, after_in_child=_after_fork_in_child
+    )
 
 
 def _configure_handler(handler: Handler = None, formatter: Formatter = None) -> None:
@@ -2331,12 +2637,54 @@ def get_logger(name: str = None) -> Logger:
         return _logger_class.manager.get_logger(name)
 
 
+def get_last_resort() -> Handler | None:
+    """
+    Get the handler used for records of loggers without any handler.
+
+    :return: The last resort handler, or None if it is disabled.
+    :rtype: Handler | None
+    """
+    global _last_resort
+
+    if _last_resort is None and _last_resort_default:
+        _acquire_lock()
+        try:
+            if _last_resort is None and _last_resort_default:
+                _last_resort = StderrHandler(LogLevel.WARNING)
+        finally:
+            _release_lock()
+
+    return _last_resort
+
+
+def set_last_resort(handler: Handler | None) -> None:
+    """
+    Set the handler used for records of loggers without any handler.
+
+    :param handler: The new last resort handler, or None to drop such records.
+    :type handler: Handler | None
+    """
+    global _last_resort, _last_resort_default
+
+    if not isinstance(handler, (Handler, NoneType)):
+        raise TypeError('handler should be a subclass of Handler.')
+
+    _acquire_lock()
+    try:
+        _last_resort = handler
+        _last_resort_default = False
+        Logger._invalidate_caches()
+    finally:
+        _release_lock()
+
+
 def critical(
         message: str,
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log a critical message.
@@ -2351,10 +2699,12 @@ def critical(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.critical(message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.critical(message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def debug(
@@ -2362,7 +2712,8 @@ def debug(
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log a debug message.
@@ -2377,10 +2728,12 @@ def debug(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.debug(message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.debug(message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def error(
@@ -2388,7 +2741,8 @@ def error(
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log an error message.
@@ -2403,10 +2757,12 @@ def error(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.error(message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.error(message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def info(
@@ -2414,7 +2770,8 @@ def info(
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log an informational message.
@@ -2429,10 +2786,12 @@ def info(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.info(message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.info(message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def warning(
@@ -2440,7 +2799,8 @@ def warning(
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log a warning message.
@@ -2455,10 +2815,12 @@ def warning(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.warning(message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.warning(message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def log(
@@ -2467,7 +2829,8 @@ def log(
         ignore_display: bool = False,
         exec_info: Optional[Tuple[Type, BaseException, Optional[TracebackType]]] = None,
         stack_info: bool = False,
-        stack_level: int = 1
+        stack_level: int = 1,
+        args: tuple | dict = None
 ) -> None:
     """
     Log a message with the specified log level.
@@ -2484,10 +2847,12 @@ def log(
     :type stack_info: bool, optional
     :param stack_level: Level in the stack trace to show, defaults to 1.
     :type stack_level: int, optional
+    :param args: Arguments interpolated into the message, only when a handler formats the record, defaults to None.
+    :type args: tuple | dict, optional
     """
     if len(_root_logger.handlers) == 0:
         load_config()
-    _root_logger.log(level, message, ignore_display, exec_info, stack_info, stack_level)
+    _root_logger.log(level, message, ignore_display, exec_info, stack_info, stack_level, args)
 
 
 def disable(level: int = LogLevel.CRITICAL) -> None:
@@ -2501,7 +2866,6 @@ def disable(level: int = LogLevel.CRITICAL) -> None:
         raise TypeError('level should be an integer.')
 
     _root_logger.manager.disable = level
-    _root_logger.manager.clear_cache()
 
 
 def shutdown() -> None:
@@ -2525,3 +2889,17 @@ def shutdown() -> None:
         except BaseException:
             # Handle specific exceptions here if necessary
             pass
+
+
+async def shutdown_async() -> None:
+    """
+    Shutdown all handlers from a coroutine without blocking the event loop.
+
+    This function first awaits the records still pending in asynchronous handlers, then flushes and closes all
+    handlers in reverse order on the default executor of the running loop.
+    """
+    for handler in reversed(Handler.get_handlers()):
+        if isinstance(handler, AsyncHandler):
+            await handler.drain()
+
+    await asyncio.get_running_loop().run_in_executor(None, shutdown)
@@ -0,0 +1,109 @@
+"""
+Renders binary log files, as written by a BinaryFileHandler, back into text through one of the text formatters.
+Records are decoded and written one at a time, so files of any size are rendered with constant memory. Files
+compressed by a Compressor are decompressed on the fly.
+
+Usage: python -m pyloggermanager.decode [--formatter {csv,default,json}] [--format FORMAT]
+       [--date-format DATE_FORMAT] [--time-precision {0,3,6}] [file ...]
+"""
+import argparse
+import bz2
+import gzip
+import json
+import lzma
+import os
+import sys
+from typing import BinaryIO, TextIO
+
+from pyloggermanager.formatters import DATE_FORMAT, BinaryFormatter, CSVFormatter, DefaultFormatter, Formatter, \
+    JSONFormatter
+
+# Text formatters selectable from the command line
+_FORMATTERS = {
+    'csv': CSVFormatter,
+    'default': DefaultFormatter,
+    'json': JSONFormatter
+}
+
+# Functions opening compressed files for reading, keyed by the extensions added by a Compressor
+_OPENERS = {
+    '.bz2': bz2.open,
+    '.gz': gzip.open,
+    '.xz': lzma.open
+}
+
+
+def decode(stream: BinaryIO, formatter: Formatter, output: TextIO) -> int:
+    """
+    Renders the binary records of a stream into text, one line per record.
+
+    :param stream: Binary stream holding one or more segments.
+    :type stream: BinaryIO
+    :param formatter: Text formatter rendering the records.
+    :type formatter: Formatter
+    :param output: Text stream the rendered records are written to.
+    :type output: TextIO
+    :return: Number of records rendered.
+    :rtype: int
+    """
+    if not isinstance(formatter, Formatter) or isinstance(formatter, BinaryFormatter):
+        raise TypeError('formatter should be a text Formatter.')
+
+    count = 0
+    for record in BinaryFormatter.decode(stream):
+        output.write(formatter.format(record) + '\n')
+        count += 1
+    return count
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs the decoder with the given command line arguments.
+
+    :param argv: Command line arguments. Defaults to the arguments of the process.
+    :type argv: list
+    :return: Exit status.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m pyloggermanager.decode',
+        description='Renders binary log files back into text.'
+    )
+    parser.add_argument('files', nargs='*', help="binary log files, '-' or none for the standard input")
+    parser.add_argument('--formatter', choices=sorted(_FORMATTERS), default='default', help='text formatter')
+    parser.add_argument('--format', help='format string of the formatter, a JSON object for the json formatter')
+    parser.add_argument('--date-format', default=DATE_FORMAT, help='date format of the formatter')
+    parser.add_argument('--time-precision', type=int, choices=(0, 3, 6), default=0,
+                        help='number of fractional second digits of the formatted time')
+    args = parser.parse_args(argv)
+
+    options = {'date_format': args.date_format, 'time_precision': args.time_precision}
+    try:
+        if args.format is not None:
+            options['format_str'] = json.loads(args.format) if args.formatter == 'json' else args.format
+        formatter = _FORMATTERS[args.formatter](**options)
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+
+    try:
+        for file_name in args.files or ['-']:
+            if file_name == '-':
+                decode(sys.stdin.buffer, formatter, sys.stdout)
+                continue
+
+            with _OPENERS.get(os.path.splitext(file_name)[1], open)(file_name, 'rb') as stream:
+                decode(stream, formatter, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. 'head'), silence the error raised again when stdout is flushed at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as error:
+        print(f'{parser.prog}: {error}', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
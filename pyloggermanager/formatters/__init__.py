@@ -4,6 +4,7 @@ __all__ = [
     "JSON_FORMAT",
     "DATE_FORMAT",
     "Formatter",
+    "BinaryFormatter",
     "DefaultFormatter",
     "CSVFormatter",
     "JSONFormatter"
@@ -25,4 +26,4 @@ preferences.
 """
 
 from pyloggermanager.formatters.__main__ import DEFAULT_FORMAT, CSV_FORMAT, JSON_FORMAT, DATE_FORMAT, Formatter, \
-    DefaultFormatter, CSVFormatter, JSONFormatter
+    DefaultFormatter, CSVFormatter, JSONFormatter, BinaryFormatter
@@ -1,9 +1,12 @@
 import io
 import json
+import re
+import struct
 import time
 import traceback
+from datetime import datetime, timedelta
 from types import TracebackType
-from typing import Optional, Tuple, Type, Union
+from typing import BinaryIO, Iterator, Optional, Tuple, Type, Union
 
 # The default format string used for log message formatting
 DEFAULT_FORMAT = '%(time)s :: %(level_name)s :: %(message)s'
@@ -19,6 +22,59 @@ JSON_FORMAT = {
 # The default date format string used for log message formatting
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Supported numbers of fractional second digits appended to the formatted time
+_TIME_PRECISIONS = (0, 3, 6)
+
+# Tokens that can be used in format strings, in the order they are extracted from a record
+_LOG_TOKENS = (
+    '%(time)s',
+    '%(message)s',
+    '%(logger_name)s',
+    '%(level_name)s',
+    '%(level_number)d',
+    '%(file_name)s',
+    '%(class_name)s',
+    '%(function_name)s',
+    '%(module_name)s',
+    '%(path_name)s',
+    '%(exec_info)s',
+    '%(stack_info)s',
+    '%(thread)d',
+    '%(thread_name)s',
+    '%(process_id)d'
+)
+
+# Tokens whose values are resolved by walking the caller's frames
+_CALLER_TOKENS = (
+    '%(file_name)s',
+    '%(class_name)s',
+    '%(function_name)s',
+    '%(module_name)s',
+    '%(path_name)s'
+)
+
+# Pattern splitting a format string into literal text and tokens (tokens are kept by the capturing group)
+_TOKEN_PATTERN = re.compile('(' + '|'.join(re.escape(token) for token in _LOG_TOKENS) + ')')
+
+# Functions computing the value of each token from a formatter, a record and a date format
+_TOKEN_GETTERS = {
+    '%(time)s': lambda formatter, record, date_format: formatter._format_record_time(record.time, date_format),
+    '%(message)s': lambda formatter, record, date_format: record.message,
+    '%(logger_name)s': lambda formatter, record, date_format: record.logger_name,
+    '%(level_name)s': lambda formatter, record, date_format: record.level_name,
+    '%(level_number)d': lambda formatter, record, date_format: record.level_number,
+    '%(file_name)s': lambda formatter, record, date_format: record.file_name,
+    '%(class_name)s': lambda formatter, record, date_format: record.class_name,
+    '%(function_name)s': lambda formatter, record, date_format: record.function_name,
+    '%(module_name)s': lambda formatter, record, date_format: record.module_name,
+    '%(path_name)s': lambda formatter, record, date_format: record.path_name,
+    '%(exec_info)s': lambda formatter, record, date_format: formatter.format_exception(record.exec_info),
+    '%(stack_info)s': lambda formatter, record, date_format: record.stack_info,
+    '%(thread)d': lambda formatter, record, date_format: record.thread,
+    '%(thread_name)s': lambda formatter, record, date_format: record.thread_name,
+    '%(process_id)d': lambda formatter, record, date_format: record.process_id
+}
+
 
 class Formatter:
     """
@@ -26,7 +82,12 @@ class Formatter:
     Subclasses must implement the 'format' method to customize log message formatting.
     """
 
-    def __init__(self, format_str: str | dict = DEFAULT_FORMAT, date_format: str = DATE_FORMAT) -> None:
+    def __init__(
+            self,
+            format_str: str | dict = DEFAULT_FORMAT,
+            date_format: str = DATE_FORMAT,
+            time_precision: int = 0
+    ) -> None:
         """
         Initialize the Formatter object
 
@@ -34,14 +95,18 @@ class Formatter:
         :type format_str: str | dict
         :param date_format: The format string used for date and time formatting.
         :type date_format: str
+        :param time_precision: Number of fractional second digits (0, 3 or 6) appended to the formatted time.
+        :type time_precision: int
         """
         if not isinstance(format_str, Union[str, dict]):
             raise TypeError('format_str should be either a string or dict.')
         elif not isinstance(date_format, str):
             raise TypeError('date_format should be a string.')
 
-        self._format_str = format_str
         self._date_format = date_format
+        self._time_cache = (None, None, '')
+        self.time_precision = time_precision
+        self._compiled = self._compile(format_str)
 
     @property
     def date_format(self) -> str:
@@ -75,7 +140,7 @@ class Formatter:
         :return: The dict format.
         :rtype: dict
         """
-        return self._format_str
+        return self._compiled[0]
 
     @format_str.setter
     def format_str(self, value: str | dict) -> None:
@@ -89,7 +154,86 @@ class Formatter:
         if not isinstance(value, Union[str, dict]):
             raise TypeError('format_str should be either a string or dict.')
 
-        self._format_str = value
+        self._compiled = self._compile(value)
+
+        # Loggers cache whether the formatters of their handlers need caller details
+        import pyloggermanager
+        pyloggermanager.Logger._invalidate_caches()
+
+    @property
+    def time_precision(self) -> int:
+        """
+        Getter property for the number of fractional second digits appended to the formatted time.
+
+        :return: The number of fractional second digits.
+        :rtype: int
+        """
+        return self._time_precision
+
+    @time_precision.setter
+    def time_precision(self, value: int) -> None:
+        """
+        Setter property for the number of fractional second digits appended to the formatted time.
+
+        :param value: 0 for none, 3 for milliseconds or 6 for microseconds.
+        :type value: int
+        :return: None
+        """
+        if not isinstance(value, int):
+            raise TypeError('time_precision should be an integer.')
+        elif value not in _TIME_PRECISIONS:
+            raise ValueError(f'time_precision should be one of {_TIME_PRECISIONS}.')
+
+        self._time_precision = value
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Getter property indicating whether formatting a record uses its caller details (file, class,
+        function, module or path name). Formatters overriding 'format' are assumed to need them.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        if type(self).format not in _TOKEN_FORMAT_METHODS:
+            return True
+        return any(token in _CALLER_TOKENS for token in self._compiled[1])
+
+    @property
+    def tokens(self) -> tuple:
+        """
+        Getter property for the tokens used by the format string, computed whenever the format string is set.
+        Only these record attributes are extracted when formatting a record.
+
+        :return: The tokens present in the format string.
+        :rtype: tuple
+        """
+        return self._compiled[1]
+
+    def _compile(self, format_str: str | dict) -> tuple:
+        """
+        Prepares the formatter for a format string. Called once at construction and whenever the
+        format string is assigned, so subclasses can parse it ahead of formatting. The returned
+        state is published as a single attribute, so a record formatted concurrently never mixes
+        the state of two format strings.
+
+        :param format_str: The format string (or dict for JSON) to prepare.
+        :type format_str: str | dict
+        :return: The format string followed by its tokens, extended by subclasses.
+        :rtype: tuple
+        """
+        found = set()
+        values = [format_str]
+        while values:
+            value = values.pop()
+            if isinstance(value, str):
+                found.update(_TOKEN_PATTERN.findall(value))
+            elif isinstance(value, dict):
+                values.extend(value.values())
+            elif isinstance(value, list):
+                values.extend(value)
+
+        return format_str, tuple(token for token in _LOG_TOKENS if token in found)
 
     def format(self, record) -> str:
         """
@@ -121,6 +265,30 @@ class Formatter:
 
         return time.strftime(date_format, value)
 
+    def _format_record_time(self, value: datetime, date_format: str) -> str:
+        """
+        Formats the time of a record, reusing the formatted string of the previous record when
+        both fall in the same second, so strftime runs at most once per second per date format.
+        The fractional second suffix, if enabled, is appended to the cached string.
+
+        :param value: The time of the record.
+        :type value: datetime
+        :param date_format: The date time format
+        :type date_format: str
+        :return: The formatted time string.
+        :rtype: str
+        """
+        second = value.replace(microsecond=0)
+        cache = self._time_cache
+        if cache[0] != second or cache[1] != date_format:
+            cache = self._time_cache = (second, date_format, self.format_time(value.timetuple(), date_format))
+
+        if self._time_precision == 3:
+            return f'{cache[2]}.{value.microsecond // 1000:03d}'
+        elif self._time_precision == 6:
+            return f'{cache[2]}.{value.microsecond:06d}'
+        return cache[2]
+
     @staticmethod
     def format_exception(
             exec_info: Optional[Tuple[Type[BaseException], BaseException, Optional[TracebackType]]] = None
@@ -152,12 +320,18 @@ class Formatter:
         else:
             return ''
 
-    def _log_attributes(self, record, date_format: str) -> dict:
+    def _log_attributes(self, record, date_format: str, tokens: tuple = None) -> dict:
         """
         Extracts and organizes various attributes of a 'Record' object into a dictionary format.
+        Only the requested tokens are computed, so unused attributes such as the formatted time
+        or exception are never rendered.
 
         :param record: The log record object containing log information.
         :type record: Record
+        :param date_format: The date time format
+        :type date_format: str
+        :param tokens: Tokens to extract. Defaults to None, which extracts every supported token.
+        :type tokens: tuple
         :return: Dictionary format of log attributes.
         :rtype: dict
         """
@@ -168,23 +342,10 @@ class Formatter:
         elif not isinstance(date_format, str):
             raise TypeError('date_format should be a string.')
 
-        return {
-            '%(time)s': self.format_time(record.time.timetuple(), date_format),
-            '%(message)s': record.message,
-            '%(logger_name)s': record.logger_name,
-            '%(level_name)s': record.level_name,
-            '%(level_number)d': record.level_number,
-            '%(file_name)s': record.file_name,
-            '%(class_name)s': record.class_name,
-            '%(function_name)s': record.function_name,
-            '%(module_name)s': record.module_name,
-            '%(path_name)s': record.path_name,
-            '%(exec_info)s': self.format_exception(record.exec_info),
-            '%(stack_info)s': record.stack_info,
-            '%(thread)d': record.thread,
-            '%(thread_name)s': record.thread_name,
-            '%(process_id)d': record.process_id
-        }
+        if tokens is None:
+            tokens = _LOG_TOKENS
+
+        return {token: _TOKEN_GETTERS[token](self, record, date_format) for token in tokens}
 
 
 class DefaultFormatter(Formatter):
@@ -194,17 +355,37 @@ class DefaultFormatter(Formatter):
     Replaces tokens in the format string with corresponding values from the log record.
     """
 
-    def __init__(self, format_str: str = DEFAULT_FORMAT, date_format: str = DATE_FORMAT) -> None:
+    def __init__(
+            self,
+            format_str: str = DEFAULT_FORMAT,
+            date_format: str = DATE_FORMAT,
+            time_precision: int = 0
+    ) -> None:
         """
         Initializes a 'DefaultFormatter' instance with the specified format string.
 
         :param format_str: Format string for log record formatting. Defaults to 'DEFAULT_FORMAT'.
         :type format_str: str
+        :param time_precision: Number of fractional second digits (0, 3 or 6) appended to the formatted time.
+        :type time_precision: int
         """
         if not isinstance(format_str, str):
             raise TypeError('format_str should be a string.')
 
-        super().__init__(format_str, date_format)
+        super().__init__(format_str, date_format, time_precision)
+
+    def _compile(self, format_str: str) -> tuple:
+        """
+        Parses the format string into a template of literal parts and tokens, so formatting a
+        record only substitutes the tokens actually present in the format string.
+
+        :param format_str: The format string to prepare.
+        :type format_str: str
+        :return: The format string, its tokens and its template.
+        :rtype: tuple
+        """
+        template = tuple((part, part in _LOG_TOKENS) for part in _TOKEN_PATTERN.split(format_str) if part)
+        return super()._compile(format_str) + (template,)
 
     def format(self, record) -> str:
         """
@@ -221,14 +402,11 @@ class DefaultFormatter(Formatter):
             raise TypeError('record should be of Record type.')
 
         # Extracts log attributes in dictionary format
-        log_attributes = super()._log_attributes(record, self.date_format)
+        _, tokens, template = self._compiled
+        log_attributes = super()._log_attributes(record, self.date_format, tokens)
 
-        # Replaces tokens in the format string with corresponding log record values
-        formatted_message = self.format_str
-        for token, value in log_attributes.items():
-            formatted_message = formatted_message.replace(token, str(value))
-
-        return formatted_message
+        # Substitutes the tokens of the compiled template with corresponding log record values
+        return ''.join([str(log_attributes[part]) if is_token else part for part, is_token in template])
 
 
 class CSVFormatter(Formatter):
@@ -237,18 +415,20 @@ class CSVFormatter(Formatter):
     Allows customization of the format string used for formatting log records.
     """
 
-    def __init__(self, format_str: str = CSV_FORMAT, date_format: str = DATE_FORMAT) -> None:
+    def __init__(self, format_str: str = CSV_FORMAT, date_format: str = DATE_FORMAT, time_precision: int = 0) -> None:
         """
         Initializes a 'CSVFormatter' object with the specified format string.
 
         :param format_str: Format string defining the CSV format. Defaults to 'CSV_FORMAT'.
         :type format_str: str
+        :param time_precision: Number of fractional second digits (0, 3 or 6) appended to the formatted time.
+        :type time_precision: int
         """
         if not isinstance(format_str, str):
             raise TypeError('format_str should be a string.')
 
         self._validate_format_str(format_str)
-        super().__init__(format_str, date_format)
+        super().__init__(format_str, date_format, time_precision)
 
     def _validate_format_str(self, format_str: str) -> None:
         """
@@ -287,10 +467,11 @@ class CSVFormatter(Formatter):
         if not isinstance(record, pyloggermanager.Record):
             raise TypeError('record should be of Record type.')
 
-        log_attributes = super()._log_attributes(record, self.date_format)
+        format_str, tokens = self._compiled
+        log_attributes = super()._log_attributes(record, self.date_format, tokens)
         formatted_values = []
 
-        for token in self.format_str.split(','):
+        for token in format_str.split(','):
             if token in log_attributes:
                 formatted_values.append(str(log_attributes[token]))
             else:
@@ -306,12 +487,14 @@ class JSONFormatter(Formatter):
     format log records into JSON strings, and handle JSON decoding errors.
     """
 
-    def __init__(self, format_str: dict = None, date_format: str = DATE_FORMAT) -> None:
+    def __init__(self, format_str: dict = None, date_format: str = DATE_FORMAT, time_precision: int = 0) -> None:
         """
         Initializes the JSONFormatter object with a custom format string.
 
         :param format_str: Custom dict format for JSON formatting. Defaults to 'JSON_FORMAT'.
         :type format_str: str
+        :param time_precision: Number of fractional second digits (0, 3 or 6) appended to the formatted time.
+        :type time_precision: int
         """
         if format_str is None:
             format_str = JSON_FORMAT
@@ -320,7 +503,7 @@ class JSONFormatter(Formatter):
             raise TypeError('format_str should be a dict.')
 
         self._validate_format_str(format_str)
-        super().__init__(format_str, date_format)
+        super().__init__(format_str, date_format, time_precision)
 
     @staticmethod
     def _validate_format_str(format_str: dict) -> None:
@@ -350,8 +533,8 @@ class JSONFormatter(Formatter):
         if not isinstance(record, pyloggermanager.Record):
             raise TypeError('record should be of Record type.')
 
-        log_attributes = super()._log_attributes(record, self.date_format)
-        format_dict = self.format_str  # No need to convert format_str to JSON; it's already a dictionary
+        format_dict, tokens = self._compiled  # No need to convert format_str to JSON; it's already a dictionary
+        log_attributes = super()._log_attributes(record, self.date_format, tokens)
 
         formatted_values = {}
         for key, value in format_dict.items():
@@ -370,3 +553,296 @@ class JSONFormatter(Formatter):
                 formatted_values[key] = str(log_attributes.get(value, value))
 
         return json.dumps(formatted_values, indent=4)
+
+
+class BinaryFormatter(Formatter):
+    """
+    Subclass of the 'Formatter' class encoding log records into a compact binary form instead of text.
+    Records are grouped in segments: a segment starts with 'MAGIC' and writes each logger, level, caller
+    and thread name only once, the first time it is used, so records then refer to them by index. The
+    binary records are rendered back into text by decoding them and passing them to any text formatter.
+    """
+
+    # Magic bytes starting every segment.
+    MAGIC = b'PLMBIN1\n'
+
+    # Tag of an entry adding a string to the string table of the segment.
+    _TAG_STRING = 1
+    # Tag of an entry holding a record.
+    _TAG_RECORD = 2
+
+    # Entry adding a string: tag and length of the encoded string, followed by the string.
+    _STRING = struct.Struct('<BI')
+    # Entry holding a record: tag, time elapsed since the epoch (days, seconds and microseconds), level
+    # number, thread ID, process ID, string indexes of the logger, level, thread, file, class, function,
+    # module and path names and of the exception type, and lengths of the message, stack information and
+    # exception message, followed by the message, stack information and exception message. Missing caller
+    # details, exception and stack information are encoded as -1.
+    _RECORD = struct.Struct('<BiIIiQI9iIii')
+
+    # Start of the record times.
+    _EPOCH = datetime(1970, 1, 1)
+
+    # Error handler used to encode and decode strings, so every string survives a round trip.
+    _ERRORS = 'surrogatepass'
+
+    def __init__(self, caller_details: bool = True) -> None:
+        """
+        Initializes a 'BinaryFormatter' object.
+
+        :param caller_details: Encode the caller details (file, class, function, module and path names) of
+            the records. Without them, loggers do not walk the caller's frames. Defaults to True.
+        :type caller_details: bool
+        """
+        if not isinstance(caller_details, bool):
+            raise TypeError('caller_details should be a boolean.')
+
+        self._caller_details = caller_details
+        super().__init__('')
+
+    @property
+    def caller_details(self) -> bool:
+        """
+        Getter property indicating whether the caller details of the records are encoded.
+
+        :return: True if the caller details are encoded, False otherwise.
+        :rtype: bool
+        """
+        return self._caller_details
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Getter property indicating whether encoding a record uses its caller details.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        return self._caller_details
+
+    def _intern(self, names: tuple, table: dict, entries: list) -> tuple:
+        """
+        Returns the indexes of strings in the string table of a segment, adding the strings used for the
+        first time to the table and their entries to the given entries. Besides the strings, the table
+        maps every tuple of strings looked up to their indexes, so a record with the same names as an
+        earlier record is resolved with a single lookup, and keeps the number of strings under None.
+
+        :param names: Strings to look up.
+        :type names: tuple
+        :param table: String table of the segment.
+        :type table: dict
+        :param entries: Encoded entries the string entries are appended to.
+        :type entries: list
+        :return: Indexes of the strings.
+        :rtype: tuple
+        """
+        indexes = []
+        for name in names:
+            index = table.get(name)
+            if index is None:
+                index = table[name] = table.get(None, 0)
+                table[None] = index + 1
+                data = name.encode('utf-8', self._ERRORS)
+                entries.append(self._STRING.pack(self._TAG_STRING, len(data)))
+                entries.append(data)
+            indexes.append(index)
+
+        indexes = table[names] = tuple(indexes)
+        return indexes
+
+    def encode(self, record, table: dict) -> bytes:
+        """
+        Encodes the given log record as part of a segment. Strings the segment has not used yet are added to
+        its string table and encoded ahead of the record. The traceback of the exception information cannot
+        be encoded, so it is formatted into the stack information, as ProcessQueueHandler does.
+
+        :param record: Log record to encode.
+        :type record: Record
+        :param table: String table of the segment, empty for a new segment. It is updated by the call.
+        :type table: dict
+        :return: Encoded entries.
+        :rtype: bytes
+        """
+        import pyloggermanager
+
+        if not isinstance(record, pyloggermanager.Record):
+            raise TypeError('record should be of Record type.')
+        elif not isinstance(table, dict):
+            raise TypeError('table should be a dict.')
+
+        entries = []
+        if self._caller_details:
+            names = (
+                record.logger_name, record.level_name, record.thread_name, record.file_name, record.class_name,
+                record.function_name, record.module_name, record.path_name
+            )
+        else:
+            names = (record.logger_name, record.level_name, record.thread_name)
+        indexes = table.get(names)
+        if indexes is None:
+            indexes = self._intern(names, table, entries)
+        if not self._caller_details:
+            indexes += (-1, -1, -1, -1, -1)
+
+        message = record.message.encode('utf-8', self._ERRORS)
+        stack_info = record.stack_info
+        exception_type = -1
+        exception = b''
+        exec_info = record.exec_info
+        if exec_info and exec_info[0] is not None:
+            exc_type, exc_value, exc_traceback = exec_info
+            exception_type = self._intern((f'{exc_type.__module__}:{exc_type.__qualname__}',), table, entries)[0]
+            exception = str(exc_value).encode('utf-8', self._ERRORS)
+            if exc_traceback is not None:
+                formatted = ''.join(traceback.format_tb(exc_traceback)).rstrip('\n')
+                stack_info = f'{stack_info}\n{formatted}' if stack_info else formatted
+        stack = b'' if stack_info is None else stack_info.encode('utf-8', self._ERRORS)
+
+        elapsed = record.time - self._EPOCH
+        entries.append(self._RECORD.pack(
+            self._TAG_RECORD, elapsed.days, elapsed.seconds, elapsed.microseconds, record.level_number,
+            record.thread or 0, record.process_id, *indexes, exception_type, len(message),
+            -1 if stack_info is None else len(stack), len(exception)
+        ))
+        entries.append(message)
+        entries.append(stack)
+        entries.append(exception)
+        return b''.join(entries)
+
+    def format(self, record) -> bytes:
+        """
+        Encodes the given log record into a complete segment of its own. Writers encoding many records
+        should start a segment once and encode the records with 'encode', so strings are written once.
+
+        :param record: Log record to encode.
+        :type record: Record
+        :return: Encoded segment.
+        :rtype: bytes
+        """
+        return self.MAGIC + self.encode(record, {})
+
+    @staticmethod
+    def _read(stream: BinaryIO, size: int) -> bytes | None:
+        """
+        Reads exactly the given number of bytes from a binary stream.
+
+        :param stream: Stream to read from.
+        :type stream: BinaryIO
+        :param size: Number of bytes to read.
+        :type size: int
+        :return: Bytes read, or None if the stream ends before.
+        :rtype: bytes | None
+        """
+        data = stream.read(size)
+        while 0 < len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data if len(data) == size else None
+
+    @classmethod
+    def decode(cls, stream: BinaryIO) -> Iterator:
+        """
+        Decodes the log records of a binary stream holding one or more segments, oldest first. Records are
+        read one at a time, so memory use does not grow with the length of the stream. Decoding stops
+        at a record cut short, as left behind by a writer that crashed, and a record referring to a string
+        its segment does not hold raises a ValueError. Exception information is decoded without traceback,
+        as the traceback is part of the stack information.
+
+        :param stream: Binary stream to decode.
+        :type stream: BinaryIO
+        :return: Iterator over the decoded records.
+        :rtype: Iterator[Record]
+        """
+        import pyloggermanager
+
+        if not isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            raise TypeError('stream should be a binary stream.')
+
+        strings = None
+        caller_frames = {}
+        exception_types = {}
+        magic_tail = cls.MAGIC[1:]
+
+        def string(index: int) -> str:
+            if not 0 <= index < len(strings):
+                raise ValueError('stream should only refer to strings of the segment.')
+            return strings[index]
+
+        while True:
+            tag = stream.read(1)
+            if not tag:
+                return
+            elif tag[0] == cls.MAGIC[0]:
+                if cls._read(stream, len(magic_tail)) != magic_tail:
+                    raise ValueError('stream should hold binary records.')
+                strings = []
+                caller_frames.clear()
+                exception_types.clear()
+                continue
+            elif strings is None:
+                raise ValueError('stream should hold binary records.')
+
+            if tag[0] == cls._TAG_STRING:
+                header = cls._read(stream, cls._STRING.size - 1)
+                data = header and cls._read(stream, cls._STRING.unpack(tag + header)[1])
+                if data is None:
+                    return
+                strings.append(data.decode('utf-8', cls._ERRORS))
+                continue
+            elif tag[0] != cls._TAG_RECORD:
+                raise ValueError('stream should hold binary records.')
+
+            header = cls._read(stream, cls._RECORD.size - 1)
+            if header is None:
+                return
+            (_, days, seconds, microseconds, level_number, thread, process_id, logger_name, level_name,
+             thread_name, file_name, class_name, function_name, module_name, path_name, exception_type,
+             message_size, stack_size, exception_size) = cls._RECORD.unpack(tag + header)
+            data = cls._read(stream, message_size + max(stack_size, 0) + exception_size)
+            if data is None:
+                return
+
+            caller = (file_name, class_name, function_name, module_name, path_name)
+            caller_frame = caller_frames.get(caller)
+            if caller_frame is None:
+                caller_frame = caller_frames[caller] = pyloggermanager.CallerFrame()
+                if file_name >= 0:
+                    caller_frame.file_name, caller_frame.class_name, caller_frame.function_name, \
+                        caller_frame.module_name, caller_frame.path_name = (string(index) for index in caller)
+
+            exec_info = None
+            if exception_type >= 0:
+                exc_type = exception_types.get(exception_type)
+                if exc_type is None:
+                    module, _, qualname = string(exception_type).partition(':')
+                    exc_type = exception_types[exception_type] = type(
+                        qualname.rpartition('.')[2], (Exception,), {'__module__': module, '__qualname__': qualname}
+                    )
+                exec_info = (exc_type, exc_type(
+                    data[len(data) - exception_size:].decode('utf-8', cls._ERRORS)
+                ), None)
+
+            record = pyloggermanager.Record.__new__(pyloggermanager.Record)
+            record.__setstate__({
+                '_time': cls._EPOCH + timedelta(days, seconds, microseconds),
+                '_message': data[:message_size].decode('utf-8', cls._ERRORS),
+                '_args': None,
+                '_logger_name': string(logger_name),
+                '_level_number': level_number,
+                '_level_name': string(level_name),
+                '_caller_frame': caller_frame,
+                '_exec_info': exec_info,
+                '_stack_info': None if stack_size < 0 else data[message_size:message_size + stack_size].decode(
+                    'utf-8', cls._ERRORS
+                ),
+                '_thread': thread,
+                '_thread_name': string(thread_name),
+                '_process_id': process_id
+            })
+            yield record
+
+
+# Format methods that only read the record attributes listed in the formatter's tokens
+_TOKEN_FORMAT_METHODS = (DefaultFormatter.format, CSVFormatter.format, JSONFormatter.format)
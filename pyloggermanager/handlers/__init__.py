@@ -1,9 +1,23 @@
 __all__ = [
     "Handler",
+    "AsyncHandler",
+    "BinaryFileHandler",
+    "Compressor",
     "ConsoleHandler",
     "FileHandler",
+    "FlushPolicy",
+    "MemoryHandler",
+    "RotatingFileHandler",
+    "TimedRotatingFileHandler",
+    "OverflowPolicy",
+    "ProcessQueueHandler",
+    "ProcessQueueListener",
+    "QueueHandler",
+    "QueueListener",
+    "RingBufferHandler",
     "StreamHandler",
-    "StderrHandler"
+    "StderrHandler",
+    "TailSamplingHandler"
 ]
 __name__ = "pyloggermanager.handlers"
 __description__ = """
@@ -21,4 +35,7 @@ framework by providing a robust set of handlers for managing log records effecti
 Users can choose and configure handlers based on their specific logging needs and infrastructure requirements.
 """
 
-from pyloggermanager.handlers.__main__ import Handler, ConsoleHandler, FileHandler, StreamHandler, StderrHandler
+from pyloggermanager.handlers.__main__ import Handler, Compressor, ConsoleHandler, FileHandler, FlushPolicy, \
+    StreamHandler, StderrHandler, OverflowPolicy, QueueHandler, QueueListener, AsyncHandler, RotatingFileHandler, \
+    TimedRotatingFileHandler, MemoryHandler, TailSamplingHandler, ProcessQueueHandler, ProcessQueueListener, \
+    RingBufferHandler, BinaryFileHandler
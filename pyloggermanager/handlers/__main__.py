@@ -1,14 +1,46 @@
+import asyncio
+import bz2
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import gzip
 import io
+import itertools
+import lzma
+import mmap
+import multiprocessing
+import multiprocessing.queues
 import os
+import queue
+import re
+import shutil
+import struct
 import sys
+import threading
+import time
+import traceback
+import weakref
 from types import NoneType
-from typing import Any, TextIO, Union
+from typing import Any, Callable, TextIO, Union
 
 import pyloggermanager
-from pyloggermanager.formatters import Formatter, DefaultFormatter
+from pyloggermanager.formatters import BinaryFormatter, Formatter, DefaultFormatter
 from pyloggermanager.streams import Stream, TerminalStream, StdoutStream
 
-_handlersList = []
+# Live handlers keyed by their creation sequence number, so iteration follows creation order.
+# Handlers are weakly referenced and drop out of the registry once they are garbage collected.
+_handlersRegistry = weakref.WeakValueDictionary()
+_handlersSequence = itertools.count()
+
+# Identifier of the sampling context records are logged in, see TailSamplingHandler.context.
+_samplingContext = contextvars.ContextVar('pyloggermanager_sampling_context', default=None)
+_samplingContextSequence = itertools.count(1)
+# Live tail sampling handlers, told to discard their buffers when a sampling context ends.
+_samplingHandlers = weakref.WeakSet()
+# Live compressors, reset in child processes after a fork.
+_compressors = weakref.WeakSet()
 
 
 class Handler:
@@ -54,11 +86,11 @@ class Handler:
         self._level = pyloggermanager.LogLevel.check_level(level)
         self._colorization = colorization
         self._formatter = formatter
-        self._acquire_lock()
-        try:
-            _handlersList.append(self)
-        finally:
-            self._release_lock()
+        self._lock_name = pyloggermanager.Lock.generate_name()
+        self._lock = threading.RLock()
+        self._create_lock()
+        self._registry_key = next(_handlersSequence)
+        _handlersRegistry[self._registry_key] = self
 
     @property
     def colorization(self):
@@ -103,6 +135,20 @@ class Handler:
             raise TypeError('formatter should be subclass of Formatter.')
 
         self._formatter = value
+        # Loggers cache whether their handlers need caller details along with the handler chain
+        pyloggermanager.Logger._invalidate_caches()
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the handler uses the caller details of the records it handles. Handlers
+        reading caller details from records directly, rather than through the formatter, should
+        override this property.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        return self._formatter.needs_caller
 
     @property
     def level(self) -> int:
@@ -124,6 +170,8 @@ class Handler:
             raise TypeError('level should be an integer.')
 
         self._level = pyloggermanager.LogLevel.check_level(value)
+        # Loggers cache the levels of their handlers along with the handler chain
+        pyloggermanager.Logger._invalidate_caches()
 
     @property
     def name(self) -> str:
@@ -148,40 +196,38 @@ class Handler:
 
     def _acquire_lock(self) -> None:
         """
-        Acquires a lock for thread safety.
+        Acquires the handler's lock for thread safety.
         """
-        from pyloggermanager import Lock
-
-        self._lock_name = Lock.generate_name()
-        self._create_lock()
-        Lock.acquire(self._lock_name)
+        self._lock.acquire()
 
     def _create_lock(self) -> None:
         """
-        Creates a lock.
+        Creates the handler's lock, or registers the existing one under the current lock name.
         """
-        from pyloggermanager import Lock
-
-        Lock.create(self._lock_name)
+        self._lock = pyloggermanager.Lock.create(self._lock_name, self._lock)
 
     def _release_lock(self) -> None:
         """
         Releases the lock acquired for thread safety.
         """
-        from pyloggermanager import Lock
+        self._lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Resets the state the handler inherited from the parent process. Called in the child process
+        after a fork, once the locks have been reinitialized.
+        """
 
-        Lock.release(self._lock_name)
+    def _before_fork(self) -> None:
+        """
+        Prepares the handler for a fork of the process. Called in the parent process before it forks.
+        """
 
     def close(self) -> None:
         """
         Closes the handler.
         """
-        self._acquire_lock()
-        try:
-            if self in _handlersList:
-                _handlersList.remove(self)
-        finally:
-            self._release_lock()
+        _handlersRegistry.pop(self._registry_key, None)
 
     def emit(self, record, ignore_display: bool) -> None:
         """
@@ -192,6 +238,19 @@ class Handler:
         """
         raise NotImplementedError('emit() method must be implemented in subclasses.')
 
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Emits a batch of log records. Emits them one by one unless a subclass formats and writes
+        the batch at once. Must be called with the handler lock held.
+
+        :param records: Log records to emit.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        for record in records:
+            self.emit(record, ignore_display)
+
     def format(self, record) -> str:
         """
         Formats a log record using the handler's formatter.
@@ -210,11 +269,11 @@ class Handler:
     @staticmethod
     def get_handlers() -> list[Any]:
         """
-        Retrieves a list of all handlers.
+        Retrieves a list of all live handlers that have not been closed, in creation order.
 
         :return: List of all handlers.
         """
-        return _handlersList
+        return list(_handlersRegistry.values())
 
     def handle(self, record, ignore_display: bool) -> None:
         """
@@ -234,6 +293,30 @@ class Handler:
         finally:
             self._release_lock()
 
+    def handle_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Handles a batch of log records, acquiring the handler lock once for the whole batch.
+
+        :param records: Log records.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        if not isinstance(records, list) or \
+                not all(isinstance(record, pyloggermanager.Record) for record in records):
+            raise TypeError('records should be a list of Record type.')
+        elif not isinstance(ignore_display, bool):
+            raise TypeError('ignore_display should be a boolean.')
+
+        if not records:
+            return
+
+        self._acquire_lock()
+        try:
+            self.emit_batch(records, ignore_display)
+        finally:
+            self._release_lock()
+
 
 class ConsoleHandler(Handler):
     """
@@ -362,12 +445,7 @@ class StreamHandler(Handler):
         if not issubclass(type(stream), Stream):
             raise TypeError('stream should be subclass of Stream.')
 
-        self._acquire_lock()
-        try:
-            self._stream = stream
-        finally:
-            self._release_lock()
-
+        self._stream = stream
         super().__init__(name, level, colorization, formatter)
 
     @property
@@ -422,6 +500,27 @@ class StreamHandler(Handler):
             ) if self.colorization else formatted_record
             print(colored_message)
 
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Emits a batch of log records to the stream with a single write and flush.
+
+        :param records: Log records to emit.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        import pycolorecho
+
+        formatted_records = [self.format(record) for record in records]
+        self._stream.write(self.TERMINATOR.join(formatted_records) + self.TERMINATOR)
+        self.flush()
+
+        if not ignore_display:
+            for formatted_record in formatted_records:
+                print(pycolorecho.get_colorized_message_by_mappings(
+                    formatted_record, mappings=self.colorization
+                ) if self.colorization else formatted_record)
+
     def flush(self) -> None:
         """
         Flushes the stream if it has a flush method.
@@ -434,6 +533,502 @@ class StreamHandler(Handler):
             self._release_lock()
 
 
+class FlushPolicy:
+    """
+    Describes when a handler that keeps its stream open should flush buffered output.
+    A flush is triggered as soon as any of the configured thresholds is reached: a number of
+    pending records, a number of pending characters, an elapsed interval in milliseconds since
+    the last flush, or a record at or above a given log level. The interval is only checked when
+    the next record is written; no timer flushes an idle handler.
+    """
+
+    def __init__(self, records: int = None, size: int = 0, interval: int = 0, level: int = None) -> None:
+        """
+        Initializes a FlushPolicy object.
+
+        :param records: Flush after this many pending records, 0 to disable. Defaults to None, which flushes every
+            record when no other threshold is given and disables the record threshold otherwise.
+        :type records: int
+        :param size: Flush after this many pending characters, 0 to disable. Defaults to 0.
+        :type size: int
+        :param interval: Flush when this many milliseconds elapsed since the last flush, 0 to disable. Defaults to 0.
+        :type interval: int
+        :param level: Flush on records at or above this log level, None to disable. Defaults to None.
+        :type level: int
+        """
+        if not isinstance(records, Union[int, NoneType]):
+            raise TypeError('records should be an integer.')
+        elif not isinstance(size, int):
+            raise TypeError('size should be an integer.')
+        elif not isinstance(interval, int):
+            raise TypeError('interval should be an integer.')
+        elif not isinstance(level, Union[int, NoneType]):
+            raise TypeError('level should be an integer.')
+
+        if records is None:
+            records = 0 if size or interval or level is not None else 1
+
+        if records < 0 or size < 0 or interval < 0:
+            raise ValueError('records, size and interval should not be negative.')
+
+        self._records = records
+        self._size = size
+        self._interval = interval
+        self._level = level
+
+    @property
+    def interval(self) -> int:
+        """
+        Gets the flush interval in milliseconds.
+
+        :return: Flush interval in milliseconds.
+        :rtype: int
+        """
+        return self._interval
+
+    @property
+    def level(self) -> int | None:
+        """
+        Gets the log level at or above which every record is flushed.
+
+        :return: Flush level.
+        :rtype: int | None
+        """
+        return self._level
+
+    @property
+    def records(self) -> int:
+        """
+        Gets the number of pending records that triggers a flush.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        return self._records
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the number of pending characters that triggers a flush.
+
+        :return: Number of characters.
+        :rtype: int
+        """
+        return self._size
+
+    def should_flush(self, level_number: int, pending_records: int, pending_size: int, elapsed: float) -> bool:
+        """
+        Checks whether the pending output should be flushed after writing a record.
+
+        :param level_number: Log level of the record just written.
+        :type level_number: int
+        :param pending_records: Number of records written since the last flush.
+        :type pending_records: int
+        :param pending_size: Number of characters written since the last flush.
+        :type pending_size: int
+        :param elapsed: Seconds elapsed since the last flush.
+        :type elapsed: float
+        :return: True if the output should be flushed, False otherwise.
+        :rtype: bool
+        """
+        return (0 < self._records <= pending_records) or \
+            (0 < self._size <= pending_size) or \
+            (0 < self._interval <= elapsed * 1000) or \
+            (self._level is not None and level_number >= self._level)
+
+
+class Compressor:
+    """
+    Compresses closed log files on a bounded pool of background worker threads, so the thread
+    that logged the record that closed a file never waits for its compression. The standard
+    library codecs release the GIL while compressing, so the workers run alongside logging threads.
+    A file is compressed to '<file_name><extension>' and the original is deleted afterwards.
+    """
+    GZIP = 'gzip'
+    BZ2 = 'bz2'
+    LZMA = 'lzma'
+
+    # Extension and allowed level range of each codec.
+    _CODECS = {
+        GZIP: ('.gz', 0, 9),
+        BZ2: ('.bz2', 1, 9),
+        LZMA: ('.xz', 0, 9)
+    }
+
+    def __init__(self, codec: str = GZIP, level: int = None, workers: int = 1) -> None:
+        """
+        Initializes a Compressor object.
+
+        :param codec: Compression codec, one of 'gzip', 'bz2' or 'lzma'. Defaults to 'gzip'.
+        :type codec: str
+        :param level: Compression level, None for the codec default. Defaults to None.
+        :type level: int
+        :param workers: Maximum number of files compressed concurrently. Defaults to 1.
+        :type workers: int
+        """
+        if not isinstance(codec, str):
+            raise TypeError('codec should be a string.')
+        elif not isinstance(level, Union[int, NoneType]):
+            raise TypeError('level should be an integer.')
+        elif not isinstance(workers, int):
+            raise TypeError('workers should be an integer.')
+
+        codec = codec.lower()
+        if codec not in self._CODECS:
+            raise ValueError(f"Invalid codec '{codec}'. Allowed values are: {', '.join(self._CODECS)}.")
+
+        extension, minimum, maximum = self._CODECS[codec]
+        if level is not None and not minimum <= level <= maximum:
+            raise ValueError(f'level should be between {minimum} and {maximum} for {codec}.')
+        elif workers < 1:
+            raise ValueError('workers should be greater than 0.')
+
+        self._codec = codec
+        self._extension = extension
+        self._level = level
+        self._workers = workers
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        _compressors.add(self)
+
+    @property
+    def codec(self) -> str:
+        """
+        Gets the compression codec.
+
+        :return: Compression codec.
+        :rtype: str
+        """
+        return self._codec
+
+    @property
+    def extension(self) -> str:
+        """
+        Gets the extension appended to compressed files.
+
+        :return: File extension.
+        :rtype: str
+        """
+        return self._extension
+
+    @property
+    def level(self) -> int | None:
+        """
+        Gets the compression level.
+
+        :return: Compression level, None for the codec default.
+        :rtype: int | None
+        """
+        return self._level
+
+    @property
+    def pending(self) -> int:
+        """
+        Gets the number of files waiting for or undergoing compression.
+
+        :return: Number of pending files.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    @property
+    def workers(self) -> int:
+        """
+        Gets the maximum number of files compressed concurrently.
+
+        :return: Number of workers.
+        :rtype: int
+        """
+        return self._workers
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drops the worker threads and pending compressions inherited from the parent process, which
+        go on in the parent; new workers are started on the next compression.
+        """
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = set()
+
+    def _open(self, file_name: str) -> Any:
+        """
+        Opens a compressed file for writing with the configured codec and level.
+
+        :param file_name: Name of the compressed file.
+        :type file_name: str
+        :return: Binary file object compressing the data written to it.
+        :rtype: Any
+        """
+        if self._codec == self.GZIP:
+            return gzip.open(file_name, 'wb', compresslevel=9 if self._level is None else self._level)
+        elif self._codec == self.BZ2:
+            return bz2.open(file_name, 'wb', compresslevel=9 if self._level is None else self._level)
+        else:
+            return lzma.open(file_name, 'wb', preset=self._level)
+
+    def _compress(self, file_name: str) -> str | None:
+        """
+        Compresses a file into a temporary file, moves it into place and deletes the original.
+        Runs on a worker thread; failures are reported on stderr.
+
+        :param file_name: Name of the file to compress.
+        :type file_name: str
+        :return: Name of the compressed file, None if the compression failed.
+        :rtype: str | None
+        """
+        target = file_name + self._extension
+        temporary = target + '.tmp'
+        try:
+            with open(file_name, 'rb') as source, self._open(temporary) as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+            os.replace(temporary, target)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return None
+
+        try:
+            os.remove(file_name)
+        except FileNotFoundError:
+            pass
+        return target
+
+    def compress(self, file_name: str) -> concurrent.futures.Future:
+        """
+        Schedules the compression of a closed file on a worker thread.
+
+        :param file_name: Name of the file to compress.
+        :type file_name: str
+        :return: Future resolving to the name of the compressed file, or None if the compression failed.
+        :rtype: concurrent.futures.Future
+        """
+        if not isinstance(file_name, str):
+            raise TypeError('file_name should be a string.')
+
+        return self._submit(self._compress, file_name)
+
+    def _submit(self, function: Callable, *args: Any) -> concurrent.futures.Future:
+        """
+        Schedules a function on a worker thread, counting it as pending until it finishes.
+
+        :param function: Function to run.
+        :type function: Callable
+        :param args: Arguments of the function.
+        :type args: Any
+        :return: Future resolving to the result of the function.
+        :rtype: concurrent.futures.Future
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self._workers, thread_name_prefix='Compressor')
+            future = self._executor.submit(function, *args)
+            self._pending.add(future)
+
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: concurrent.futures.Future) -> None:
+        """
+        Forgets a finished compression.
+
+        :param future: Future of the finished compression.
+        :type future: concurrent.futures.Future
+        """
+        with self._lock:
+            self._pending.discard(future)
+
+    def wait(self) -> None:
+        """
+        Blocks until every scheduled compression has finished.
+        """
+        with self._lock:
+            pending = list(self._pending)
+
+        concurrent.futures.wait(pending)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker threads. Files scheduled later start a new pool.
+
+        :param wait: Wait for the scheduled compressions to finish. Defaults to True.
+        :type wait: bool
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class _AppendWriter:
+    """
+    Raw writer used by file handlers in place of a text stream, appending to a file descriptor opened
+    with O_APPEND. Written records are encoded and buffered until flushed, and a flush issues a single
+    os.writev (or a single os.write of the joined buffer where os.writev is not available) per IOV_MAX
+    records. A burst of records therefore only costs one system call when it is flushed at once, with
+    'emit_batch' or a FlushPolicy buffering several records; the default policy flushes, and so writes,
+    every record. Every system call carries whole records and the kernel appends its data at the end of
+    the file at once, so the lines of processes appending to the same file do not interleave. A short
+    write, which cuts a record, is not completed by a later system call but reported with an OSError.
+    Records a failed flush leaves unwritten are kept for the next one up to a limit, past which the
+    oldest are dropped, so a failing disk does not grow the memory of the process without bound.
+    """
+
+    # Maximum number of buffers passed to a single os.writev call.
+    try:
+        _IOV_MAX = max(os.sysconf('SC_IOV_MAX'), 16)
+    except (AttributeError, ValueError, OSError):
+        _IOV_MAX = 1024
+
+    # Maximum number of bytes passed to a single system call, Linux writes at most 0x7ffff000 bytes per call.
+    _MAX_BYTES = 0x7ffff000
+
+    # Maximum number of bytes kept for the next flush after a failed write, the oldest records are dropped beyond it.
+    _MAX_RETAINED = 8 * 1024 * 1024
+
+    def __init__(self, file_name: str, file_mode: str, encoding: str) -> None:
+        """
+        Opens the file descriptor of a raw writer.
+
+        :param file_name: Name of the file.
+        :type file_name: str
+        :param file_mode: Writing mode, 'a', 'w' or 'x', optionally followed by '+', 'b' or 't'.
+        :type file_mode: str
+        :param encoding: Encoding of the written strings.
+        :type encoding: str
+        """
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+        if file_mode[0] == 'w':
+            flags |= os.O_TRUNC
+        elif file_mode[0] == 'x':
+            flags |= os.O_EXCL
+
+        self._fd = os.open(file_name, flags, 0o666)
+        self._encoding = encoding
+        self._buffers = []
+
+    @property
+    def closed(self) -> bool:
+        """
+        Gets whether the file descriptor is closed.
+
+        :return: True if the writer is closed, False otherwise.
+        :rtype: bool
+        """
+        return self._fd is None
+
+    @staticmethod
+    def _write_buffers(fd: int, buffers: list) -> int:
+        """
+        Writes buffers to a file descriptor with a single system call.
+
+        :param fd: File descriptor to write to.
+        :type fd: int
+        :param buffers: Buffers to write.
+        :type buffers: list
+        :return: Number of bytes written.
+        :rtype: int
+        """
+        if hasattr(os, 'writev'):
+            return os.writev(fd, buffers)
+        return os.write(fd, b''.join(buffers))
+
+    def write(self, data: str | bytes) -> int:
+        """
+        Buffers a record until the next flush.
+
+        :param data: Record to write, encoded with the encoding of the writer if it is a string.
+        :type data: str | bytes
+        :return: Number of bytes buffered.
+        :rtype: int
+        """
+        if self._fd is None:
+            raise ValueError('write to a closed writer.')
+
+        if isinstance(data, str):
+            data = data.encode(self._encoding)
+        self._buffers.append(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records with a single system call per IOV_MAX records, each system call
+        carrying whole records only. The records not written when a system call fails are kept for the
+        next flush, up to _MAX_RETAINED bytes: beyond it, the oldest records are dropped and the OSError
+        raised reports how many. A short write raises an OSError; the record it cut is dropped, as its
+        beginning is already in the file, and the records after it are kept for the next flush.
+        """
+        buffers = self._buffers
+        if not buffers or self._fd is None:
+            return
+
+        self._buffers = []
+        index = 0
+        try:
+            while index < len(buffers):
+                end = index + 1
+                size = len(buffers[index])
+                while end < len(buffers) and end - index < self._IOV_MAX and \
+                        size + len(buffers[end]) <= self._MAX_BYTES:
+                    size += len(buffers[end])
+                    end += 1
+
+                written = self._write_buffers(self._fd, buffers[index:end])
+                if written < size:
+                    while written >= len(buffers[index]):
+                        written -= len(buffers[index])
+                        index += 1
+                    if not written:
+                        raise OSError(f'Short write to the log file, {len(buffers) - index} records not written.')
+
+                    length = len(buffers[index])
+                    index += 1
+                    raise OSError(f'Short write to the log file cut a record after {written} of {length} bytes.')
+                index = end
+        except BaseException as error:
+            buffers = buffers[index:] + self._buffers
+            size = sum(map(len, buffers))
+            dropped = 0
+            while size > self._MAX_RETAINED:
+                size -= len(buffers[dropped])
+                dropped += 1
+            self._buffers = buffers[dropped:]
+            if dropped:
+                raise OSError(f'Failed writes to the log file, {dropped} records dropped.') from error
+            raise
+
+    def discard(self) -> None:
+        """
+        Drops the buffered records and closes the file descriptor without writing them.
+        """
+        if self._fd is None:
+            return
+
+        try:
+            os.close(self._fd)
+        finally:
+            self._fd = None
+            self._buffers = []
+
+    def close(self) -> None:
+        """
+        Flushes the buffered records and closes the file descriptor.
+        """
+        if self._fd is None:
+            return
+
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._buffers = []
+
+
 class FileHandler(Handler):
     """
     Subclass of Handler responsible for handling log records by writing them to a file.
@@ -451,7 +1046,11 @@ class FileHandler(Handler):
             formatter: Formatter = DefaultFormatter(),
             file_name: str = 'default.log',
             file_mode: str = 'a',
-            encoding: str = 'UTF-8'
+            encoding: str = 'UTF-8',
+            keep_open: bool = False,
+            flush_policy: FlushPolicy = None,
+            compressor: Compressor = None,
+            raw: bool = False
     ) -> None:
         """
         Initializes a FileHandler object.
@@ -470,6 +1069,19 @@ class FileHandler(Handler):
         :type file_mode: int | FileMode
         :param encoding: Encoding to be used for writing to the log file. Defaults to 'UTF-8'.
         :type encoding: str
+        :param keep_open: Keep the file stream open between records instead of reopening it for
+            every record. Defaults to False.
+        :type keep_open: bool
+        :param flush_policy: Policy deciding when an open file stream is flushed. Defaults to
+            flushing every record.
+        :type flush_policy: FlushPolicy
+        :param compressor: Compressor for the log files the handler is done with, None to leave them
+            uncompressed. Defaults to None.
+        :type compressor: Compressor
+        :param raw: Write through a raw file descriptor opened with O_APPEND instead of a text stream,
+            with a single system call per flush and without splitting records between system calls.
+            Requires a writing file mode ('a', 'w' or 'x'). Defaults to False.
+        :type raw: bool
         """
         if not isinstance(file_name, str):
             raise TypeError('file_name should be a string.')
@@ -477,14 +1089,55 @@ class FileHandler(Handler):
             raise TypeError('file_mode should be a string.')
         elif not isinstance(encoding, str):
             raise TypeError('encoding should be a string.')
+        elif not isinstance(keep_open, bool):
+            raise TypeError('keep_open should be a boolean.')
+        elif not isinstance(flush_policy, Union[FlushPolicy, NoneType]):
+            raise TypeError('flush_policy should be of FlushPolicy type.')
+        elif not isinstance(compressor, Union[Compressor, NoneType]):
+            raise TypeError('compressor should be of Compressor type.')
+        elif not isinstance(raw, bool):
+            raise TypeError('raw should be a boolean.')
+
+        file_mode = pyloggermanager.FileMode.check_mode(file_mode)
+        self._check_raw_mode(raw, file_mode)
 
         self._file_name = os.fspath(file_name)
-        self._file_mode = pyloggermanager.FileMode.check_mode(file_mode)
+        self._file_mode = file_mode
         self._encoding = encoding
+        self._keep_open = keep_open
+        self._flush_policy = flush_policy if flush_policy is not None else FlushPolicy()
+        self._compressor = compressor
+        self._raw = raw
         self._file_stream = None
+        self._pending_records = 0
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
 
         super().__init__(name, level, colorization, formatter)
 
+    @property
+    def compressor(self) -> Compressor | None:
+        """
+        Gets the compressor for the log files the handler is done with.
+
+        :return: Compressor of the handler, None if log files are left uncompressed.
+        :rtype: Compressor | None
+        """
+        return self._compressor
+
+    @compressor.setter
+    def compressor(self, value: Compressor | None) -> None:
+        """
+        Sets the compressor for the log files the handler is done with.
+
+        :param value: Compressor of the handler, None to leave log files uncompressed.
+        :type value: Compressor | None
+        """
+        if not isinstance(value, Union[Compressor, NoneType]):
+            raise TypeError('compressor should be of Compressor type.')
+
+        self._compressor = value
+
     @property
     def encoding(self) -> str:
         """
@@ -506,6 +1159,7 @@ class FileHandler(Handler):
         if not isinstance(value, str):
             raise TypeError('encoding should be a string.')
 
+        self._close_file_stream()
         self._encoding = value
 
     @property
@@ -529,7 +1183,10 @@ class FileHandler(Handler):
         if not isinstance(value, str):
             raise TypeError('file_mode should be a string.')
 
-        self._file_mode = pyloggermanager.FileMode.check_mode(value)
+        value = pyloggermanager.FileMode.check_mode(value)
+        self._check_raw_mode(self._raw, value)
+        self._close_file_stream()
+        self._file_mode = value
 
     @property
     def filename(self) -> str:
@@ -552,34 +1209,173 @@ class FileHandler(Handler):
         if not isinstance(value, str):
             raise TypeError('file_name should be a string.')
 
-        self._file_name = os.fspath(value)
-
-    def _close_file_stream(self) -> None:
-        """
-        Closes the file stream used for writing log records.
-        """
         self._acquire_lock()
         try:
-            if self._file_stream is not None:
-                self._file_stream.close()
+            previous = self._file_name
+            self._close_file_stream()
+            self._file_name = os.fspath(value)
         finally:
             self._release_lock()
 
-    def _open_file_stream(self) -> None:
+        if self._compressor is not None and previous != self._file_name and os.path.exists(previous):
+            self._compressor.compress(previous)
+
+    @property
+    def flush_policy(self) -> FlushPolicy:
         """
-        Opens the file stream for writing log records.
+        Gets the policy deciding when an open file stream is flushed.
+
+        :return: Flush policy of the handler.
+        :rtype: FlushPolicy
         """
-        self._acquire_lock()
-        try:
-            self._file_stream = io.open(self._file_name, self._file_mode, encoding=self._encoding)
-        finally:
-            self._release_lock()
+        return self._flush_policy
 
-    def close(self) -> None:
+    @flush_policy.setter
+    def flush_policy(self, value: FlushPolicy) -> None:
         """
-        Closes the file stream used for writing log records.
+        Sets the policy deciding when an open file stream is flushed.
+
+        :param value: Flush policy of the handler.
+        :type value: FlushPolicy
         """
-        self._close_file_stream()
+        if not isinstance(value, FlushPolicy):
+            raise TypeError('flush_policy should be of FlushPolicy type.')
+
+        self._flush_policy = value
+
+    @property
+    def keep_open(self) -> bool:
+        """
+        Gets whether the file stream is kept open between records.
+
+        :return: True if the file stream is kept open, False otherwise.
+        :rtype: bool
+        """
+        return self._keep_open
+
+    @keep_open.setter
+    def keep_open(self, value: bool) -> None:
+        """
+        Sets whether the file stream is kept open between records.
+
+        :param value: True to keep the file stream open, False otherwise.
+        :type value: bool
+        """
+        if not isinstance(value, bool):
+            raise TypeError('keep_open should be a boolean.')
+
+        if not value:
+            self._close_file_stream()
+        self._keep_open = value
+
+    @property
+    def raw(self) -> bool:
+        """
+        Gets whether records are written through a raw file descriptor opened with O_APPEND.
+
+        :return: True if records are written through a raw file descriptor, False otherwise.
+        :rtype: bool
+        """
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: bool) -> None:
+        """
+        Sets whether records are written through a raw file descriptor opened with O_APPEND.
+
+        :param value: True to write through a raw file descriptor, False to write through a text stream.
+        :type value: bool
+        """
+        if not isinstance(value, bool):
+            raise TypeError('raw should be a boolean.')
+
+        self._check_raw_mode(value, self._file_mode)
+        self._close_file_stream()
+        self._raw = value
+
+    @staticmethod
+    def _check_raw_mode(raw: bool, file_mode: str) -> None:
+        """
+        Checks that a raw file descriptor can be opened with the given file mode.
+
+        :param raw: Whether records are written through a raw file descriptor.
+        :type raw: bool
+        :param file_mode: File mode of the handler.
+        :type file_mode: str
+        """
+        if raw and file_mode[0] not in 'awx':
+            raise ValueError('file_mode should be a writing mode when raw is True.')
+
+    def _close_file_stream(self) -> None:
+        """
+        Flushes and closes the file stream used for writing log records.
+        """
+        self._acquire_lock()
+        try:
+            if self._file_stream is not None:
+                try:
+                    self._file_stream.flush()
+                finally:
+                    self._file_stream.close()
+                    self._file_stream = None
+                    self._pending_records = 0
+                    self._pending_size = 0
+        finally:
+            self._release_lock()
+
+    def _open_file_stream(self) -> None:
+        """
+        Opens the file stream for writing log records.
+        """
+        self._acquire_lock()
+        try:
+            if self._raw:
+                self._file_stream = _AppendWriter(self._file_name, self._file_mode, self._encoding)
+            else:
+                self._file_stream = io.open(self._file_name, self._file_mode, encoding=self._encoding)
+        finally:
+            self._release_lock()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Detaches the file stream shared with the parent process; it is reopened on the next record.
+        The output buffered in the stream belongs to the parent, which writes it, so the stream is
+        closed without flushing it. A file opened for writing is reopened for appending, so the child
+        does not truncate it.
+        """
+        stream, self._file_stream = self._file_stream, None
+        if stream is not None:
+            try:
+                if isinstance(stream, _AppendWriter):
+                    stream.discard()
+                else:
+                    # Closing the raw file first turns the close of the buffered layers into a no-op.
+                    raw = getattr(stream, 'buffer', stream)
+                    getattr(raw, 'raw', raw).close()
+                    stream.close()
+            except (OSError, ValueError):
+                pass
+
+        if self._file_mode[0] in 'wx':
+            self._file_mode = 'a' + self._file_mode[1:]
+        self._pending_records = 0
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+
+    def _before_fork(self) -> None:
+        """
+        Flushes the open file stream, so the output buffered before the fork reaches the file before
+        the output of the child. Records buffered by other threads while the process forks are left to
+        the parent, as the child discards the buffers it inherits.
+        """
+        if self._file_stream is not None:
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Closes the file stream used for writing log records.
+        """
+        self._close_file_stream()
         super().close()
 
     def emit(self, record, ignore_display: bool) -> None:
@@ -594,14 +1390,11 @@ class FileHandler(Handler):
         import pycolorecho
 
         formatted_record = self.format(record)
-        self._open_file_stream()
         self._acquire_lock()
         try:
-            self._file_stream.write(formatted_record + self.TERMINATOR)
-            self._file_stream.flush()
+            self._write_message(record.level_number, formatted_record + self.TERMINATOR)
         finally:
             self._release_lock()
-            self._close_file_stream()
 
         if not ignore_display:
             colored_message = pycolorecho.get_colorized_message_by_mappings(
@@ -609,6 +1402,105 @@ class FileHandler(Handler):
             ) if self.colorization else formatted_record
             print(colored_message)
 
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Emits a batch of log records by writing them to the log file at once.
+
+        :param records: Log records to emit.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        import pycolorecho
+
+        formatted_records = [self.format(record) for record in records]
+        self._acquire_lock()
+        try:
+            self._write_messages(
+                max(record.level_number for record in records),
+                [formatted_record + self.TERMINATOR for formatted_record in formatted_records]
+            )
+        finally:
+            self._release_lock()
+
+        if not ignore_display:
+            for formatted_record in formatted_records:
+                print(pycolorecho.get_colorized_message_by_mappings(
+                    formatted_record, mappings=self.colorization
+                ) if self.colorization else formatted_record)
+
+    def _write_messages(self, level_number: int, messages: list) -> None:
+        """
+        Writes a batch of terminated messages to the log file with a single write. Must be called
+        with the handler lock held.
+
+        :param level_number: Highest log level of the records being written.
+        :type level_number: int
+        :param messages: Terminated messages to write.
+        :type messages: list
+        """
+        self._write_message(level_number, ''.join(messages), len(messages))
+
+    def _write_message(self, level_number: int, message: str, records: int = 1) -> None:
+        """
+        Writes a terminated message to the log file, either through the long-lived file stream or by
+        opening and closing the file. Must be called with the handler lock held.
+
+        :param level_number: Log level of the record being written.
+        :type level_number: int
+        :param message: Terminated message to write.
+        :type message: str
+        :param records: Number of records the message holds. Defaults to 1.
+        :type records: int
+        """
+        if self._keep_open:
+            self._write_to_open_stream(level_number, message, records)
+        else:
+            self._open_file_stream()
+            try:
+                self._file_stream.write(message)
+            finally:
+                self._close_file_stream()
+
+    def _write_to_open_stream(self, level_number: int, message: str, records: int = 1) -> None:
+        """
+        Writes a message to the long-lived file stream, opening it on first use, and flushes
+        it when the flush policy asks for it. Must be called with the handler lock held.
+
+        :param level_number: Log level of the record being written.
+        :type level_number: int
+        :param message: Terminated message to write.
+        :type message: str
+        :param records: Number of records the message holds, counted against the flush policy. Defaults to 1.
+        :type records: int
+        """
+        if self._file_stream is None:
+            self._open_file_stream()
+            self._last_flush = time.monotonic()
+
+        self._file_stream.write(message)
+        self._count_written(level_number, len(message), records)
+
+    def _count_written(self, level_number: int, size: int, records: int) -> None:
+        """
+        Counts a message written to the open file stream against the flush policy, and flushes the
+        stream when the policy asks for it. Must be called with the handler lock held.
+
+        :param level_number: Log level of the records written.
+        :type level_number: int
+        :param size: Size of the message written.
+        :type size: int
+        :param records: Number of records the message holds.
+        :type records: int
+        """
+        self._pending_records += records
+        self._pending_size += size
+
+        if self._flush_policy.should_flush(
+                level_number, self._pending_records, self._pending_size, time.monotonic() - self._last_flush
+        ):
+            self.flush()
+
     def flush(self) -> None:
         """
         Flushes the file stream used for writing log records.
@@ -617,30 +1509,2577 @@ class FileHandler(Handler):
         try:
             if self._file_stream is not None:
                 self._file_stream.flush()
+            self._pending_records = 0
+            self._pending_size = 0
+            self._last_flush = time.monotonic()
         finally:
             self._release_lock()
 
 
-class StderrHandler(Handler):
+class RotatingFileHandler(FileHandler):
     """
-    Subclass of Handler responsible for handling log records by writing them to the standard error stream (stderr).
+    Subclass of FileHandler that rolls the log file over once it would exceed a maximum size,
+    keeping a number of backups named '<file_name>.1' (newest) to '<file_name>.<backup_count>'.
+    The file size is tracked in memory from the bytes written, so the file is only inspected
+    once when the handler starts writing to it.
     """
 
-    def __init__(self, level: int = 30) -> None:
+    def __init__(
+            self,
+            name: str = None,
+            level: int = 20,
+            colorization=None,
+            formatter: Formatter = DefaultFormatter(),
+            file_name: str = 'default.log',
+            encoding: str = 'UTF-8',
+            keep_open: bool = False,
+            flush_policy: FlushPolicy = None,
+            max_bytes: int = 0,
+            backup_count: int = 0,
+            compressor: Compressor = None,
+            raw: bool = False
+    ) -> None:
         """
-        Initializes a StderrHandler object.
+        Initializes a RotatingFileHandler object. The log file is always opened in append mode.
 
-        :param level: Handler log level. Defaults to WARNING level (30).
-        :type level: int
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int | LogLevel
+        :param colorization: Colorization object for the handler.
+        :type colorization: pycolorecho.ColorMapper
+        :param formatter: Formatter object for formatting log records.
+        :type formatter: Formatter
+        :param file_name: Name of the log file. Defaults to 'default.log'.
+        :type file_name: str
+        :param encoding: Encoding to be used for writing to the log file. Defaults to 'UTF-8'.
+        :type encoding: str
+        :param keep_open: Keep the file stream open between records instead of reopening it for
+            every record. Defaults to False.
+        :type keep_open: bool
+        :param flush_policy: Policy deciding when an open file stream is flushed. Defaults to
+            flushing every record.
+        :type flush_policy: FlushPolicy
+        :param max_bytes: Size in bytes the log file should not exceed, 0 to never roll over. Defaults to 0.
+        :type max_bytes: int
+        :param backup_count: Number of backups to keep, 0 to discard the rolled over file. Defaults to 0.
+        :type backup_count: int
+        :param compressor: Compressor for the backups, None to leave them uncompressed. Defaults to None.
+        :type compressor: Compressor
+        :param raw: Write through a raw file descriptor opened with O_APPEND instead of a text stream,
+            with a single system call per flush. Defaults to False.
+        :type raw: bool
+        """
+        if not isinstance(max_bytes, int):
+            raise TypeError('max_bytes should be an integer.')
+        elif not isinstance(backup_count, int):
+            raise TypeError('backup_count should be an integer.')
+
+        if max_bytes < 0 or backup_count < 0:
+            raise ValueError('max_bytes and backup_count should not be negative.')
+
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._size = 0
+        self._size_file_name = None  # File the tracked size belongs to, None until it is inspected
+        self._obsolete = []  # Rolled over files waiting to be deleted once the lock is released
+        self._compression = None  # Last scheduled shift and compression of the backups
+
+        super().__init__(
+            name, level, colorization, formatter, file_name, 'a', encoding, keep_open, flush_policy, compressor,
+            raw
+        )
+
+    @property
+    def backup_count(self) -> int:
         """
-        super().__init__(level=level)
+        Gets the number of backups to keep.
+
+        :return: Number of backups.
+        :rtype: int
+        """
+        return self._backup_count
 
     @property
-    def stream(self) -> TextIO:
+    def max_bytes(self) -> int:
         """
-        Gets the standard error stream (stderr).
+        Gets the size in bytes the log file should not exceed.
 
-        :return: Standard error stream (stderr).
-        :rtype: TextIO
+        :return: Maximum file size.
+        :rtype: int
         """
-        return sys.stderr
+        return self._max_bytes
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Detaches the file stream shared with the parent process and forgets the state of roll overs
+        started by the parent; the file size is read again on the next record.
+        """
+        super()._after_fork_in_child()
+        self._size_file_name = None
+        self._obsolete = []
+        self._compression = None
+
+    def _backup_name(self, index: int) -> str:
+        """
+        Returns the name of the backup with the given index.
+
+        :param index: Index of the backup, 1 being the newest.
+        :type index: int
+        :return: Backup file name.
+        :rtype: str
+        """
+        extension = self._compressor.extension if self._compressor is not None else ''
+        return f'{self._file_name}.{index}{extension}'
+
+    def _shift_compressed(self, file_name: str, rotated: str, previous: concurrent.futures.Future | None) -> None:
+        """
+        Shifts the backups by one index once the previous roll over is done with them, moves the rotated
+        file into place as the newest backup and compresses it. Runs on a worker thread of the compressor.
+        A backup whose compression failed is kept uncompressed and shifts like the compressed ones.
+
+        :param file_name: Name of the log file the backups belong to.
+        :type file_name: str
+        :param rotated: Name the log file was renamed to by the roll over.
+        :type rotated: str
+        :param previous: Shift and compression scheduled by the previous roll over, None if there is none.
+        :type previous: concurrent.futures.Future | None
+        """
+        if previous is not None:
+            concurrent.futures.wait([previous])
+
+        extensions = (self._compressor.extension, '')
+        try:
+            for extension in extensions:
+                try:
+                    os.remove(f'{file_name}.{self._backup_count}{extension}')
+                except FileNotFoundError:
+                    pass
+
+            for index in range(self._backup_count - 1, 0, -1):
+                for extension in extensions:
+                    source = f'{file_name}.{index}{extension}'
+                    if os.path.exists(source):
+                        os.replace(source, f'{file_name}.{index + 1}{extension}')
+
+            os.replace(rotated, f'{file_name}.1')
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return
+
+        self._compressor._compress(f'{file_name}.1')
+
+    def _remove_obsolete(self) -> None:
+        """
+        Deletes the rolled over files that dropped out of the kept backups.
+        """
+        while True:
+            try:
+                obsolete = self._obsolete.pop()
+            except IndexError:
+                return
+
+            try:
+                os.remove(obsolete)
+            except FileNotFoundError:
+                pass
+
+    def _rotate(self) -> None:
+        """
+        Closes the log file and shifts it and its backups by one index. The file dropping out of the
+        kept backups is only renamed aside, as deleting a large file can take a while; it is deleted
+        once the handler lock is released. With a compressor, the log file is only renamed aside; the
+        backups are shifted and the newest one compressed in the background, after the previous roll
+        over is done with them. Must be called with the handler lock held.
+        """
+        self._close_file_stream()
+
+        if self._compressor is not None and self._backup_count:
+            if os.path.exists(self._file_name):
+                rotated = f'{self._file_name}.{time.time_ns()}.rotated'
+                os.replace(self._file_name, rotated)
+                self._compression = self._compressor._submit(
+                    self._shift_compressed, self._file_name, rotated, self._compression
+                )
+            self._size = 0
+            return
+
+        discarded = self._backup_name(self._backup_count) if self._backup_count else self._file_name
+        if os.path.exists(discarded):
+            obsolete = f'{discarded}.{time.time_ns()}.obsolete'
+            os.replace(discarded, obsolete)
+            self._obsolete.append(obsolete)
+
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._backup_name(index)
+            if os.path.exists(source):
+                os.replace(source, self._backup_name(index + 1))
+        if self._backup_count and os.path.exists(self._file_name):
+            os.replace(self._file_name, self._backup_name(1))
+
+        self._size = 0
+
+    def _sync_size(self) -> None:
+        """
+        Reads the size of the log file once after the handler starts writing to a file.
+        Must be called with the handler lock held.
+        """
+        if self._size_file_name != self._file_name:
+            self._size = os.path.getsize(self._file_name) if os.path.exists(self._file_name) else 0
+            self._size_file_name = self._file_name
+
+    def _write_messages(self, level_number: int, messages: list) -> None:
+        """
+        Writes a batch of terminated messages to the log file, joining as many messages per write as
+        fit before the next roll over. Must be called with the handler lock held.
+
+        :param level_number: Highest log level of the records being written.
+        :type level_number: int
+        :param messages: Terminated messages to write.
+        :type messages: list
+        """
+        self._sync_size()
+
+        chunk = []
+        chunk_size = 0
+        for message in messages:
+            size = len(message.encode(self._encoding))
+            if self._max_bytes and self._size + chunk_size and self._size + chunk_size + size > self._max_bytes:
+                if chunk:
+                    FileHandler._write_message(self, level_number, ''.join(chunk), len(chunk))
+                    chunk = []
+                    chunk_size = 0
+                self._rotate()
+
+            chunk.append(message)
+            chunk_size += size
+
+        FileHandler._write_message(self, level_number, ''.join(chunk), len(chunk))
+        self._size += chunk_size
+
+    def _write_message(self, level_number: int, message: str, records: int = 1) -> None:
+        """
+        Writes a terminated message to the log file, rolling the file over first when the message
+        would make it exceed the maximum size. Must be called with the handler lock held.
+
+        :param level_number: Log level of the record being written.
+        :type level_number: int
+        :param message: Terminated message to write.
+        :type message: str
+        :param records: Number of records the message holds. Defaults to 1.
+        :type records: int
+        """
+        self._sync_size()
+
+        size = len(message.encode(self._encoding))
+        if self._max_bytes and self._size and self._size + size > self._max_bytes:
+            self._rotate()
+
+        super()._write_message(level_number, message, records)
+        self._size += size
+
+    def do_rollover(self) -> None:
+        """
+        Rolls the log file over regardless of its size.
+        """
+        self._acquire_lock()
+        try:
+            self._rotate()
+        finally:
+            self._release_lock()
+
+        self._remove_obsolete()
+
+    def handle(self, record, ignore_display: bool) -> None:
+        """
+        Handles a log record, deleting the files dropped by a roll over after the lock is released.
+
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :param record: Log record.
+        """
+        super().handle(record, ignore_display)
+        if self._obsolete:
+            self._remove_obsolete()
+
+    def handle_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Handles a batch of log records, deleting the files dropped by a roll over after the lock is released.
+
+        :param records: Log records.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        super().handle_batch(records, ignore_display)
+        if self._obsolete:
+            self._remove_obsolete()
+
+
+class TimedRotatingFileHandler(FileHandler):
+    """
+    Subclass of FileHandler that rolls the log file over at fixed time boundaries, renaming it to
+    '<file_name>.<period start>'. The next rollover timestamp is computed once per period, so every
+    record only compares a single float against it. Expired backups are deleted by a background worker.
+    """
+
+    # Seconds per rollover unit and the suffix format of the backups created for it.
+    _UNITS = {
+        'S': (1, '%Y-%m-%d_%H-%M-%S', r'\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}'),
+        'M': (60, '%Y-%m-%d_%H-%M', r'\d{4}-\d{2}-\d{2}_\d{2}-\d{2}'),
+        'H': (3600, '%Y-%m-%d_%H', r'\d{4}-\d{2}-\d{2}_\d{2}'),
+        'D': (86400, '%Y-%m-%d', r'\d{4}-\d{2}-\d{2}')
+    }
+
+    def __init__(
+            self,
+            name: str = None,
+            level: int = 20,
+            colorization=None,
+            formatter: Formatter = DefaultFormatter(),
+            file_name: str = 'default.log',
+            encoding: str = 'UTF-8',
+            keep_open: bool = False,
+            flush_policy: FlushPolicy = None,
+            when: str = 'D',
+            interval: int = 1,
+            utc: bool = False,
+            backup_count: int = 0,
+            max_age: int = 0,
+            compressor: Compressor = None,
+            raw: bool = False
+    ) -> None:
+        """
+        Initializes a TimedRotatingFileHandler object. The log file is always opened in append mode.
+
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int | LogLevel
+        :param colorization: Colorization object for the handler.
+        :type colorization: pycolorecho.ColorMapper
+        :param formatter: Formatter object for formatting log records.
+        :type formatter: Formatter
+        :param file_name: Name of the log file. Defaults to 'default.log'.
+        :type file_name: str
+        :param encoding: Encoding to be used for writing to the log file. Defaults to 'UTF-8'.
+        :type encoding: str
+        :param keep_open: Keep the file stream open between records instead of reopening it for
+            every record. Defaults to False.
+        :type keep_open: bool
+        :param flush_policy: Policy deciding when an open file stream is flushed. Defaults to
+            flushing every record.
+        :type flush_policy: FlushPolicy
+        :param when: Rollover unit, one of 'S' (seconds), 'M' (minutes), 'H' (hours) or 'D' (days,
+            starting at midnight). Defaults to 'D'.
+        :type when: str
+        :param interval: Number of units per log file. Defaults to 1.
+        :type interval: int
+        :param utc: Align the boundaries and backup names to UTC instead of local time. Defaults to False.
+        :type utc: bool
+        :param backup_count: Number of backups to keep, 0 to keep all of them. Defaults to 0.
+        :type backup_count: int
+        :param max_age: Age in seconds after which backups are deleted, 0 to never expire them. Defaults to 0.
+        :type max_age: int
+        :param compressor: Compressor for the backups, None to leave them uncompressed. Defaults to None.
+        :type compressor: Compressor
+        :param raw: Write through a raw file descriptor opened with O_APPEND instead of a text stream,
+            with a single system call per flush. Defaults to False.
+        :type raw: bool
+        """
+        if not isinstance(when, str):
+            raise TypeError('when should be a string.')
+        elif not isinstance(interval, int):
+            raise TypeError('interval should be an integer.')
+        elif not isinstance(utc, bool):
+            raise TypeError('utc should be a boolean.')
+        elif not isinstance(backup_count, int):
+            raise TypeError('backup_count should be an integer.')
+        elif not isinstance(max_age, int):
+            raise TypeError('max_age should be an integer.')
+
+        if when.upper() not in self._UNITS:
+            raise ValueError(f"Invalid when '{when}'. Allowed values are: {', '.join(self._UNITS)}.")
+        elif interval < 1:
+            raise ValueError('interval should be greater than 0.')
+        elif backup_count < 0 or max_age < 0:
+            raise ValueError('backup_count and max_age should not be negative.')
+
+        self._when = when.upper()
+        self._interval = interval
+        self._utc = utc
+        self._backup_count = backup_count
+        self._max_age = max_age
+        self._executor = None
+        self._compressions = set()  # Compressions of backups that expired backups are only deleted after
+
+        super().__init__(
+            name, level, colorization, formatter, file_name, 'a', encoding, keep_open, flush_policy, compressor,
+            raw
+        )
+
+        # An existing file continues the period it was last written in.
+        now = os.path.getmtime(self._file_name) if os.path.exists(self._file_name) else time.time()
+        self._period_start = self._compute_period_start(now)
+        self._rollover_at = self._compute_rollover(self._period_start)
+
+    @property
+    def backup_count(self) -> int:
+        """
+        Gets the number of backups to keep.
+
+        :return: Number of backups.
+        :rtype: int
+        """
+        return self._backup_count
+
+    @property
+    def interval(self) -> int:
+        """
+        Gets the number of units per log file.
+
+        :return: Rollover interval.
+        :rtype: int
+        """
+        return self._interval
+
+    @property
+    def max_age(self) -> int:
+        """
+        Gets the age in seconds after which backups are deleted.
+
+        :return: Maximum backup age.
+        :rtype: int
+        """
+        return self._max_age
+
+    @property
+    def rollover_at(self) -> float:
+        """
+        Gets the timestamp at which the log file is rolled over next.
+
+        :return: Next rollover timestamp.
+        :rtype: float
+        """
+        return self._rollover_at
+
+    @property
+    def utc(self) -> bool:
+        """
+        Gets whether the boundaries and backup names are aligned to UTC.
+
+        :return: True if UTC is used, False for local time.
+        :rtype: bool
+        """
+        return self._utc
+
+    @property
+    def when(self) -> str:
+        """
+        Gets the rollover unit.
+
+        :return: Rollover unit.
+        :rtype: str
+        """
+        return self._when
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Detaches the file stream shared with the parent process and drops the background worker,
+        whose thread does not exist in the child, and the compressions going on in the parent; a new
+        worker is started on the next roll over.
+        """
+        super()._after_fork_in_child()
+        self._executor = None
+        self._compressions = set()
+
+    def _utc_offset(self, timestamp: float) -> int:
+        """
+        Returns the offset in seconds of the boundary time zone at the given timestamp.
+
+        :param timestamp: Timestamp to get the offset for.
+        :type timestamp: float
+        :return: Offset from UTC in seconds.
+        :rtype: int
+        """
+        return 0 if self._utc else time.localtime(timestamp).tm_gmtoff
+
+    def _compute_period_start(self, timestamp: float) -> float:
+        """
+        Returns the start of the period containing the given timestamp.
+
+        :param timestamp: Timestamp within the period.
+        :type timestamp: float
+        :return: Period start timestamp.
+        :rtype: float
+        """
+        unit = self._UNITS[self._when][0] * self._interval
+        offset = self._utc_offset(timestamp)
+        local_start = (timestamp + offset) // unit * unit
+        return local_start - self._utc_offset(local_start - offset)
+
+    def _compute_rollover(self, period_start: float) -> float:
+        """
+        Returns the timestamp at which the period starting at the given timestamp ends.
+
+        :param period_start: Period start timestamp.
+        :type period_start: float
+        :return: Rollover timestamp.
+        :rtype: float
+        """
+        offset = self._utc_offset(period_start)
+        local_end = period_start + offset + self._UNITS[self._when][0] * self._interval
+        return local_end - self._utc_offset(local_end - offset)
+
+    def _backup_name(self, period_start: float) -> str:
+        """
+        Returns the name of the backup for the period starting at the given timestamp.
+
+        :param period_start: Period start timestamp.
+        :type period_start: float
+        :return: Backup file name.
+        :rtype: str
+        """
+        period = time.gmtime(period_start) if self._utc else time.localtime(period_start)
+        return f'{self._file_name}.{time.strftime(self._UNITS[self._when][1], period)}'
+
+    def get_backups(self) -> list:
+        """
+        Returns the backups of the log file, oldest first.
+
+        :return: Backup file names.
+        :rtype: list
+        """
+        directory, base_name = os.path.split(os.path.abspath(self._file_name))
+        extension = re.escape(self._compressor.extension) if self._compressor is not None else ''
+        pattern = re.compile(re.escape(base_name) + r'\.' + self._UNITS[self._when][2] + f'({extension})?$')
+        return sorted(
+            os.path.join(directory, entry) for entry in os.listdir(directory) if pattern.match(entry)
+        )
+
+    def _remove_expired(self) -> None:
+        """
+        Deletes the backups exceeding the backup count or the maximum age, once the backups scheduled
+        for compression are compressed, so a backup is never deleted while it is being compressed.
+        """
+        concurrent.futures.wait(list(self._compressions))
+
+        backups = self.get_backups()
+        expired = backups[:-self._backup_count] if self._backup_count else []
+
+        if self._max_age:
+            deadline = time.time() - self._max_age
+            for backup in backups[len(expired):]:
+                try:
+                    if os.path.getmtime(backup) < deadline:
+                        expired.append(backup)
+                except FileNotFoundError:
+                    pass
+
+        for backup in expired:
+            try:
+                os.remove(backup)
+            except FileNotFoundError:
+                pass
+
+    def _rotate(self, now: float) -> None:
+        """
+        Closes the log file, renames it after the period it covers and schedules its compression and
+        the deletion of expired backups in the background. Must be called with the handler lock held.
+
+        :param now: Current timestamp.
+        :type now: float
+        """
+        self._close_file_stream()
+
+        if os.path.exists(self._file_name):
+            backup = self._backup_name(self._period_start)
+            os.replace(self._file_name, backup)
+            if self._compressor is not None:
+                compression = self._compressor.compress(backup)
+                self._compressions.add(compression)
+                compression.add_done_callback(self._compressions.discard)
+
+        self._period_start = self._compute_period_start(now)
+        self._rollover_at = self._compute_rollover(self._period_start)
+
+        if self._backup_count or self._max_age:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    1, thread_name_prefix='TimedRotatingFileHandler'
+                )
+            self._executor.submit(self._remove_expired)
+
+    def _write_message(self, level_number: int, message: str, records: int = 1) -> None:
+        """
+        Writes a terminated message to the log file, rolling the file over first when the current
+        period has ended. Must be called with the handler lock held.
+
+        :param level_number: Log level of the record being written.
+        :type level_number: int
+        :param message: Terminated message to write.
+        :type message: str
+        :param records: Number of records the message holds. Defaults to 1.
+        :type records: int
+        """
+        now = time.time()
+        if now >= self._rollover_at:
+            self._rotate(now)
+
+        super()._write_message(level_number, message, records)
+
+    def do_rollover(self) -> None:
+        """
+        Rolls the log file over regardless of the current time.
+        """
+        self._acquire_lock()
+        try:
+            self._rotate(time.time())
+        finally:
+            self._release_lock()
+
+    def close(self) -> None:
+        """
+        Closes the file stream and waits for pending backup deletions to finish.
+        """
+        super().close()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class BinaryFileHandler(FileHandler):
+    """
+    Subclass of FileHandler responsible for handling log records by encoding them with a BinaryFormatter
+    and writing them to a binary file. Every time the file is opened a new segment is started, so the
+    logger, level, caller and thread names are written once per segment. Records that fail to encode do not
+    add their names to the segment, and a failed write starts a new segment with the next records. The
+    file is rendered back into text with 'python -m pyloggermanager.decode'. A segment cannot be shared
+    between processes, so a forked child stops writing to the file; processes should ship their records
+    to a single writer with a ProcessQueueHandler instead.
+    """
+
+    def __init__(
+            self,
+            name: str = None,
+            level: int = 20,
+            formatter: BinaryFormatter = None,
+            file_name: str = 'default.bin',
+            file_mode: str = 'a',
+            keep_open: bool = True,
+            flush_policy: FlushPolicy = None,
+            compressor: Compressor = None,
+            raw: bool = False
+    ) -> None:
+        """
+        Initializes a BinaryFileHandler object.
+
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int | LogLevel
+        :param formatter: Binary formatter encoding the log records. Defaults to a BinaryFormatter
+            encoding the caller details.
+        :type formatter: BinaryFormatter
+        :param file_name: Name of the binary log file. Defaults to 'default.bin'.
+        :type file_name: str
+        :param file_mode: File mode for opening the log file, opened in binary. Defaults to 'a'.
+        :type file_mode: int | FileMode
+        :param keep_open: Keep the file stream open between records. Reopening the file starts a new
+            segment, writing the names used by the records again. Defaults to True.
+        :type keep_open: bool
+        :param flush_policy: Policy deciding when an open file stream is flushed. Defaults to
+            flushing every record.
+        :type flush_policy: FlushPolicy
+        :param compressor: Compressor for the log files the handler is done with, None to leave them
+            uncompressed. Defaults to None.
+        :type compressor: Compressor
+        :param raw: Write through a raw file descriptor opened with O_APPEND instead of a text stream,
+            with a single system call per flush. Defaults to False.
+        :type raw: bool
+        """
+        if formatter is None:
+            formatter = BinaryFormatter()
+        elif not isinstance(formatter, BinaryFormatter):
+            raise TypeError('formatter should be of BinaryFormatter type.')
+
+        self._table = {}
+        self._detached = False
+
+        super().__init__(
+            name, level, None, formatter, file_name, file_mode, 'UTF-8', keep_open, flush_policy, compressor,
+            raw
+        )
+
+    @property
+    def formatter(self) -> BinaryFormatter:
+        """
+        Gets the binary formatter encoding the log records.
+
+        :return: Binary formatter of the handler.
+        :rtype: BinaryFormatter
+        """
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, value: BinaryFormatter) -> None:
+        """
+        Sets the binary formatter encoding the log records.
+
+        :param value: Binary formatter of the handler.
+        :type value: BinaryFormatter
+        """
+        if not isinstance(value, BinaryFormatter):
+            raise TypeError('formatter should be of BinaryFormatter type.')
+
+        self._formatter = value
+        pyloggermanager.Logger._invalidate_caches()
+
+    def _open_file_stream(self) -> None:
+        """
+        Opens the file stream in binary and starts a new segment.
+        """
+        self._acquire_lock()
+        try:
+            if self._raw:
+                self._file_stream = _AppendWriter(self._file_name, self._file_mode, self._encoding)
+            else:
+                self._file_stream = io.open(self._file_name, self._file_mode.replace('t', '').replace('b', '') + 'b')
+            self._file_stream.write(BinaryFormatter.MAGIC)
+            self._table = {}
+        finally:
+            self._release_lock()
+
+    def flush(self) -> None:
+        """
+        Flushes the file stream. After a failed flush the next records start a new segment, as the
+        records left in the stream, with the names they add to the segment, may be dropped.
+        """
+        self._acquire_lock()
+        try:
+            super().flush()
+        except BaseException:
+            self._table = None
+            raise
+        finally:
+            self._release_lock()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Detaches the file stream shared with the parent process and stops writing, as records of the
+        child would refer to the segment of the parent.
+        """
+        super()._after_fork_in_child()
+        self._detached = True
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Emits a log record by encoding it into the current segment of the log file. Binary records are
+        never displayed on the terminal.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        self._acquire_lock()
+        try:
+            self.emit_batch([record], ignore_display)
+        finally:
+            self._release_lock()
+
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Emits a batch of log records by encoding them into the current segment of the log file with a
+        single write. Must be called with the handler lock held.
+
+        :param records: Log records to emit.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        if self._detached:
+            return
+
+        if self._file_stream is None:
+            self._open_file_stream()
+            self._last_flush = time.monotonic()
+
+        try:
+            # Without a table, a write failed and the records start a new segment.
+            table = {} if self._table is None else self._table
+            size = len(table)
+            count = table.get(None)
+            try:
+                encode = self._formatter.encode
+                data = b''.join([encode(record, table) for record in records])
+            except BaseException:
+                # Forget the strings added by records that were not written, so they are written again.
+                for key in list(table)[size:]:
+                    del table[key]
+                if count is not None:
+                    table[None] = count
+                raise
+
+            if self._table is None:
+                data = BinaryFormatter.MAGIC + data
+            try:
+                self._file_stream.write(data)
+            except BaseException:
+                # Part of the data, with strings later records would refer to, may not have been written.
+                self._table = None
+                raise
+            self._table = table
+
+            self._count_written(max(record.level_number for record in records), len(data), len(records))
+        finally:
+            if not self._keep_open:
+                self._close_file_stream()
+
+
+class RingBufferHandler(Handler):
+    """
+    Subclass of Handler responsible for handling log records by writing them into a fixed-size memory-mapped
+    file used as a circular buffer, keeping only the most recent records. Writing a record copies it into the
+    mapping without any system call, and the operating system writes the pages back to the file, so the
+    records survive a crash of the process and can be reconstructed with dump.
+    """
+
+    # Magic bytes identifying a ring buffer file.
+    MAGIC = b'PLMRING1'
+
+    # Smallest size of a ring buffer file in bytes.
+    MIN_SIZE = 4096
+
+    # Header of the file: magic, data capacity, and the head and tail positions of the buffered
+    # records, counted in bytes written since the file was created.
+    _HEADER = struct.Struct('<8sQQQ')
+
+    # Offsets of the head and tail positions in the header.
+    _HEAD_OFFSET = 16
+    _TAIL_OFFSET = 24
+
+    # Position stored in the header.
+    _POSITION = struct.Struct('<Q')
+
+    # Frame preceding every record: length of the encoded record.
+    _FRAME = struct.Struct('<I')
+
+    def __init__(
+            self,
+            name: str = None,
+            level: int = 10,
+            colorization=None,
+            formatter: Formatter = DefaultFormatter(),
+            file_name: str = 'flight.ring',
+            size: int = 8 * 1024 * 1024,
+            encoding: str = 'UTF-8'
+    ) -> None:
+        """
+        Initializes a RingBufferHandler object.
+
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level. Defaults to DEBUG level (10).
+        :type level: int | LogLevel
+        :param colorization: Colorization object for the handler.
+        :type colorization: pycolorecho.ColorMapper
+        :param formatter: Formatter object for formatting log records.
+        :type formatter: Formatter
+        :param file_name: Name of the ring buffer file. Defaults to 'flight.ring'.
+        :type file_name: str
+        :param size: Size of the ring buffer file in bytes, header included. Defaults to 8 MiB.
+        :type size: int
+        :param encoding: Encoding of the records in the ring buffer file. Defaults to 'UTF-8'.
+        :type encoding: str
+        """
+        if not isinstance(file_name, str):
+            raise TypeError('file_name should be a string.')
+        elif not isinstance(size, int) or isinstance(size, bool):
+            raise TypeError('size should be an integer.')
+        elif not isinstance(encoding, str):
+            raise TypeError('encoding should be a string.')
+        elif size < self.MIN_SIZE:
+            raise ValueError(f'size should be at least {self.MIN_SIZE} bytes.')
+
+        self._file_name = os.fspath(file_name)
+        self._size = size
+        self._capacity = size - self._HEADER.size
+        self._encoding = encoding
+        self._buffer = None
+        self._head = 0
+        self._tail = 0
+        self._detached = False
+
+        super().__init__(name, level, colorization, formatter)
+
+    @property
+    def encoding(self) -> str:
+        """
+        Gets the encoding of the records in the ring buffer file.
+
+        :return: Encoding of the records.
+        :rtype: str
+        """
+        return self._encoding
+
+    @property
+    def filename(self) -> str:
+        """
+        Gets the name of the ring buffer file.
+
+        :return: Name of the ring buffer file.
+        :rtype: str
+        """
+        return self._file_name
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the size of the ring buffer file in bytes, header included.
+
+        :return: Size of the ring buffer file.
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def used(self) -> int:
+        """
+        Gets the number of bytes taken by the records currently kept in the ring buffer.
+
+        :return: Number of bytes in use.
+        :rtype: int
+        """
+        return self._head - self._tail
+
+    @staticmethod
+    def _read(buffer: Any, capacity: int, position: int, length: int) -> bytes:
+        """
+        Reads bytes from the data region of a ring buffer, wrapping around its end.
+
+        :param buffer: Mapping of the ring buffer file.
+        :type buffer: mmap.mmap
+        :param capacity: Capacity of the data region in bytes.
+        :type capacity: int
+        :param position: Position to read from, counted in bytes written since creation.
+        :type position: int
+        :param length: Number of bytes to read.
+        :type length: int
+        :return: Bytes read.
+        :rtype: bytes
+        """
+        offset = position % capacity
+        start = RingBufferHandler._HEADER.size + offset
+        if offset + length <= capacity:
+            return buffer[start:start + length]
+
+        first = capacity - offset
+        return buffer[start:start + first] + buffer[
+            RingBufferHandler._HEADER.size:RingBufferHandler._HEADER.size + length - first
+        ]
+
+    def _write(self, position: int, data: bytes) -> None:
+        """
+        Copies bytes into the data region of the ring buffer, wrapping around its end. Must be called
+        with the handler lock held.
+
+        :param position: Position to write at, counted in bytes written since creation.
+        :type position: int
+        :param data: Bytes to write.
+        :type data: bytes
+        """
+        offset = position % self._capacity
+        start = self._HEADER.size + offset
+        first = min(len(data), self._capacity - offset)
+        self._buffer[start:start + first] = data[:first]
+        if first < len(data):
+            self._buffer[self._HEADER.size:self._HEADER.size + len(data) - first] = data[first:]
+
+    def _open_buffer(self) -> None:
+        """
+        Maps the ring buffer file, creating it if needed. The records of an existing file with the same size
+        are kept and new records are appended after them, otherwise the buffer starts empty. Must be called
+        with the handler lock held.
+        """
+        fd = os.open(self._file_name, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            if os.fstat(fd).st_size != self._size:
+                os.ftruncate(fd, self._size)
+            self._buffer = mmap.mmap(fd, self._size)
+        finally:
+            os.close(fd)
+
+        magic, capacity, head, tail = self._HEADER.unpack_from(self._buffer)
+        if magic != self.MAGIC or capacity != self._capacity or not 0 <= head - tail <= capacity:
+            head = tail = 0
+            self._HEADER.pack_into(self._buffer, 0, self.MAGIC, self._capacity, head, tail)
+
+        self._head = head
+        self._tail = tail
+
+    def _write_record(self, message: str) -> None:
+        """
+        Appends a formatted record to the ring buffer, dropping the oldest records it overwrites. Records
+        larger than the buffer are truncated. The tail is moved before the record is copied and the head
+        after, so the header describes complete records at any time. Must be called with the handler lock
+        held.
+
+        :param message: Formatted record to write.
+        :type message: str
+        """
+        if self._buffer is None:
+            self._open_buffer()
+
+        data = message.encode(self._encoding, 'replace')[:self._capacity - self._FRAME.size]
+        frame_size = self._FRAME.size + len(data)
+
+        tail = self._tail
+        while self._head + frame_size - tail > self._capacity:
+            tail += self._FRAME.size + self._FRAME.unpack(
+                self._read(self._buffer, self._capacity, tail, self._FRAME.size)
+            )[0]
+        if tail != self._tail:
+            self._tail = tail
+            self._POSITION.pack_into(self._buffer, self._TAIL_OFFSET, tail)
+
+        offset = self._head % self._capacity
+        if offset + frame_size <= self._capacity:
+            start = self._HEADER.size + offset
+            self._FRAME.pack_into(self._buffer, start, len(data))
+            self._buffer[start + self._FRAME.size:start + frame_size] = data
+        else:
+            self._write(self._head, self._FRAME.pack(len(data)) + data)
+        self._head += frame_size
+        self._POSITION.pack_into(self._buffer, self._HEAD_OFFSET, self._head)
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Detaches the ring buffer in a forked child. The buffer belongs to the process that created the
+        handler, so the child stops recording rather than overwriting the records of the parent.
+        """
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        self._detached = True
+
+    def close(self) -> None:
+        """
+        Writes the ring buffer back to its file and unmaps it.
+        """
+        self._acquire_lock()
+        try:
+            if self._buffer is not None:
+                self._buffer.flush()
+                self._buffer.close()
+                self._buffer = None
+        finally:
+            self._release_lock()
+        super().close()
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Emits a log record by copying it into the ring buffer. Records are never displayed on the terminal.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        if self._detached:
+            return
+
+        formatted_record = self.format(record)
+        self._acquire_lock()
+        try:
+            self._write_record(formatted_record)
+        finally:
+            self._release_lock()
+
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Emits a batch of log records by copying them into the ring buffer. Must be called with the handler
+        lock held.
+
+        :param records: Log records to emit.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        if self._detached:
+            return
+
+        for record in records:
+            self._write_record(self.format(record))
+
+    def flush(self) -> None:
+        """
+        Writes the modified pages of the ring buffer back to its file. Records already survive a crash of the
+        process without flushing, flushing only protects them against a crash of the operating system.
+        """
+        self._acquire_lock()
+        try:
+            if self._buffer is not None:
+                self._buffer.flush()
+        finally:
+            self._release_lock()
+
+    @staticmethod
+    def dump(file_name: str, encoding: str = 'UTF-8') -> list:
+        """
+        Reconstructs the records kept in a ring buffer file, oldest first. The file can be read while a
+        handler is still writing to it or after the process writing to it crashed.
+
+        :param file_name: Name of the ring buffer file.
+        :type file_name: str
+        :param encoding: Encoding of the records in the ring buffer file. Defaults to 'UTF-8'.
+        :type encoding: str
+        :return: Formatted records, oldest first.
+        :rtype: list
+        """
+        if not isinstance(file_name, str):
+            raise TypeError('file_name should be a string.')
+        elif not isinstance(encoding, str):
+            raise TypeError('encoding should be a string.')
+
+        header = RingBufferHandler._HEADER
+        frame = RingBufferHandler._FRAME
+        with open(file_name, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < header.size:
+                raise ValueError('file_name should be a ring buffer file.')
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                magic, capacity, head, tail = header.unpack_from(buffer)
+                if magic != RingBufferHandler.MAGIC or capacity != len(buffer) - header.size \
+                        or not 0 <= head - tail <= capacity:
+                    raise ValueError('file_name should be a ring buffer file.')
+
+                records = []
+                position = tail
+                while position + frame.size <= head:
+                    length = frame.unpack(RingBufferHandler._read(buffer, capacity, position, frame.size))[0]
+                    if position + frame.size + length > head:
+                        break
+                    records.append(RingBufferHandler._read(
+                        buffer, capacity, position + frame.size, length
+                    ).decode(encoding, 'replace'))
+                    position += frame.size + length
+
+        return records
+
+
+class StderrHandler(Handler):
+    """
+    Subclass of Handler responsible for handling log records by writing them to the standard error stream (stderr).
+    """
+    TERMINATOR = '\n'
+
+    def __init__(self, level: int = 30) -> None:
+        """
+        Initializes a StderrHandler object.
+
+        :param level: Handler log level. Defaults to WARNING level (30).
+        :type level: int
+        """
+        super().__init__(level=level)
+
+    @property
+    def stream(self) -> TextIO:
+        """
+        Gets the standard error stream (stderr).
+
+        :return: Standard error stream (stderr).
+        :rtype: TextIO
+        """
+        return sys.stderr
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Emits a log record to the standard error stream (stderr).
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        self.stream.write(self.format(record) + self.TERMINATOR)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Flushes the standard error stream (stderr).
+        """
+        self.stream.flush()
+
+
+class OverflowPolicy:
+    """
+    This class represents the policies a QueueHandler applies when its queue is full: block the
+    logging thread until there is room, drop the new record, drop the oldest queued record, or drop
+    new records below a given log level while blocking for the others.
+    """
+    BLOCK: str = 'block'  # Constant representing blocking until the queue has room
+    DROP_NEWEST: str = 'drop_newest'  # Constant representing dropping the record being queued
+    DROP_OLDEST: str = 'drop_oldest'  # Constant representing dropping the oldest queued record
+    DROP_BELOW_LEVEL: str = 'drop_below_level'  # Constant representing dropping records below a level
+
+    _policies = (BLOCK, DROP_NEWEST, DROP_OLDEST, DROP_BELOW_LEVEL)
+
+    @classmethod
+    def check_policy(cls, policy: str) -> str:
+        """
+        Checks if the provided policy exists and returns the same value if exists, else raise ValueError.
+
+        :param policy: The overflow policy to check.
+        :type policy: str
+        :return: Provided overflow policy if it exists.
+        :rtype: str
+        :raises ValueError: If the provided policy does not exist.
+        """
+        if not isinstance(policy, str):
+            raise TypeError('policy should be a string.')
+
+        if policy not in cls._policies:
+            raise ValueError(f'Invalid overflow policy: {policy}')
+        return policy
+
+
+class QueueHandler(Handler):
+    """
+    Subclass of Handler that puts log records on a bounded queue instead of formatting and writing
+    them, so the logging thread never waits on I/O. A QueueListener drains the queue on a background
+    thread into the handlers doing the actual work. When the queue is full, the overflow policy
+    decides whether to block or which record to drop; dropped records are counted. The queue is
+    thread-safe, so records are queued without the handler lock and a producer blocked on a full
+    queue never holds up producers whose records are dropped.
+    """
+
+    def __init__(
+            self,
+            name: str = None,
+            level: int = 20,
+            capacity: int = 10000,
+            overflow_policy: str = OverflowPolicy.BLOCK,
+            drop_level: int = 30
+    ) -> None:
+        """
+        Initializes a QueueHandler object.
+
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int
+        :param capacity: Maximum number of queued records. Defaults to 10000.
+        :type capacity: int
+        :param overflow_policy: Policy applied when the queue is full. Defaults to OverflowPolicy.BLOCK.
+        :type overflow_policy: str
+        :param drop_level: Log level below which records are dropped when the queue is full, used by
+            OverflowPolicy.DROP_BELOW_LEVEL. Defaults to WARNING level (30).
+        :type drop_level: int
+        """
+        if not isinstance(capacity, int):
+            raise TypeError('capacity should be an integer.')
+        elif not isinstance(drop_level, int):
+            raise TypeError('drop_level should be an integer.')
+
+        if capacity <= 0:
+            raise ValueError('capacity should be greater than 0.')
+
+        self._overflow_policy = OverflowPolicy.check_policy(overflow_policy)
+        self._drop_level = pyloggermanager.LogLevel.check_level(drop_level)
+        self._queue = queue.Queue(capacity)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()  # Guards the dropped records counter
+        self._listener = None
+        super().__init__(name, level)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the maximum number of queued records.
+
+        :return: Queue capacity.
+        :rtype: int
+        """
+        return self._queue.maxsize
+
+    @property
+    def dropped(self) -> int:
+        """
+        Gets the number of records dropped because the queue was full.
+
+        :return: Number of dropped records.
+        :rtype: int
+        """
+        return self._dropped
+
+    @property
+    def drop_level(self) -> int:
+        """
+        Gets the log level below which records are dropped when the queue is full.
+
+        :return: Drop level.
+        :rtype: int
+        """
+        return self._drop_level
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the handlers of the attached listener use the caller details of records.
+        Without a listener the records may go anywhere, so the caller details are assumed to be needed.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        if self._listener is None:
+            return True
+        return any(handler.needs_caller for handler in self._listener.handlers)
+
+    @property
+    def overflow_policy(self) -> str:
+        """
+        Gets the policy applied when the queue is full.
+
+        :return: Overflow policy.
+        :rtype: str
+        """
+        return self._overflow_policy
+
+    @property
+    def queue(self) -> queue.Queue:
+        """
+        Gets the queue holding (record, ignore_display) items.
+
+        :return: Record queue.
+        :rtype: queue.Queue
+        """
+        return self._queue
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Replaces the queue inherited from the parent process, whose records are handled by the parent,
+        and restarts the listener thread if it was running.
+        """
+        self._queue = queue.Queue(self._queue.maxsize)
+        self._dropped_lock = threading.Lock()
+        listener = self._listener
+        if listener is not None and listener._thread is not None:
+            listener._thread = None
+            listener.start()
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Puts the log record on the queue, applying the overflow policy when the queue is full.
+        The message is interpolated first, so later changes to its arguments do not affect it.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        _ = record.message
+        item = (record, ignore_display)
+
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        policy = self._overflow_policy
+        if policy == OverflowPolicy.DROP_NEWEST or (
+                policy == OverflowPolicy.DROP_BELOW_LEVEL and record.level_number < self._drop_level
+        ):
+            self._count_dropped()
+        elif policy == OverflowPolicy.DROP_OLDEST:
+            while True:
+                try:
+                    oldest = self._queue.get_nowait()
+                    self._queue.task_done()
+                    self._count_dropped()
+                    if oldest is None:
+                        # The listener is stopping, keep its stop sentinel and drop the new record instead
+                        item = None
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    pass
+        else:
+            self._queue.put(item)
+
+    def _count_dropped(self) -> None:
+        """
+        Counts a dropped record.
+        """
+        with self._dropped_lock:
+            self._dropped += 1
+
+    def flush(self) -> None:
+        """
+        Does nothing, queued records are written by the QueueListener draining the queue.
+        """
+        pass
+
+    def handle(self, record, ignore_display: bool) -> None:
+        """
+        Handles a log record by putting it on the queue, without acquiring the handler lock.
+
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :param record: Log record.
+        """
+        if not isinstance(record, pyloggermanager.Record):
+            raise TypeError('record should be of Record type.')
+        elif not isinstance(ignore_display, bool):
+            raise TypeError('ignore_display should be a boolean.')
+
+        self.emit(record, ignore_display)
+
+    def handle_batch(self, records: list, ignore_display: bool) -> None:
+        """
+        Handles a batch of log records by putting them on the queue, without acquiring the handler lock.
+
+        :param records: Log records.
+        :type records: list
+        :param ignore_display: Flag to indicate if log messages should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        if not isinstance(records, list) or \
+                not all(isinstance(record, pyloggermanager.Record) for record in records):
+            raise TypeError('records should be a list of Record type.')
+        elif not isinstance(ignore_display, bool):
+            raise TypeError('ignore_display should be a boolean.')
+
+        self.emit_batch(records, ignore_display)
+
+
+class QueueListener:
+    """
+    Drains the queue of a QueueHandler on a background thread, passing every record to the given
+    handlers whose level accepts it. Stopping the listener processes the records still queued.
+    """
+
+    def __init__(self, queue_handler: QueueHandler, handlers: list) -> None:
+        """
+        Initializes a QueueListener object.
+
+        :param queue_handler: Queue handler whose queue is drained.
+        :type queue_handler: QueueHandler
+        :param handlers: Handlers receiving the queued records.
+        :type handlers: list
+        """
+        if not isinstance(queue_handler, QueueHandler):
+            raise TypeError('queue_handler should be of QueueHandler type.')
+        elif not isinstance(handlers, list):
+            raise TypeError('handlers should be a list.')
+        elif not all(issubclass(type(handler), Handler) for handler in handlers):
+            raise TypeError('handlers should be a list of Handler subclasses.')
+
+        self._queue_handler = queue_handler
+        self._handlers = tuple(handlers)
+        self._thread = None
+        queue_handler._listener = self
+        pyloggermanager.Logger._invalidate_caches()
+
+    @property
+    def handlers(self) -> tuple:
+        """
+        Gets the handlers receiving the queued records.
+
+        :return: Handlers.
+        :rtype: tuple
+        """
+        return self._handlers
+
+    @property
+    def queue_handler(self) -> QueueHandler:
+        """
+        Gets the queue handler whose queue is drained.
+
+        :return: Queue handler.
+        :rtype: QueueHandler
+        """
+        return self._queue_handler
+
+    def _monitor(self) -> None:
+        """
+        Passes queued records to the handlers until the stop sentinel is received.
+        """
+        record_queue = self._queue_handler.queue
+        while True:
+            item = record_queue.get()
+            try:
+                if item is None:
+                    break
+                self.handle(*item)
+            finally:
+                record_queue.task_done()
+
+    def handle(self, record, ignore_display: bool) -> None:
+        """
+        Passes a record to every handler whose level accepts it. Errors raised by a handler are
+        reported on stderr so they do not stop the listener.
+
+        :param record: Log record to handle.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        for handler in self._handlers:
+            if record.level_number >= handler.level:
+                try:
+                    handler.handle(record, ignore_display)
+                except Exception:
+                    traceback.print_exc(file=sys.stderr)
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the background thread is running.
+
+        :return: True if the listener is running, False otherwise.
+        :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the background thread draining the queue.
+        """
+        if self.is_alive():
+            raise RuntimeError('QueueListener is already started.')
+
+        self._thread = threading.Thread(target=self._monitor, name='QueueListener', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Processes the records still queued, then stops the background thread and flushes the handlers.
+        """
+        if self._thread is None:
+            return
+
+        self._queue_handler.queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except NotImplementedError:
+                pass
+
+
+class AsyncHandler(Handler):
+    """
+    Subclass of Handler for asyncio applications that never blocks the event loop on I/O. Emitting a
+    record only appends it to a buffer; the buffered records are passed in batches to the target
+    handlers on a dedicated executor thread, and the targets are flushed once per batch. Pending
+    records can be awaited with 'drain', or waited for with 'flush'.
+    """
+
+    def __init__(
+            self,
+            handlers: list,
+            name: str = None,
+            level: int = 20,
+            batch_size: int = 100,
+            executor: concurrent.futures.Executor = None
+    ) -> None:
+        """
+        Initializes an AsyncHandler object.
+
+        :param handlers: Handlers receiving the records.
+        :type handlers: list
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int
+        :param batch_size: Maximum number of records written between two flushes of the targets. Defaults to 100.
+        :type batch_size: int
+        :param executor: Executor running the writes. Defaults to a dedicated single thread executor.
+        :type executor: concurrent.futures.Executor
+        """
+        if not isinstance(handlers, list):
+            raise TypeError('handlers should be a list.')
+        elif not all(issubclass(type(handler), Handler) for handler in handlers):
+            raise TypeError('handlers should be a list of Handler subclasses.')
+        elif not isinstance(batch_size, int):
+            raise TypeError('batch_size should be an integer.')
+        elif not isinstance(executor, (concurrent.futures.Executor, NoneType)):
+            raise TypeError('executor should be of concurrent.futures.Executor type.')
+
+        if batch_size <= 0:
+            raise ValueError('batch_size should be greater than 0.')
+
+        self._handlers = tuple(handlers)
+        self._batch_size = batch_size
+        self._own_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix='AsyncHandler')
+        self._pending = collections.deque()
+        self._future = None
+        self._closed = False
+        super().__init__(name, level)
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Gets the maximum number of records written between two flushes of the targets.
+
+        :return: Batch size.
+        :rtype: int
+        """
+        return self._batch_size
+
+    @property
+    def handlers(self) -> tuple:
+        """
+        Gets the handlers receiving the records.
+
+        :return: Handlers.
+        :rtype: tuple
+        """
+        return self._handlers
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the target handlers use the caller details of records.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        return any(handler.needs_caller for handler in self._handlers)
+
+    @property
+    def pending(self) -> int:
+        """
+        Gets the number of records waiting to be written.
+
+        :return: Number of pending records.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drops the records buffered by the parent process, which writes them itself, and replaces the
+        dedicated executor, whose thread does not exist in the child.
+        """
+        self._pending = collections.deque()
+        self._future = None
+        if self._own_executor and not self._closed:
+            self._executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix='AsyncHandler')
+
+    def _write(self, batch: list) -> None:
+        """
+        Passes a batch of records to every target handler whose level accepts them, then flushes the
+        targets. Errors raised by a target are reported on stderr so the remaining records are written.
+
+        :param batch: List of (record, ignore_display) items.
+        :type batch: list
+        """
+        for record, ignore_display in batch:
+            for handler in self._handlers:
+                if record.level_number >= handler.level:
+                    try:
+                        handler.handle(record, ignore_display)
+                    except Exception:
+                        traceback.print_exc(file=sys.stderr)
+
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except NotImplementedError:
+                pass
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def _drain(self) -> None:
+        """
+        Writes the pending records in batches until none are left. Runs on the executor.
+        """
+        while True:
+            self._acquire_lock()
+            try:
+                batch = [self._pending.popleft() for _ in range(min(self._batch_size, len(self._pending)))]
+                if not batch:
+                    self._future = None
+                    return
+            finally:
+                self._release_lock()
+
+            self._write(batch)
+
+    def close(self) -> None:
+        """
+        Writes the pending records, shuts down the dedicated executor and closes the handler.
+        Records emitted afterwards are written synchronously.
+        """
+        self.flush()
+        self._closed = True
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+        super().close()
+
+    async def drain(self) -> None:
+        """
+        Waits, without blocking the event loop, until the pending records have been written.
+        """
+        while True:
+            future = self._future
+            if future is None:
+                return
+            await asyncio.wrap_future(future)
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Buffers the log record and schedules the writer on the executor if it is not running.
+        The message is interpolated first, so later changes to its arguments do not affect it.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        _ = record.message
+        if self._closed:
+            self._write([(record, ignore_display)])
+            return
+
+        self._acquire_lock()
+        try:
+            self._pending.append((record, ignore_display))
+            if self._future is None:
+                self._future = self._executor.submit(self._drain)
+        finally:
+            self._release_lock()
+
+    def flush(self) -> None:
+        """
+        Blocks until the pending records have been written. Use 'drain' from coroutines instead.
+        """
+        while True:
+            future = self._future
+            if future is None:
+                return
+            future.result()
+
+
+def _forward_batch(target: Handler, items: Any) -> None:
+    """
+    Forwards buffered records accepted by the target's level to the target in batches of records
+    sharing the same display flag, then flushes the target.
+
+    :param target: Handler receiving the records.
+    :type target: Handler
+    :param items: Iterable of (record, ignore_display) items.
+    :type items: Any
+    """
+    target_level = target.level
+    for ignore_display, group in itertools.groupby(items, key=lambda item: item[1]):
+        target.handle_batch([record for record, _ in group if record.level_number >= target_level], ignore_display)
+
+    try:
+        target.flush()
+    except NotImplementedError:
+        pass
+
+
+class MemoryHandler(Handler):
+    """
+    Subclass of Handler that buffers log records in memory and forwards them to a target handler
+    in one batch when the buffer is full, when a record at or above the flush level arrives, or on
+    the first record after the flush interval elapsed. The target receives each batch through
+    'handle_batch', so it acquires its lock once and can format and write the batch at once.
+    """
+
+    def __init__(
+            self,
+            target: Handler,
+            name: str = None,
+            level: int = 20,
+            capacity: int = 100,
+            flush_level: int = 40,
+            interval: int = 0
+    ) -> None:
+        """
+        Initializes a MemoryHandler object.
+
+        :param target: Handler receiving the buffered records.
+        :type target: Handler
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int
+        :param capacity: Number of buffered records that triggers a flush. Defaults to 100.
+        :type capacity: int
+        :param flush_level: Log level at or above which a record triggers a flush. Defaults to ERROR level (40).
+        :type flush_level: int
+        :param interval: Flush on the first record after this many milliseconds elapsed since the last flush,
+            0 to disable. Defaults to 0.
+        :type interval: int
+        """
+        if not issubclass(type(target), Handler):
+            raise TypeError('target should be subclass of Handler.')
+        elif not isinstance(capacity, int):
+            raise TypeError('capacity should be an integer.')
+        elif not isinstance(flush_level, int):
+            raise TypeError('flush_level should be an integer.')
+        elif not isinstance(interval, int):
+            raise TypeError('interval should be an integer.')
+
+        if capacity <= 0:
+            raise ValueError('capacity should be greater than 0.')
+        elif interval < 0:
+            raise ValueError('interval should not be negative.')
+
+        self._target = target
+        self._capacity = capacity
+        self._flush_level = pyloggermanager.LogLevel.check_level(flush_level)
+        self._interval = interval
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        super().__init__(name, level)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the number of buffered records that triggers a flush.
+
+        :return: Buffer capacity.
+        :rtype: int
+        """
+        return self._capacity
+
+    @property
+    def flush_level(self) -> int:
+        """
+        Gets the log level at or above which a record triggers a flush.
+
+        :return: Flush level.
+        :rtype: int
+        """
+        return self._flush_level
+
+    @property
+    def interval(self) -> int:
+        """
+        Gets the flush interval in milliseconds.
+
+        :return: Flush interval in milliseconds.
+        :rtype: int
+        """
+        return self._interval
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the target handler uses the caller details of records.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        return self._target.needs_caller
+
+    @property
+    def pending(self) -> int:
+        """
+        Gets the number of buffered records.
+
+        :return: Number of buffered records.
+        :rtype: int
+        """
+        return len(self._buffer)
+
+    @property
+    def target(self) -> Handler:
+        """
+        Gets the handler receiving the buffered records.
+
+        :return: Target handler.
+        :rtype: Handler
+        """
+        return self._target
+
+    @target.setter
+    def target(self, value: Handler) -> None:
+        """
+        Sets the handler receiving the buffered records. The records buffered so far are flushed
+        to the previous target first.
+
+        :param value: Target handler.
+        :type value: Handler
+        """
+        if not issubclass(type(value), Handler):
+            raise TypeError('target should be subclass of Handler.')
+
+        self._acquire_lock()
+        try:
+            self.flush()
+            self._target = value
+        finally:
+            self._release_lock()
+        pyloggermanager.Logger._invalidate_caches()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drops the records buffered by the parent process, which forwards them itself.
+        """
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Flushes the buffered records to the target and closes the handler. The target is not closed.
+        """
+        self.flush()
+        super().close()
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Buffers the log record and flushes the buffer when the record triggers a flush. The message
+        is interpolated first, so later changes to its arguments do not affect it.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        _ = record.message
+        self._acquire_lock()
+        try:
+            self._buffer.append((record, ignore_display))
+            if len(self._buffer) >= self._capacity or record.level_number >= self._flush_level or (
+                    0 < self._interval <= (time.monotonic() - self._last_flush) * 1000
+            ):
+                self.flush()
+        finally:
+            self._release_lock()
+
+    def flush(self) -> None:
+        """
+        Forwards the buffered records accepted by the target's level to the target in batches of
+        records sharing the same display flag, then flushes the target.
+        """
+        self._acquire_lock()
+        try:
+            buffer, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+
+            if buffer:
+                _forward_batch(self._target, buffer)
+        finally:
+            self._release_lock()
+
+
+class TailSamplingHandler(Handler):
+    """
+    Subclass of Handler implementing tail-based sampling. Within a sampling context, opened with
+    'TailSamplingHandler.context' around a request or task, records below the buffer level are kept
+    in a bounded ring per context instead of being written. When a record at or above the trigger
+    level is logged in the same context, the ring is forwarded to the target ahead of it and later
+    records of the context are forwarded directly; when the context ends without one, the ring is
+    discarded. Records at or above the buffer level and records logged outside a context are
+    forwarded directly, so buffered records may reach the target after them.
+    """
+
+    def __init__(
+            self,
+            target: Handler,
+            name: str = None,
+            level: int = 10,
+            capacity: int = 1000,
+            buffer_level: int = 30,
+            trigger_level: int = 40
+    ) -> None:
+        """
+        Initializes a TailSamplingHandler object.
+
+        :param target: Handler receiving the sampled records.
+        :type target: Handler
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level. Defaults to DEBUG level (10).
+        :type level: int
+        :param capacity: Maximum number of records buffered per context; the oldest are discarded first.
+            Defaults to 1000.
+        :type capacity: int
+        :param buffer_level: Log level below which records are buffered. Defaults to WARNING level (30).
+        :type buffer_level: int
+        :param trigger_level: Log level at or above which the buffered records of the context are
+            forwarded. Defaults to ERROR level (40).
+        :type trigger_level: int
+        """
+        if not issubclass(type(target), Handler):
+            raise TypeError('target should be subclass of Handler.')
+        elif not isinstance(capacity, int):
+            raise TypeError('capacity should be an integer.')
+        elif not isinstance(buffer_level, int):
+            raise TypeError('buffer_level should be an integer.')
+        elif not isinstance(trigger_level, int):
+            raise TypeError('trigger_level should be an integer.')
+
+        if capacity <= 0:
+            raise ValueError('capacity should be greater than 0.')
+
+        buffer_level = pyloggermanager.LogLevel.check_level(buffer_level)
+        trigger_level = pyloggermanager.LogLevel.check_level(trigger_level)
+        if buffer_level > trigger_level:
+            raise ValueError('buffer_level should not be greater than trigger_level.')
+
+        self._target = target
+        self._capacity = capacity
+        self._buffer_level = buffer_level
+        self._trigger_level = trigger_level
+        self._rings = {}
+        self._triggered = set()
+        self._discarded = 0
+        super().__init__(name, level)
+        _samplingHandlers.add(self)
+
+    @property
+    def buffer_level(self) -> int:
+        """
+        Gets the log level below which records are buffered.
+
+        :return: Buffer level.
+        :rtype: int
+        """
+        return self._buffer_level
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the maximum number of records buffered per context.
+
+        :return: Capacity per context.
+        :rtype: int
+        """
+        return self._capacity
+
+    @property
+    def discarded(self) -> int:
+        """
+        Gets the number of buffered records discarded because their context ended without a
+        trigger record or because its ring was full.
+
+        :return: Number of discarded records.
+        :rtype: int
+        """
+        return self._discarded
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the target handler uses the caller details of records.
+
+        :return: True if the caller details are needed, False otherwise.
+        :rtype: bool
+        """
+        return self._target.needs_caller
+
+    @property
+    def pending(self) -> int:
+        """
+        Gets the number of records buffered across all contexts.
+
+        :return: Number of buffered records.
+        :rtype: int
+        """
+        return sum(len(ring) for ring in list(self._rings.values()))
+
+    @property
+    def target(self) -> Handler:
+        """
+        Gets the handler receiving the sampled records.
+
+        :return: Target handler.
+        :rtype: Handler
+        """
+        return self._target
+
+    @property
+    def trigger_level(self) -> int:
+        """
+        Gets the log level at or above which the buffered records of the context are forwarded.
+
+        :return: Trigger level.
+        :rtype: int
+        """
+        return self._trigger_level
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drops the records buffered for the sampling contexts of the parent process.
+        """
+        self._rings.clear()
+        self._triggered.clear()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def context(context_id: str | int = None) -> Any:
+        """
+        Opens a sampling context for the current thread or asyncio task. Records logged inside it are
+        sampled together by every TailSamplingHandler, and their buffers are discarded when it ends.
+
+        :param context_id: Identifier of the context, such as a request id. Defaults to a new unique identifier.
+        :type context_id: str | int
+        :return: Context manager yielding the context identifier.
+        :rtype: Any
+        """
+        if not isinstance(context_id, Union[str, int, NoneType]):
+            raise TypeError('context_id should be a string or an integer.')
+
+        if context_id is None:
+            context_id = f'context-{next(_samplingContextSequence)}'
+
+        token = _samplingContext.set(context_id)
+        try:
+            yield context_id
+        finally:
+            _samplingContext.reset(token)
+            for handler in list(_samplingHandlers):
+                handler.end_context(context_id)
+
+    def close(self) -> None:
+        """
+        Discards the buffered records and closes the handler. The target is not closed.
+        """
+        _samplingHandlers.discard(self)
+        self._acquire_lock()
+        try:
+            for ring in self._rings.values():
+                self._discarded += len(ring)
+            self._rings.clear()
+            self._triggered.clear()
+        finally:
+            self._release_lock()
+        super().close()
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Buffers the log record in the ring of the current context, or forwards it to the target along
+        with the buffered records of the context when it is a trigger record.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        context_id = _samplingContext.get()
+        self._acquire_lock()
+        try:
+            if context_id is None or context_id in self._triggered or (
+                    self._buffer_level <= record.level_number < self._trigger_level
+            ):
+                if record.level_number >= self._target.level:
+                    self._target.handle(record, ignore_display)
+            elif record.level_number >= self._trigger_level:
+                ring = self._rings.pop(context_id, ())
+                self._triggered.add(context_id)
+                _forward_batch(self._target, [*ring, (record, ignore_display)])
+            else:
+                _ = record.message
+                ring = self._rings.get(context_id)
+                if ring is None:
+                    ring = self._rings[context_id] = collections.deque(maxlen=self._capacity)
+                elif len(ring) == self._capacity:
+                    self._discarded += 1
+                ring.append((record, ignore_display))
+        finally:
+            self._release_lock()
+
+    def end_context(self, context_id: str | int) -> None:
+        """
+        Discards the records buffered for a context that ended. Called when a sampling context exits.
+
+        :param context_id: Identifier of the context.
+        :type context_id: str | int
+        """
+        self._acquire_lock()
+        try:
+            self._discarded += len(self._rings.pop(context_id, ()))
+            self._triggered.discard(context_id)
+        finally:
+            self._release_lock()
+
+    def flush(self) -> None:
+        """
+        Flushes the target handler. Buffered records are only forwarded by a trigger record.
+        """
+        try:
+            self._target.flush()
+        except NotImplementedError:
+            pass
+
+
+class ProcessQueueHandler(Handler):
+    """
+    Subclass of Handler shipping log records to a ProcessQueueListener running in another process, so
+    a single writer process owns the real handlers and formats and writes the records of every process.
+    Emitting a record only appends it to a buffer; a sender thread puts the buffered records on the
+    multiprocessing queue in batches, pickling a whole batch at once. A process forked after records
+    were emitted starts its own sender thread on its first record.
+    """
+
+    def __init__(
+            self,
+            queue: multiprocessing.queues.Queue,
+            name: str = None,
+            level: int = 20,
+            batch_size: int = 100
+    ) -> None:
+        """
+        Initializes a ProcessQueueHandler object.
+
+        :param queue: Multiprocessing queue drained by the writer process, such as 'ProcessQueueListener.queue'.
+        :type queue: multiprocessing.Queue
+        :param name: Handle name.
+        :type name: str
+        :param level: Handler log level.
+        :type level: int
+        :param batch_size: Maximum number of records put on the queue at once. Defaults to 100.
+        :type batch_size: int
+        """
+        if not isinstance(queue, multiprocessing.queues.Queue):
+            raise TypeError('queue should be of multiprocessing.Queue type.')
+        elif not isinstance(batch_size, int):
+            raise TypeError('batch_size should be an integer.')
+
+        if batch_size <= 0:
+            raise ValueError('batch_size should be greater than 0.')
+
+        self._queue = queue
+        self._batch_size = batch_size
+        self._closed = False
+        self._reset_sender()
+        super().__init__(name, level)
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Gets the maximum number of records put on the queue at once.
+
+        :return: Batch size.
+        :rtype: int
+        """
+        return self._batch_size
+
+    @property
+    def needs_caller(self) -> bool:
+        """
+        Indicates whether the handler uses the caller details of records. The handlers formatting the
+        records run in the writer process, so the caller details are always shipped.
+
+        :return: True, as the caller details are needed.
+        :rtype: bool
+        """
+        return True
+
+    @property
+    def pending(self) -> int:
+        """
+        Gets the number of records waiting for the sender thread.
+
+        :return: Number of pending records.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    @property
+    def queue(self) -> multiprocessing.queues.Queue:
+        """
+        Gets the multiprocessing queue the records are put on.
+
+        :return: Multiprocessing queue.
+        :rtype: multiprocessing.Queue
+        """
+        return self._queue
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Drops the records buffered by the parent process, which ships them itself, and prepares a new
+        sender thread for the child.
+        """
+        self._reset_sender()
+
+    @staticmethod
+    def _prepare(record) -> Any:
+        """
+        Returns a record that can be pickled. Tracebacks cannot be pickled, so the traceback of the
+        exception information of a record is formatted into a copy of its stack information.
+
+        :param record: Log record to ship.
+        :type record: Record
+        :return: Log record to ship.
+        :rtype: Record
+        """
+        _ = record.message
+        if record.exec_info and record.exec_info[2] is not None:
+            exc_type, exc_value, exc_traceback = record.exec_info
+            record = copy.copy(record)
+            record.exec_info = (exc_type, exc_value, None)
+            formatted = ''.join(traceback.format_tb(exc_traceback)).rstrip('\n')
+            record.stack_info = f'{record.stack_info}\n{formatted}' if record.stack_info else formatted
+
+        return record
+
+    def _reset_sender(self) -> None:
+        """
+        Creates the buffer and the sender state of the current process.
+        """
+        self._pid = os.getpid()
+        self._pending = collections.deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._sender = None
+        self._sending = False
+
+    def _send(self) -> None:
+        """
+        Puts the buffered records on the queue in batches until the handler is closed.
+        Runs on the sender thread; errors are reported on stderr.
+        """
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                batch = [self._pending.popleft() for _ in range(min(len(self._pending), self._batch_size))]
+                self._sending = True
+
+            try:
+                self._queue.put(batch)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Puts the buffered records on the queue, stops the sender thread and closes the handler.
+        Records emitted afterwards are put on the queue directly.
+        """
+        if self._pid == os.getpid():
+            self.flush()
+            with self._condition:
+                self._closed = True
+                sender = self._sender
+                self._condition.notify_all()
+            if sender is not None:
+                sender.join()
+
+        self._closed = True
+        super().close()
+
+    def emit(self, record, ignore_display: bool) -> None:
+        """
+        Buffers the log record for the sender thread, starting it on the first record of the process.
+
+        :param record: Log record to emit.
+        :type record: Record
+        :param ignore_display: Flag to indicate if log message should be displayed on terminal.
+        :type ignore_display: bool
+        """
+        item = (self._prepare(record), ignore_display)
+        if self._closed:
+            self._queue.put([item])
+            return
+
+        if self._pid != os.getpid():
+            self._reset_sender()
+
+        with self._condition:
+            self._pending.append(item)
+            if self._sender is None:
+                self._sender = threading.Thread(target=self._send, name='ProcessQueueHandler', daemon=True)
+                self._sender.start()
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """
+        Blocks until the buffered records have been put on the queue.
+        """
+        if self._pid != os.getpid():
+            return
+
+        with self._condition:
+            while self._sender is not None and (self._pending or self._sending):
+                self._condition.wait()
+
+
+class ProcessQueueListener:
+    """
+    Single writer for records shipped by ProcessQueueHandlers in other processes. Drains a
+    multiprocessing queue on a background thread of the process that starts it, passing the
+    records to the given handlers in batches through 'handle_batch' and flushing the handlers
+    once per batch. Stopping the listener processes the records still queued.
+    """
+
+    def __init__(self, handlers: list, queue: multiprocessing.queues.Queue = None, batch_size: int = 1000) -> None:
+        """
+        Initializes a ProcessQueueListener object.
+
+        :param handlers: Handlers receiving the records.
+        :type handlers: list
+        :param queue: Multiprocessing queue to drain. Defaults to a new queue.
+        :type queue: multiprocessing.Queue
+        :param batch_size: Maximum number of records passed to the handlers at once. Defaults to 1000.
+        :type batch_size: int
+        """
+        if not isinstance(handlers, list):
+            raise TypeError('handlers should be a list.')
+        elif not all(issubclass(type(handler), Handler) for handler in handlers):
+            raise TypeError('handlers should be a list of Handler subclasses.')
+        elif not isinstance(queue, (multiprocessing.queues.Queue, NoneType)):
+            raise TypeError('queue should be of multiprocessing.Queue type.')
+        elif not isinstance(batch_size, int):
+            raise TypeError('batch_size should be an integer.')
+
+        if batch_size <= 0:
+            raise ValueError('batch_size should be greater than 0.')
+
+        self._handlers = tuple(handlers)
+        self._queue = queue if queue is not None else multiprocessing.Queue()
+        self._batch_size = batch_size
+        self._thread = None
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Gets the maximum number of records passed to the handlers at once.
+
+        :return: Batch size.
+        :rtype: int
+        """
+        return self._batch_size
+
+    @property
+    def handlers(self) -> tuple:
+        """
+        Gets the handlers receiving the records.
+
+        :return: Handlers.
+        :rtype: tuple
+        """
+        return self._handlers
+
+    @property
+    def queue(self) -> multiprocessing.queues.Queue:
+        """
+        Gets the multiprocessing queue drained by the listener.
+
+        :return: Multiprocessing queue.
+        :rtype: multiprocessing.Queue
+        """
+        return self._queue
+
+    def _monitor(self) -> None:
+        """
+        Passes queued batches to the handlers until the stop sentinel is received. Batches already
+        queued are combined, up to the batch size, before they are passed on.
+        """
+        stopping = False
+        while not stopping:
+            try:
+                batch = self._queue.get()
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+                continue
+
+            if batch is None:
+                break
+
+            while len(batch) < self._batch_size:
+                try:
+                    more = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                except Exception:
+                    traceback.print_exc(file=sys.stderr)
+                    continue
+
+                if more is None:
+                    stopping = True
+                    break
+                batch.extend(more)
+
+            self.handle_batch(batch)
+
+    def handle_batch(self, items: list) -> None:
+        """
+        Passes a batch of records to every handler, which receives the records its level accepts.
+        Errors raised by a handler are reported on stderr so they do not stop the listener.
+
+        :param items: List of (record, ignore_display) items.
+        :type items: list
+        """
+        for handler in self._handlers:
+            try:
+                _forward_batch(handler, items)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the background thread is running.
+
+        :return: True if the listener is running, False otherwise.
+        :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the background thread draining the queue.
+        """
+        if self.is_alive():
+            raise RuntimeError('ProcessQueueListener is already started.')
+
+        self._thread = threading.Thread(target=self._monitor, name='ProcessQueueListener', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Processes the records still queued, then stops the background thread. Stop the listener after
+        the other processes closed their ProcessQueueHandlers, for example through 'shutdown()', so
+        their records are queued ahead of the stop sentinel.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+
+def _after_fork_in_child() -> None:
+    """
+    Resets the compressors and handlers a child process inherited from its parent. Called in the
+    child process after a fork, once the locks have been reinitialized.
+    """
+    for compressor in list(_compressors):
+        compressor._after_fork_in_child()
+
+    for handler in Handler.get_handlers():
+        try:
+            handler._after_fork_in_child()
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+
+
+def _before_fork() -> None:
+    """
+    Prepares the handlers for a fork of the process. Called in the parent process before it forks.
+    """
+    for handler in Handler.get_handlers():
+        try:
+            handler._before_fork()
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
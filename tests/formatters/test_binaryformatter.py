@@ -0,0 +1,141 @@
+import io
+import sys
+import unittest
+
+from pyloggermanager.formatters import BinaryFormatter, DefaultFormatter
+from utilityclass import UtilityClass
+
+
+class TestBinaryFormatter(unittest.TestCase):
+    """Unit test case methods for BinaryFormatter class."""
+
+    def setUp(self) -> None:
+        self.text_formatter = DefaultFormatter(
+            '%(time)s|%(logger_name)s|%(level_name)s|%(level_number)d|%(file_name)s|%(class_name)s|'
+            '%(function_name)s|%(module_name)s|%(path_name)s|%(thread)d|%(thread_name)s|%(process_id)d|'
+            '%(message)s|%(exec_info)s|%(stack_info)s',
+            time_precision=6
+        )
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without any input."""
+        formatter = BinaryFormatter()
+        self.assertTrue(formatter.caller_details)
+        self.assertTrue(formatter.needs_caller)
+
+    def test_init_caller_details(self):
+        """Test if a formatter without caller details does not need the caller"""
+        formatter = BinaryFormatter(caller_details=False)
+        self.assertFalse(formatter.caller_details)
+        self.assertFalse(formatter.needs_caller)
+
+    def test_init_invalid(self):
+        """Test if init method raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            BinaryFormatter(caller_details='yes')
+
+    def test_round_trip(self):
+        """Test if decoded records render like the original records with any text formatter"""
+        formatter = BinaryFormatter()
+        table = {}
+        records = [
+            UtilityClass.create_record('Hello %s', args=('world',)),
+            UtilityClass.create_record('Second \udcff é', level_number=30, stack_info='Stack'),
+            UtilityClass.create_record('Third', logger_name='OtherLogger', level_number=10)
+        ]
+        stream = io.BytesIO(BinaryFormatter.MAGIC + b''.join(formatter.encode(record, table) for record in records))
+
+        decoded = list(BinaryFormatter.decode(stream))
+        self.assertEqual(
+            [self.text_formatter.format(record) for record in records],
+            [self.text_formatter.format(record) for record in decoded]
+        )
+        self.assertEqual(records[0].time, decoded[0].time)
+
+    def test_round_trip_exception(self):
+        """Test if exception information is decoded with its traceback in the stack information"""
+        try:
+            raise ValueError('Test error')
+        except ValueError:
+            record = UtilityClass.create_record(level_number=40, exec_info=sys.exc_info(), stack_info='Stack')
+
+        decoded = next(BinaryFormatter.decode(io.BytesIO(BinaryFormatter().format(record))))
+        self.assertEqual('ValueError: Test error', DefaultFormatter('%(exec_info)s').format(decoded))
+        self.assertTrue(decoded.stack_info.startswith('Stack\n  File '))
+        self.assertIn('test_round_trip_exception', decoded.stack_info)
+
+    def test_round_trip_without_caller_details(self):
+        """Test if records encoded without caller details decode with unknown caller details"""
+        decoded = next(BinaryFormatter.decode(io.BytesIO(BinaryFormatter(False).format(UtilityClass.create_record()))))
+        self.assertEqual('Unknown File', decoded.file_name)
+        self.assertEqual('Unknown Function', decoded.function_name)
+        self.assertEqual('Test message', decoded.message)
+
+    def test_encode_interns_strings(self):
+        """Test if the names of a record are written once per segment"""
+        formatter = BinaryFormatter()
+        table = {}
+        first = formatter.encode(UtilityClass.create_record(), table)
+        second = formatter.encode(UtilityClass.create_record(), table)
+        self.assertIn(b'TestLogger', first)
+        self.assertNotIn(b'TestLogger', second)
+        self.assertLess(len(second), len(first))
+
+        third = formatter.encode(UtilityClass.create_record(), {})
+        self.assertEqual(len(first), len(third))
+
+    def test_encode_invalid(self):
+        """Test if encode raises TypeError when invalid inputs are provided."""
+        formatter = BinaryFormatter()
+        with self.assertRaises(TypeError):
+            formatter.encode('record', {})
+        with self.assertRaises(TypeError):
+            formatter.encode(UtilityClass.create_record(), [])
+
+    def test_decode_segments(self):
+        """Test if every segment of a stream is decoded with its own string table"""
+        formatter = BinaryFormatter()
+        stream = io.BytesIO(
+            formatter.format(UtilityClass.create_record('First', logger_name='FirstLogger')) +
+            formatter.format(UtilityClass.create_record('Second', logger_name='SecondLogger'))
+        )
+        self.assertEqual(
+            [('FirstLogger', 'First'), ('SecondLogger', 'Second')],
+            [(record.logger_name, record.message) for record in BinaryFormatter.decode(stream)]
+        )
+
+    def test_decode_truncated(self):
+        """Test if decoding stops at a record cut short"""
+        formatter = BinaryFormatter()
+        table = {}
+        data = BinaryFormatter.MAGIC + formatter.encode(UtilityClass.create_record('First'), table)
+        second = formatter.encode(UtilityClass.create_record('Second'), table)
+
+        for size in (1, 10, len(second) - 1):
+            decoded = list(BinaryFormatter.decode(io.BytesIO(data + second[:size])))
+            self.assertEqual(['First'], [record.message for record in decoded])
+
+    def test_decode_missing_string(self):
+        """Test if decode raises ValueError for a record referring to a string its segment does not hold"""
+        formatter = BinaryFormatter()
+        table = {}
+        formatter.encode(UtilityClass.create_record('First'), table)
+        data = BinaryFormatter.MAGIC + formatter.encode(UtilityClass.create_record('Second'), table)
+
+        with self.assertRaises(ValueError):
+            list(BinaryFormatter.decode(io.BytesIO(data)))
+
+    def test_decode_invalid(self):
+        """Test if decode raises ValueError or TypeError for invalid streams"""
+        with self.assertRaises(ValueError):
+            list(BinaryFormatter.decode(io.BytesIO(b'2024-03-22 :: INFO :: Text record')))
+        with self.assertRaises(ValueError):
+            list(BinaryFormatter.decode(io.BytesIO(b'\x02' + bytes(100))))
+        with self.assertRaises(ValueError):
+            list(BinaryFormatter.decode(io.BytesIO(BinaryFormatter.MAGIC + b'\x07')))
+        with self.assertRaises(TypeError):
+            list(BinaryFormatter.decode(io.StringIO('text')))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,14 @@
 import inspect
+import sys
+import threading
 import unittest
+from unittest.mock import patch
 
 from pyloggermanager import CallerFrame, Record
 from pyloggermanager.formatters import DefaultFormatter, DEFAULT_FORMAT, DATE_FORMAT
 
+formatters_main = sys.modules['pyloggermanager.formatters.__main__']
+
 
 class TestDefaultFormatter(unittest.TestCase):
     """Unit test case methods for DefaultFormatter class."""
@@ -79,6 +84,85 @@ class TestDefaultFormatter(unittest.TestCase):
         )
         self.assertEqual(formatter.format(record), expected_output)
 
+    def test_format_str_property_recompiles(self):
+        """Test if assigning format_str recompiles the template used by format."""
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame
+        )
+        formatter = DefaultFormatter()
+        formatter.format_str = '[%(logger_name)s] %(level_name)s %(unknown)s %(message)s'
+        self.assertEqual(formatter.format(record), '[TestLogger] WARNING %(unknown)s Test message')
+
+    def test_format_message_with_token_text(self):
+        """Test if token text inside the message is not substituted."""
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(
+            message='Value %(level_name)s',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame
+        )
+        formatter = DefaultFormatter('%(level_name)s: %(message)s')
+        self.assertEqual(formatter.format(record), 'WARNING: Value %(level_name)s')
+
+    def test_format_during_format_str_change(self):
+        """Test if a record formatted while the format string changes uses either format string as a whole."""
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame
+        )
+        formatter = DefaultFormatter('%(level_name)s: %(message)s')
+        parsing = threading.Event()
+        resume = threading.Event()
+        pattern = formatters_main._TOKEN_PATTERN
+
+        class PausingPattern:
+            """Pauses the thread changing the format string while it parses the new format string."""
+
+            def findall(self, value: str) -> list:
+                return pattern.findall(value)
+
+            def split(self, value: str) -> list:
+                if threading.current_thread().name == 'changing':
+                    parsing.set()
+                    resume.wait(5)
+                return pattern.split(value)
+
+        with patch.object(formatters_main, '_TOKEN_PATTERN', PausingPattern()):
+            thread = threading.Thread(
+                target=setattr, args=(formatter, 'format_str', '[%(logger_name)s] %(message)s'), name='changing'
+            )
+            thread.start()
+            try:
+                self.assertTrue(parsing.wait(5))
+                self.assertEqual('WARNING: Test message', formatter.format(record))
+            finally:
+                resume.set()
+                thread.join()
+        self.assertEqual('[TestLogger] Test message', formatter.format(record))
+
+    def test_needs_caller_property(self):
+        """Test if needs_caller reflects whether caller tokens are used by the format string."""
+        formatter = DefaultFormatter()
+        self.assertFalse(formatter.needs_caller)
+        formatter.format_str = '%(module_name)s :: %(message)s'
+        self.assertTrue(formatter.needs_caller)
+
+    def test_needs_caller_custom_format(self):
+        """Test if needs_caller is assumed when a subclass overrides format."""
+        class CustomFormatter(DefaultFormatter):
+            def format(self, record) -> str:
+                return record.class_name
+
+        self.assertTrue(CustomFormatter().needs_caller)
+
     def test_format_invalid(self):
         """Test if format method raises TypeError when invalid inputs are provided."""
         record = 100
@@ -2,7 +2,7 @@ import inspect
 import time
 import unittest
 from datetime import datetime
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 from pyloggermanager import CallerFrame, Record
 from pyloggermanager.formatters import DEFAULT_FORMAT, CSV_FORMAT, JSON_FORMAT, DATE_FORMAT, Formatter
@@ -241,6 +241,58 @@ class TestFormatter(unittest.TestCase):
             else:
                 assert actual_value == expected_value
 
+    def test_time_precision_property_invalid(self):
+        """Test if time precision property raises errors when invalid values are provided."""
+        formatter = Formatter()
+        with self.assertRaises(TypeError):
+            formatter.time_precision = '3'
+        with self.assertRaises(ValueError):
+            formatter.time_precision = 2
+
+    def test__format_record_time_cached_per_second(self):
+        """Test if _format_record_time formats each second only once per date format."""
+        formatter = Formatter()
+        with patch.object(Formatter, 'format_time', wraps=Formatter.format_time) as format_time:
+            first = formatter._format_record_time(datetime(2024, 3, 22, 23, 37, 21, 1000), DATE_FORMAT)
+            second = formatter._format_record_time(datetime(2024, 3, 22, 23, 37, 21, 999000), DATE_FORMAT)
+            self.assertEqual(1, format_time.call_count)
+            formatter._format_record_time(datetime(2024, 3, 22, 23, 37, 22), DATE_FORMAT)
+            formatter._format_record_time(datetime(2024, 3, 22, 23, 37, 22), '%H:%M:%S')
+            self.assertEqual(3, format_time.call_count)
+        self.assertEqual('2024-03-22 23:37:21', first)
+        self.assertEqual(first, second)
+
+    def test__format_record_time_precision(self):
+        """Test if _format_record_time appends milliseconds or microseconds."""
+        value = datetime(2024, 3, 22, 23, 37, 21, 123456)
+        self.assertEqual('23:37:21.123', Formatter(time_precision=3)._format_record_time(value, '%H:%M:%S'))
+        self.assertEqual('23:37:21.123456', Formatter(time_precision=6)._format_record_time(value, '%H:%M:%S'))
+
+    def test_tokens_property(self):
+        """Test if tokens property returns the tokens used by the format string."""
+        formatter = Formatter('%(message)s :: %(time)s :: %(message)s')
+        self.assertEqual(('%(time)s', '%(message)s'), formatter.tokens)
+        formatter.format_str = {'level': '%(level_name)s', 'items': ['%(thread)d', {'name': '%(logger_name)s'}]}
+        self.assertEqual(('%(logger_name)s', '%(level_name)s', '%(thread)d'), formatter.tokens)
+
+    def test__log_attributes_only_requested_tokens(self):
+        """Test if _log attributes only computes the requested tokens."""
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame,
+            exec_info=(ValueError, ValueError('Test error'), None)
+        )
+        formatter = Formatter('%(message)s')
+        with patch.object(Formatter, 'format_time') as format_time, \
+                patch.object(Formatter, 'format_exception') as format_exception:
+            actual_output = formatter._log_attributes(record, formatter.date_format, formatter.tokens)
+        self.assertDictEqual({'%(message)s': 'Test message'}, actual_output)
+        format_time.assert_not_called()
+        format_exception.assert_not_called()
+
     def test__log_attributes_invalid(self):
         """Test if _log attributes raises TypeError when invalid inputs are passed."""
         record = 100
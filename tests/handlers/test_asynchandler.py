@@ -0,0 +1,126 @@
+import asyncio
+import concurrent.futures
+import io
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager import Logger
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import AsyncHandler, Handler
+
+
+class RecordingHandler(Handler):
+    """Handler keeping the messages and threads of the records it emits."""
+
+    def __init__(self, level: int = 20) -> None:
+        super().__init__(level=level)
+        self.messages = []
+        self.threads = []
+        self.flushed = 0
+
+    def emit(self, record, ignore_display: bool) -> None:
+        self.messages.append(record.message)
+        self.threads.append(threading.current_thread().name)
+
+    def flush(self) -> None:
+        self.flushed += 1
+
+
+class TestAsyncHandler(unittest.TestCase):
+    """Unit test cases for AsyncHandler class."""
+
+    def tearDown(self) -> None:
+        handlers = Handler.get_handlers()
+        for handler in handlers:
+            try:
+                handler.close()
+            except NotImplementedError:
+                pass
+
+    def test_init_valid(self):
+        """Test if init method is initialized with the target handlers."""
+        target = RecordingHandler()
+        handler = AsyncHandler([target])
+        self.assertEqual((target,), handler.handlers)
+        self.assertEqual(100, handler.batch_size)
+        self.assertEqual(20, handler.level)
+        self.assertEqual(0, handler.pending)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            AsyncHandler('handlers')
+        with self.assertRaises(TypeError):
+            AsyncHandler(['handler'])
+        with self.assertRaises(TypeError):
+            AsyncHandler([], batch_size='10')
+        with self.assertRaises(ValueError):
+            AsyncHandler([], batch_size=0)
+        with self.assertRaises(TypeError):
+            AsyncHandler([], executor='executor')
+
+    def test_drain(self):
+        """Test if records logged from a coroutine are written off the event loop thread and can be awaited."""
+        target = RecordingHandler()
+        error_target = RecordingHandler(level=40)
+        handler = AsyncHandler([target, error_target], batch_size=10)
+        logger = Logger(name='TestAsyncLogger')
+        logger.add_handler(handler)
+
+        async def main():
+            for index in range(50):
+                logger.info('Message %d', args=(index,))
+            logger.error('Error message')
+            await handler.drain()
+            return threading.current_thread().name
+
+        loop_thread = asyncio.run(main())
+        self.assertEqual([f'Message {index}' for index in range(50)] + ['Error message'], target.messages)
+        self.assertEqual(['Error message'], error_target.messages)
+        self.assertNotIn(loop_thread, target.threads)
+        self.assertGreaterEqual(target.flushed, 1)
+        self.assertEqual(0, handler.pending)
+
+    def test_flush_and_close(self):
+        """Test if flush waits for pending records and records after close are written synchronously."""
+        target = RecordingHandler()
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        handler = AsyncHandler([target], executor=executor)
+        logger = Logger(name='TestAsyncLogger')
+        logger.add_handler(handler)
+        logger.info('First message')
+        handler.flush()
+        self.assertEqual(['First message'], target.messages)
+
+        handler.close()
+        logger.info('Second message')
+        self.assertEqual(['First message', 'Second message'], target.messages)
+        self.assertNotEqual(threading.current_thread().name, target.threads[0])
+        self.assertEqual(threading.current_thread().name, target.threads[1])
+        executor.shutdown()
+
+    def test_target_error_does_not_stop_writer(self):
+        """Test if a failing target does not stop the records reaching the other targets."""
+        target = RecordingHandler()
+        handler = AsyncHandler([Handler(), target])
+        logger = Logger(name='TestAsyncLogger')
+        logger.add_handler(handler)
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            logger.info('First message')
+            logger.info('Second message')
+            handler.flush()
+        self.assertEqual(['First message', 'Second message'], target.messages)
+        self.assertIn('NotImplementedError', stderr.getvalue())
+
+    def test_needs_caller_property(self):
+        """Test if needs caller follows the target handlers."""
+        target = RecordingHandler()
+        handler = AsyncHandler([target])
+        self.assertFalse(handler.needs_caller)
+        target.formatter = DefaultFormatter('%(function_name)s :: %(message)s')
+        self.assertTrue(handler.needs_caller)
+
+
+if __name__ == "__main__":
+    unittest.main()
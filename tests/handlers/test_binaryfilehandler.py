@@ -0,0 +1,163 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.formatters import BinaryFormatter, DefaultFormatter
+from pyloggermanager.handlers import BinaryFileHandler, FlushPolicy
+from utilityclass import UtilityClass
+
+
+class TestBinaryFileHandler(unittest.TestCase):
+    """Unit test cases for BinaryFileHandler class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'app.bin')
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        UtilityClass.delete_directory(self.directory)
+
+    def read(self) -> list:
+        """Returns the messages of the records in the test file."""
+        with open(self.file_name, 'rb') as file:
+            return [record.message for record in BinaryFormatter.decode(file)]
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        handler = BinaryFileHandler()
+        self.assertIsInstance(handler.formatter, BinaryFormatter)
+        self.assertEqual('default.bin', handler.filename)
+        self.assertEqual('a', handler.filemode)
+        self.assertTrue(handler.keep_open)
+        self.assertTrue(handler.needs_caller)
+
+    def test_init_invalid_formatter(self):
+        """Test if init and the formatter property raise TypeError for text formatters"""
+        with self.assertRaises(TypeError):
+            BinaryFileHandler(formatter=DefaultFormatter())
+
+        handler = BinaryFileHandler(file_name=self.file_name)
+        with self.assertRaises(TypeError):
+            handler.formatter = DefaultFormatter()
+        handler.formatter = BinaryFormatter(caller_details=False)
+        self.assertFalse(handler.needs_caller)
+
+    def test_emit(self):
+        """Test if emitted records are written to a single segment"""
+        handler = BinaryFileHandler(file_name=self.file_name)
+        for index in range(3):
+            handler.handle(UtilityClass.create_record(f'message {index}'), False)
+        handler.flush()
+
+        with open(self.file_name, 'rb') as file:
+            data = file.read()
+        self.assertEqual(1, data.count(BinaryFormatter.MAGIC))
+        self.assertEqual(1, data.count(b'TestLogger'))
+        self.assertEqual(['message 0', 'message 1', 'message 2'], self.read())
+
+    def test_emit_does_not_display(self):
+        """Test if binary records are never displayed on the terminal"""
+        handler = BinaryFileHandler(file_name=self.file_name)
+        with patch('builtins.print') as mock_print:
+            handler.handle(UtilityClass.create_record('message'), False)
+        mock_print.assert_not_called()
+
+    def test_reopen_starts_segment(self):
+        """Test if reopening the file starts a new segment after the records already written"""
+        handler = BinaryFileHandler(file_name=self.file_name)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.close()
+        handler = BinaryFileHandler(file_name=self.file_name)
+        handler.handle(UtilityClass.create_record('second'), True)
+        handler.close()
+
+        with open(self.file_name, 'rb') as file:
+            self.assertEqual(2, file.read().count(BinaryFormatter.MAGIC))
+        self.assertEqual(['first', 'second'], self.read())
+
+    def test_keep_open_false(self):
+        """Test if a handler not keeping the file open writes a complete segment per record"""
+        handler = BinaryFileHandler(file_name=self.file_name, keep_open=False)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.handle(UtilityClass.create_record('second'), True)
+
+        self.assertEqual(['first', 'second'], self.read())
+
+    def test_handle_batch(self):
+        """Test if a batch is written to the file with a single write"""
+        handler = BinaryFileHandler(file_name=self.file_name, flush_policy=FlushPolicy(records=100))
+        handler.handle(UtilityClass.create_record('first'), True)
+        writes = []
+        original_write = handler._file_stream.write
+        with patch.object(handler._file_stream, 'write', side_effect=lambda data: writes.append(data) or
+                          original_write(data)):
+            handler.handle_batch([UtilityClass.create_record(f'message {index}') for index in range(3)], True)
+        handler.flush()
+
+        self.assertEqual(1, len(writes))
+        self.assertEqual(['first', 'message 0', 'message 1', 'message 2'], self.read())
+
+    def test_handle_batch_failed_encode(self):
+        """Test if the strings of a batch that failed to encode are written with the next records"""
+        handler = BinaryFileHandler(file_name=self.file_name)
+        record = UtilityClass.create_record('%d', logger_name='FailedLogger', args=('x',))
+        with self.assertRaises(TypeError):
+            handler.handle_batch([UtilityClass.create_record('first'), record], True)
+        handler.handle(UtilityClass.create_record('second', logger_name='FailedLogger'), True)
+        handler.handle(UtilityClass.create_record('third'), True)
+
+        self.assertEqual(['second', 'third'], self.read())
+
+    def test_handle_failed_write(self):
+        """Test if a failed write starts a new segment, so the next records do not refer to strings never written"""
+        for raw in (False, True):
+            with self.subTest(raw=raw):
+                handler = BinaryFileHandler(file_name=self.file_name, file_mode='w', raw=raw)
+                handler.handle(UtilityClass.create_record('first'), True)
+                with patch.object(handler._file_stream, 'write', side_effect=OSError('No space left on device')):
+                    with self.assertRaises(OSError):
+                        handler.handle(UtilityClass.create_record('failed', logger_name='FailedLogger'), True)
+                handler.handle(UtilityClass.create_record('second', logger_name='FailedLogger'), True)
+                handler.close()
+
+                self.assertEqual(['first', 'second'], self.read())
+
+    def test_raw_failed_flush_starts_segment(self):
+        """Test if records after a failed flush start a new segment, so they do not refer to dropped names"""
+        handler = BinaryFileHandler(file_name=self.file_name, raw=True, flush_policy=FlushPolicy(records=100))
+        handler.handle(UtilityClass.create_record('first'), True)
+        with patch.object(handler._file_stream, '_write_buffers', side_effect=OSError('No space left on device')), \
+                patch.object(handler._file_stream, '_MAX_RETAINED', 0):
+            with self.assertRaises(OSError):
+                handler.flush()
+        handler.handle(UtilityClass.create_record('second'), True)
+        handler.flush()
+
+        self.assertEqual(['second'], self.read())
+
+    def test_raw(self):
+        """Test if a raw handler writes the segment with a single system call per flush"""
+        handler = BinaryFileHandler(file_name=self.file_name, flush_policy=FlushPolicy(records=100), raw=True)
+        with patch.object(os, 'writev', wraps=os.writev, create=True) as writev, \
+                patch.object(os, 'write', wraps=os.write) as write:
+            for index in range(3):
+                handler.handle(UtilityClass.create_record(f'message {index}'), True)
+            handler.flush()
+            self.assertEqual(1, writev.call_count + write.call_count)
+
+        self.assertEqual(['message 0', 'message 1', 'message 2'], self.read())
+
+    def test_after_fork_in_child(self):
+        """Test if the handler stops writing in a forked child"""
+        handler = BinaryFileHandler(file_name=self.file_name)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.flush()
+        handler._after_fork_in_child()
+        handler.handle(UtilityClass.create_record('second'), True)
+
+        self.assertEqual(['first'], self.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.handlers import Compressor
+from utilityclass import UtilityClass
+
+
+class TestCompressor(unittest.TestCase):
+    """Unit test cases for Compressor class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'closed.log')
+        with open(self.file_name, 'w', encoding='UTF-8') as file:
+            file.write('closed log line\n' * 100)
+
+    def tearDown(self) -> None:
+        UtilityClass.delete_directory(self.directory)
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        compressor = Compressor()
+        self.assertEqual('gzip', compressor.codec)
+        self.assertEqual('.gz', compressor.extension)
+        self.assertIsNone(compressor.level)
+        self.assertEqual(1, compressor.workers)
+        self.assertEqual(0, compressor.pending)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            Compressor(codec=1)
+        with self.assertRaises(TypeError):
+            Compressor(level='9')
+        with self.assertRaises(TypeError):
+            Compressor(workers='1')
+        with self.assertRaises(ValueError):
+            Compressor(codec='zip')
+        with self.assertRaises(ValueError):
+            Compressor(codec=Compressor.BZ2, level=0)
+        with self.assertRaises(ValueError):
+            Compressor(level=10)
+        with self.assertRaises(ValueError):
+            Compressor(workers=0)
+
+    def test_compress_codecs(self):
+        """Test if every codec compresses the file and deletes the original."""
+        for codec, opener in ((Compressor.GZIP, gzip.open), (Compressor.BZ2, bz2.open), (Compressor.LZMA, lzma.open)):
+            with self.subTest(codec=codec):
+                with open(self.file_name, 'w', encoding='UTF-8') as file:
+                    file.write(f'{codec} log line\n' * 100)
+                compressor = Compressor(codec=codec, level=1)
+                target = compressor.compress(self.file_name).result()
+                compressor.shutdown()
+
+                self.assertEqual(self.file_name + compressor.extension, target)
+                self.assertFalse(os.path.exists(self.file_name))
+                with opener(target, 'rt', encoding='UTF-8') as file:
+                    self.assertEqual(f'{codec} log line\n' * 100, file.read())
+
+    def test_compress_invalid(self):
+        """Test if compress raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            Compressor().compress(100)
+
+    def test_compress_failure(self):
+        """Test if a failed compression is reported and leaves no partial file."""
+        compressor = Compressor()
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            self.assertIsNone(compressor.compress(os.path.join(self.directory, 'missing.log')).result())
+        compressor.shutdown()
+        self.assertIn('FileNotFoundError', stderr.getvalue())
+        self.assertEqual(['closed.log'], os.listdir(self.directory))
+
+    def test_compress_runs_on_worker(self):
+        """Test if files are compressed on a bounded pool of worker threads."""
+        threads = set()
+        compressor = Compressor(workers=2)
+        original = compressor._compress
+
+        def compress(file_name):
+            threads.add(threading.current_thread())
+            return original(file_name)
+
+        with patch.object(compressor, '_compress', side_effect=compress):
+            for index in range(6):
+                file_name = os.path.join(self.directory, f'segment{index}.log')
+                with open(file_name, 'w', encoding='UTF-8') as file:
+                    file.write('segment\n')
+                compressor.compress(file_name)
+            compressor.wait()
+        compressor.shutdown()
+
+        self.assertEqual(0, compressor.pending)
+        self.assertLessEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(6, len([entry for entry in os.listdir(self.directory) if entry.endswith('.log.gz')]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,18 @@
+import gzip
 import inspect
 import io
 import os
 import sys
+import threading
 import unittest
+from unittest.mock import patch
 
 from pycolorecho import ColorMapper, TextColor
 
 from pyloggermanager import CallerFrame, Record
-from pyloggermanager.formatters import Formatter
-from pyloggermanager.handlers import Handler, FileHandler
+from pyloggermanager.formatters import DefaultFormatter, Formatter
+from pyloggermanager.handlers import Handler, Compressor, FileHandler, FlushPolicy
+from utilityclass import UtilityClass
 
 
 class TestFileHandler(unittest.TestCase):
@@ -170,6 +174,7 @@ class TestFileHandler(unittest.TestCase):
         """Test if emit method prints message as expected."""
         file_name = 'valnocol.log'
         handler = FileHandler(file_name=file_name)
+        self.addCleanup(os.remove, file_name)
         caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
         record = Record(
             message='Test message',
@@ -199,6 +204,7 @@ class TestFileHandler(unittest.TestCase):
         """Test if emit method prints message as expected."""
         file_name = 'valcol1.log'
         handler = FileHandler(file_name=file_name)
+        self.addCleanup(os.remove, file_name)
         caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
         record = Record(
             message='Test error message',
@@ -231,6 +237,7 @@ class TestFileHandler(unittest.TestCase):
         """Test if emit method prints message as expected."""
         file_name = 'valcol2.log'
         handler = FileHandler(file_name=file_name)
+        self.addCleanup(os.remove, file_name)
         caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
         record = Record(
             message='Test error message',
@@ -268,6 +275,348 @@ class TestFileHandler(unittest.TestCase):
         handler = FileHandler()
         handler.flush()
 
+    def test_init_keep_open_invalid(self):
+        """Test if init raises TypeError when invalid keep_open or flush_policy is provided."""
+        with self.assertRaises(TypeError):
+            FileHandler(keep_open='yes')
+        with self.assertRaises(TypeError):
+            FileHandler(flush_policy=100)
+
+    def test_emit_keep_open_reuses_stream(self):
+        """Test if emit keeps a single file stream open across records."""
+        file_name = 'keepopen1.log'
+        handler = FileHandler(file_name=file_name, keep_open=True)
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=caller_frame
+        )
+        handler.emit(record, True)
+        stream = handler._file_stream
+        handler.emit(record, True)
+        self.assertIs(stream, handler._file_stream)
+        with open(file_name, 'r') as file:
+            self.assertEqual(2, file.read().count(' :: INFO :: Test message'))
+        handler.close()
+        os.remove(file_name)
+
+    def test_emit_keep_open_flush_policy(self):
+        """Test if emit only flushes when the flush policy is met and close flushes the rest."""
+        file_name = 'keepopen2.log'
+        handler = FileHandler(
+            file_name=file_name, keep_open=True, flush_policy=FlushPolicy(records=3, level=40)
+        )
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        info_record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=caller_frame
+        )
+        error_record = Record(
+            message='Test error message',
+            logger_name='TestLogger',
+            level_number=40,
+            caller_frame=caller_frame
+        )
+        handler.emit(info_record, True)
+        handler.emit(info_record, True)
+        with open(file_name, 'r') as file:
+            self.assertEqual('', file.read())
+        handler.emit(error_record, True)
+        with open(file_name, 'r') as file:
+            self.assertIn('Test error message', file.read())
+        handler.emit(info_record, True)
+        handler.close()
+        self.assertIsNone(handler._file_stream)
+        with open(file_name, 'r') as file:
+            self.assertEqual(4, len(file.read().splitlines()))
+        os.remove(file_name)
+
+    def test_emit_batch_flush_policy_records(self):
+        """Test if every record of a batch counts against the records threshold of the flush policy."""
+        file_name = 'keepopen4.log'
+        handler = FileHandler(
+            file_name=file_name, keep_open=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=10)
+        )
+        self.addCleanup(os.remove, file_name)
+        handler.handle_batch(self.make_records(5), True)
+        self.assertEqual(5, handler._pending_records)
+        with open(file_name, 'r') as file:
+            self.assertEqual('', file.read())
+        handler.handle_batch(self.make_records(50), True)
+        self.assertEqual(0, handler._pending_records)
+        with open(file_name, 'r') as file:
+            self.assertEqual(55, len(file.read().splitlines()))
+        handler.close()
+
+    def test_emit_keep_open_flush_policy_size(self):
+        """Test if a size only flush policy buffers records until the size threshold is reached."""
+        file_name = 'keepopen3.log'
+        handler = FileHandler(
+            file_name=file_name, keep_open=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(size=20)
+        )
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        record = Record(message='Test message', logger_name='TestLogger', level_number=20, caller_frame=caller_frame)
+        handler.emit(record, True)
+        with open(file_name, 'r') as file:
+            self.assertEqual('', file.read())
+        handler.emit(record, True)
+        with open(file_name, 'r') as file:
+            self.assertEqual(2, len(file.read().splitlines()))
+        handler.close()
+        os.remove(file_name)
+
+    def test_filename_property_closes_open_stream(self):
+        """Test if changing the file name closes the open file stream."""
+        handler = FileHandler(file_name='keepopen3.log', keep_open=True)
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        handler.emit(Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=caller_frame
+        ), True)
+        handler.filename = 'keepopen4.log'
+        self.assertIsNone(handler._file_stream)
+        os.remove('keepopen3.log')
+
+    def test_compressor_property_invalid(self):
+        """Test if compressor property raises TypeError"""
+        handler = FileHandler()
+        with self.assertRaises(TypeError):
+            handler.compressor = 'gzip'
+        with self.assertRaises(TypeError):
+            FileHandler(compressor='gzip')
+
+    def test_filename_property_compresses_previous_file(self):
+        """Test if changing the file name compresses the previous log file in the background."""
+        compressor = Compressor()
+        handler = FileHandler(file_name='compress1.log', keep_open=True, compressor=compressor)
+        self.assertIs(compressor, handler.compressor)
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        handler.emit(Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=caller_frame
+        ), True)
+        self.addCleanup(os.remove, 'compress1.log.gz')
+        handler.filename = 'compress2.log'
+        compressor.wait()
+        self.assertFalse(os.path.exists('compress1.log'))
+        with gzip.open('compress1.log.gz', 'rt') as file:
+            self.assertIn(' :: INFO :: Test message', file.read())
+
+    def test_emit_batch_single_write(self):
+        """Test if emit batch writes the whole batch with a single write."""
+        handler = FileHandler(file_name='batch1.log', keep_open=True)
+        self.addCleanup(os.remove, 'batch1.log')
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        records = [Record(
+            message=f'Test message {index}',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=caller_frame
+        ) for index in range(3)]
+        writes = []
+        original_write = handler._write_message
+        handler._write_message = lambda level_number, message, records=1: (
+            writes.append(message), original_write(level_number, message, records)
+        )
+        handler.handle_batch(records, True)
+        handler.close()
+        self.assertEqual(1, len(writes))
+        with open('batch1.log', 'r') as file:
+            lines = file.read().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[2].endswith(' :: INFO :: Test message 2'))
+
+    def make_records(self, count: int, prefix: str = 'Test message') -> list:
+        """Creates records with numbered messages."""
+        return [UtilityClass.create_record(f'{prefix} {index}') for index in range(count)]
+
+    def test_raw_invalid(self):
+        """Test if init and the raw property raise TypeError or ValueError for invalid inputs."""
+        with self.assertRaises(TypeError):
+            FileHandler(file_name='raw1.log', raw='yes')
+        with self.assertRaises(ValueError):
+            FileHandler(file_name='raw1.log', file_mode='r', raw=True)
+
+        handler = FileHandler(file_name='raw1.log', file_mode='r')
+        with self.assertRaises(TypeError):
+            handler.raw = 1
+        with self.assertRaises(ValueError):
+            handler.raw = True
+        handler.filemode = 'a'
+        handler.raw = True
+        self.assertTrue(handler.raw)
+        with self.assertRaises(ValueError):
+            handler.filemode = 'r+'
+
+    def test_raw_single_system_call_per_flush(self):
+        """Test if a raw handler writes all records buffered until a flush with a single system call."""
+        handler = FileHandler(
+            file_name='raw2.log', keep_open=True, raw=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=100)
+        )
+        self.addCleanup(os.remove, 'raw2.log')
+        with patch.object(os, 'writev', wraps=os.writev, create=True) as writev, \
+                patch.object(os, 'write', wraps=os.write) as write:
+            for record in self.make_records(5):
+                handler.handle(record, True)
+            self.assertEqual(0, writev.call_count + write.call_count)
+            handler.handle_batch(self.make_records(3, 'Batch message'), True)
+            handler.flush()
+            self.assertEqual(1, writev.call_count + write.call_count)
+
+        with open('raw2.log', 'r') as file:
+            self.assertEqual(
+                [f'Test message {index}' for index in range(5)] + [f'Batch message {index}' for index in range(3)],
+                file.read().splitlines()
+            )
+
+    def test_raw_system_calls_carry_whole_records(self):
+        """Test if a raw handler splits large flushes into system calls carrying whole records only."""
+        handler = FileHandler(
+            file_name='raw7.log', keep_open=True, raw=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=100)
+        )
+        self.addCleanup(os.remove, 'raw7.log')
+        calls = []
+
+        def write_buffers(fd: int, buffers: list) -> int:
+            calls.append([len(buffer) for buffer in buffers])
+            return os.write(fd, b''.join(buffers))
+
+        for record in self.make_records(5):
+            handler.handle(record, True)
+        with patch.object(handler._file_stream, '_write_buffers', side_effect=write_buffers), \
+                patch.object(handler._file_stream, '_MAX_BYTES', 40), patch.object(handler._file_stream, '_IOV_MAX', 3):
+            handler.flush()
+
+        self.assertEqual([[15, 15], [15, 15], [15]], calls)
+        with open('raw7.log', 'r') as file:
+            self.assertEqual([f'Test message {index}' for index in range(5)], file.read().splitlines())
+
+    def test_raw_file_modes(self):
+        """Test if a raw handler appends, truncates or creates the file as its mode asks."""
+        with open('raw3.log', 'w') as file:
+            file.write('Existing line\n')
+        self.addCleanup(os.remove, 'raw3.log')
+
+        handler = FileHandler(file_name='raw3.log', raw=True, formatter=DefaultFormatter('%(message)s'))
+        handler.handle(self.make_records(1)[0], True)
+        with open('raw3.log', 'r') as file:
+            self.assertEqual(['Existing line', 'Test message 0'], file.read().splitlines())
+
+        handler.filemode = 'w'
+        handler.handle(self.make_records(1)[0], True)
+        with open('raw3.log', 'r') as file:
+            self.assertEqual(['Test message 0'], file.read().splitlines())
+
+        handler.filemode = 'x'
+        with self.assertRaises(FileExistsError):
+            handler.handle(self.make_records(1)[0], True)
+
+    def test_raw_short_write(self):
+        """Test if a raw handler reports short writes instead of completing a cut record with another system call."""
+        handler = FileHandler(
+            file_name='raw4.log', keep_open=True, raw=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=100)
+        )
+        self.addCleanup(os.remove, 'raw4.log')
+        for written in (7, 15):
+            with self.subTest(written=written):
+                open('raw4.log', 'w').close()
+                calls = []
+
+                def write_partially(fd: int, buffers: list) -> int:
+                    calls.append(len(buffers))
+                    return os.write(fd, b''.join(buffers)[:written])
+
+                for record in self.make_records(3):
+                    handler.handle(record, True)
+                with patch.object(handler._file_stream, '_write_buffers', side_effect=write_partially):
+                    with self.assertRaises(OSError):
+                        handler.flush()
+                self.assertEqual([3], calls)
+                with open('raw4.log', 'r') as file:
+                    self.assertEqual('Test message 0\n'[:written], file.read())
+
+                handler.flush()
+                with open('raw4.log', 'r') as file:
+                    self.assertEqual('Test message 0\n'[:written] + 'Test message 1\nTest message 2\n', file.read())
+
+    def test_raw_failed_flush_keeps_records(self):
+        """Test if records of a raw handler are kept when a flush fails and written by the next one."""
+        handler = FileHandler(
+            file_name='raw5.log', keep_open=True, raw=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=100)
+        )
+        self.addCleanup(os.remove, 'raw5.log')
+        for record in self.make_records(2):
+            handler.handle(record, True)
+        with patch.object(handler._file_stream, '_write_buffers', side_effect=OSError('No space left on device')):
+            with self.assertRaises(OSError):
+                handler.flush()
+        handler.flush()
+
+        with open('raw5.log', 'r') as file:
+            self.assertEqual(['Test message 0', 'Test message 1'], file.read().splitlines())
+
+    def test_raw_failed_flush_drops_oldest_records(self):
+        """Test if a raw handler drops the oldest records kept by failed flushes beyond the limit and reports it."""
+        handler = FileHandler(
+            file_name='raw8.log', keep_open=True, raw=True, formatter=DefaultFormatter('%(message)s'),
+            flush_policy=FlushPolicy(records=100)
+        )
+        for record in self.make_records(2):
+            handler.handle(record, True)
+        with patch.object(handler._file_stream, '_write_buffers', side_effect=OSError('No space left on device')), \
+                patch.object(handler._file_stream, '_MAX_RETAINED', 45):
+            with self.assertRaisesRegex(OSError, 'No space left on device'):
+                handler.flush()
+            for record in self.make_records(3, 'Late message'):
+                handler.handle(record, True)
+            with self.assertRaisesRegex(OSError, '2 records dropped'):
+                handler.flush()
+        handler.flush()
+
+        with open('raw8.log', 'r') as file:
+            self.assertEqual([f'Late message {index}' for index in range(3)], file.read().splitlines())
+
+    def test_raw_concurrent_appenders(self):
+        """Test if lines of raw handlers appending to the same file never interleave."""
+        self.addCleanup(os.remove, 'raw6.log')
+        line = 'x' * 200
+
+        def append(prefix: str) -> None:
+            handler = FileHandler(
+                file_name='raw6.log', keep_open=True, raw=True, formatter=DefaultFormatter(f'{prefix} %(message)s'),
+                flush_policy=FlushPolicy(records=50)
+            )
+            for record in self.make_records(500, line):
+                handler.handle(record, True)
+            handler.close()
+
+        threads = [threading.Thread(target=append, args=(f'writer{index}',)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open('raw6.log', 'r') as file:
+            lines = file.read().splitlines()
+        self.assertEqual(2000, len(lines))
+        for index in range(4):
+            written = [int(value.rsplit(' ', 1)[1]) for value in lines if value.startswith(f'writer{index} {line} ')]
+            self.assertEqual(list(range(500)), written)
+
 
 if __name__ == "__main__":
     unittest.main()
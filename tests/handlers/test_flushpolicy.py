@@ -0,0 +1,68 @@
+import unittest
+
+from pyloggermanager.handlers import FlushPolicy
+
+
+class TestFlushPolicy(unittest.TestCase):
+    """Unit test cases for FlushPolicy class."""
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        policy = FlushPolicy()
+        self.assertEqual(1, policy.records)
+        self.assertEqual(0, policy.size)
+        self.assertEqual(0, policy.interval)
+        self.assertIsNone(policy.level)
+
+    def test_init_records_default(self):
+        """Test if records defaults to every record only when no other threshold is provided."""
+        self.assertEqual(0, FlushPolicy(size=4096).records)
+        self.assertEqual(0, FlushPolicy(interval=500).records)
+        self.assertEqual(0, FlushPolicy(level=40).records)
+        self.assertEqual(5, FlushPolicy(records=5, size=4096).records)
+        self.assertEqual(0, FlushPolicy(records=0).records)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            FlushPolicy(records='1')
+        with self.assertRaises(TypeError):
+            FlushPolicy(size='1')
+        with self.assertRaises(TypeError):
+            FlushPolicy(interval=1.5)
+        with self.assertRaises(TypeError):
+            FlushPolicy(level='ERROR')
+
+    def test_init_negative(self):
+        """Test if init raises ValueError when negative thresholds are provided."""
+        with self.assertRaises(ValueError):
+            FlushPolicy(records=-1)
+
+    def test_should_flush_records(self):
+        """Test if should_flush triggers on the number of pending records."""
+        policy = FlushPolicy(records=3)
+        self.assertFalse(policy.should_flush(20, 2, 100, 0.0))
+        self.assertTrue(policy.should_flush(20, 3, 100, 0.0))
+
+    def test_should_flush_size(self):
+        """Test if should_flush triggers on the number of pending characters."""
+        policy = FlushPolicy(size=50)
+        self.assertFalse(policy.should_flush(20, 1, 10, 0.0))
+        self.assertFalse(policy.should_flush(20, 10, 49, 0.0))
+        self.assertTrue(policy.should_flush(20, 10, 50, 0.0))
+
+    def test_should_flush_interval(self):
+        """Test if should_flush triggers on the elapsed interval."""
+        policy = FlushPolicy(interval=100)
+        self.assertFalse(policy.should_flush(20, 10, 10, 0.05))
+        self.assertTrue(policy.should_flush(20, 10, 10, 0.1))
+
+    def test_should_flush_level(self):
+        """Test if should_flush triggers on records at or above the flush level."""
+        policy = FlushPolicy(level=40)
+        self.assertFalse(policy.should_flush(30, 1, 10, 0.0))
+        self.assertTrue(policy.should_flush(40, 1, 10, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import gc
 import inspect
 import json
 import unittest
@@ -5,7 +6,7 @@ import unittest
 from pycolorecho import ColorMapper, TextColor
 
 from pyloggermanager import CallerFrame, Record
-from pyloggermanager.formatters import Formatter, JSONFormatter
+from pyloggermanager.formatters import Formatter, DefaultFormatter, JSONFormatter
 from pyloggermanager.handlers import Handler
 
 
@@ -129,6 +130,13 @@ class TestHandler(unittest.TestCase):
         with self.assertRaises(TypeError):
             handler.formatter = formatter
 
+    def test_needs_caller_property(self):
+        """Test if needs_caller property follows the handler's formatter."""
+        handler = Handler()
+        self.assertFalse(handler.needs_caller)
+        handler.formatter = DefaultFormatter('%(function_name)s :: %(message)s')
+        self.assertTrue(handler.needs_caller)
+
     def test_level_property_valid(self):
         """Test if level property returns expected value."""
         level = 30
@@ -223,8 +231,27 @@ class TestHandler(unittest.TestCase):
 
     def test_get_handlers_valid(self):
         """Test if the get handlers returns expected values."""
-        Handler()
+        handler = Handler()
         assert len(Handler.get_handlers()) > 0
+        self.assertIn(handler, Handler.get_handlers())
+
+    def test_get_handlers_creation_order(self):
+        """Test if the get handlers returns live handlers in creation order."""
+        handlers = [Handler(), Handler(), Handler()]
+        self.assertEqual(handlers, [handler for handler in Handler.get_handlers() if handler in handlers])
+
+    def test_get_handlers_weak(self):
+        """Test if handlers dropped without being closed are removed from the registry."""
+        count = len(Handler.get_handlers())
+        Handler()
+        gc.collect()
+        self.assertEqual(count, len(Handler.get_handlers()))
+
+    def test_close_removes_handler(self):
+        """Test if close removes the handler from the registry."""
+        handler = Handler()
+        handler.close()
+        self.assertNotIn(handler, Handler.get_handlers())
 
     def test_handle_valid(self):
         """Test if handle method raises NotImplementedError when valid values are provided."""
@@ -250,6 +277,36 @@ class TestHandler(unittest.TestCase):
         with self.assertRaises(TypeError):
             handler.handle(record, False)
 
+    def test_handle_batch_valid(self):
+        """Test if handle batch emits every record under a single lock acquisition."""
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        records = [Record(
+            message=f'Test message {index}',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame
+        ) for index in range(3)]
+        emitted = []
+        acquired = []
+        handler = Handler()
+        handler.emit = lambda record, ignore_display: emitted.append((record, ignore_display))
+        original_acquire = handler._acquire_lock
+        handler._acquire_lock = lambda: (acquired.append(True), original_acquire())
+        handler.handle_batch(records, True)
+        handler.handle_batch([], True)
+        self.assertEqual([(record, True) for record in records], emitted)
+        self.assertEqual(1, len(acquired))
+
+    def test_handle_batch_invalid(self):
+        """Test if handle batch raises TypeError when invalid inputs are provided."""
+        handler = Handler()
+        with self.assertRaises(TypeError):
+            handler.handle_batch('records', False)
+        with self.assertRaises(TypeError):
+            handler.handle_batch([100], False)
+        with self.assertRaises(TypeError):
+            handler.handle_batch([], 'False')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,135 @@
+import time
+import unittest
+
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Handler, MemoryHandler
+from utilityclass import UtilityClass
+
+
+class BatchHandler(Handler):
+    """Handler recording the batches it receives."""
+
+    def __init__(self, level: int = 20, needs_caller: bool = True) -> None:
+        super().__init__(level=level, formatter=DefaultFormatter('%(message)s'))
+        self.batches = []
+        self.flushes = 0
+        self._needs_caller = needs_caller
+
+    @property
+    def needs_caller(self) -> bool:
+        return self._needs_caller
+
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        self.batches.append(([self.format(record) for record in records], ignore_display))
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class TestMemoryHandler(unittest.TestCase):
+    """Unit test cases for MemoryHandler class."""
+
+    def setUp(self) -> None:
+        self.target = BatchHandler()
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+
+    def test_init_valid(self):
+        """Test if init method initializes all the required variables."""
+        handler = MemoryHandler(self.target)
+        self.assertIs(self.target, handler.target)
+        self.assertEqual(100, handler.capacity)
+        self.assertEqual(40, handler.flush_level)
+        self.assertEqual(0, handler.interval)
+        self.assertEqual(0, handler.pending)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            MemoryHandler('target')
+        with self.assertRaises(TypeError):
+            MemoryHandler(self.target, capacity='10')
+        with self.assertRaises(TypeError):
+            MemoryHandler(self.target, flush_level='ERROR')
+        with self.assertRaises(TypeError):
+            MemoryHandler(self.target, interval='10')
+        with self.assertRaises(ValueError):
+            MemoryHandler(self.target, capacity=0)
+        with self.assertRaises(ValueError):
+            MemoryHandler(self.target, interval=-1)
+
+    def test_flush_on_capacity(self):
+        """Test if the buffer is forwarded as one batch once it is full."""
+        handler = MemoryHandler(self.target, capacity=3)
+        handler.handle(UtilityClass.create_record('message 0'), True)
+        handler.handle(UtilityClass.create_record('message 1'), True)
+        self.assertEqual([], self.target.batches)
+        self.assertEqual(2, handler.pending)
+        handler.handle(UtilityClass.create_record('message 2'), True)
+        self.assertEqual([(['message 0', 'message 1', 'message 2'], True)], self.target.batches)
+        self.assertEqual(1, self.target.flushes)
+        self.assertEqual(0, handler.pending)
+
+    def test_flush_on_level(self):
+        """Test if a record at or above the flush level forwards the buffer."""
+        handler = MemoryHandler(self.target, flush_level=40)
+        handler.handle(UtilityClass.create_record('debug context'), True)
+        handler.handle(UtilityClass.create_record('failure', 40), True)
+        self.assertEqual([(['debug context', 'failure'], True)], self.target.batches)
+
+    def test_flush_on_interval(self):
+        """Test if the first record after the interval elapsed forwards the buffer."""
+        handler = MemoryHandler(self.target, interval=10)
+        handler.handle(UtilityClass.create_record('message 0'), True)
+        self.assertEqual([], self.target.batches)
+        time.sleep(0.02)
+        handler.handle(UtilityClass.create_record('message 1'), True)
+        self.assertEqual([(['message 0', 'message 1'], True)], self.target.batches)
+
+    def test_flush_filters_target_level_and_groups_display(self):
+        """Test if flush skips records below the target level and splits batches by display flag."""
+        self.target.level = 30
+        handler = MemoryHandler(self.target)
+        handler.handle(UtilityClass.create_record('warning 0', 30), True)
+        handler.handle(UtilityClass.create_record('info', 20), True)
+        handler.handle(UtilityClass.create_record('warning 1', 30), False)
+        handler.flush()
+        self.assertEqual([(['warning 0'], True), (['warning 1'], False)], self.target.batches)
+
+    def test_close_flushes(self):
+        """Test if close forwards the buffered records."""
+        handler = MemoryHandler(self.target)
+        handler.handle(UtilityClass.create_record('message'), True)
+        handler.close()
+        self.assertEqual([(['message'], True)], self.target.batches)
+
+    def test_message_interpolated_on_emit(self):
+        """Test if the message is interpolated when buffered, not when forwarded."""
+        arguments = ['before']
+        record = UtilityClass.create_record('value %s', args=(arguments,))
+        handler = MemoryHandler(self.target)
+        handler.handle(record, True)
+        arguments[0] = 'after'
+        handler.flush()
+        self.assertEqual([(["value ['before']"], True)], self.target.batches)
+
+    def test_target_property(self):
+        """Test if changing the target flushes the buffer to the previous target."""
+        handler = MemoryHandler(self.target)
+        handler.handle(UtilityClass.create_record('message'), True)
+        other = BatchHandler()
+        handler.target = other
+        self.assertEqual([(['message'], True)], self.target.batches)
+        self.assertIs(other, handler.target)
+        with self.assertRaises(TypeError):
+            handler.target = 'target'
+
+    def test_needs_caller_property(self):
+        """Test if needs caller follows the target handler."""
+        self.assertTrue(MemoryHandler(self.target).needs_caller)
+        self.assertFalse(MemoryHandler(BatchHandler(needs_caller=False)).needs_caller)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from pyloggermanager.handlers import OverflowPolicy
+
+
+class TestOverflowPolicy(unittest.TestCase):
+    """Unit test cases for OverflowPolicy class."""
+
+    def test_check_policy_valid(self):
+        """Test if check policy returns the provided policy when it exists."""
+        for policy in (OverflowPolicy.BLOCK, OverflowPolicy.DROP_NEWEST, OverflowPolicy.DROP_OLDEST,
+                       OverflowPolicy.DROP_BELOW_LEVEL):
+            self.assertEqual(policy, OverflowPolicy.check_policy(policy))
+
+    def test_check_policy_not_exist(self):
+        """Test if check policy raises ValueError when the policy does not exist."""
+        with self.assertRaises(ValueError):
+            OverflowPolicy.check_policy('drop_all')
+
+    def test_check_policy_invalid(self):
+        """Test if check policy raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            OverflowPolicy.check_policy(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
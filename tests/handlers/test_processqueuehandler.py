@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.handlers import ProcessQueueHandler
+from utilityclass import UtilityClass
+
+
+class TestProcessQueueHandler(unittest.TestCase):
+    """Unit test cases for ProcessQueueHandler class."""
+
+    def setUp(self) -> None:
+        self.queue = multiprocessing.Queue()
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        self.queue.close()
+        self.queue.join_thread()
+
+    def test_init_valid(self):
+        """Test if init method initializes all the required variables."""
+        handler = ProcessQueueHandler(self.queue)
+        self.assertIs(self.queue, handler.queue)
+        self.assertEqual(100, handler.batch_size)
+        self.assertEqual(0, handler.pending)
+        self.assertTrue(handler.needs_caller)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            ProcessQueueHandler([])
+        with self.assertRaises(TypeError):
+            ProcessQueueHandler(self.queue, batch_size='10')
+        with self.assertRaises(ValueError):
+            ProcessQueueHandler(self.queue, batch_size=0)
+
+    def test_emit_ships_batches(self):
+        """Test if records buffered while the sender is busy are put on the queue as one batch."""
+        handler = ProcessQueueHandler(self.queue)
+        release = threading.Event()
+        batches = []
+
+        def put(batch):
+            release.wait()
+            batches.append(batch)
+
+        with patch.object(self.queue, 'put', side_effect=put):
+            for index in range(10):
+                handler.handle(UtilityClass.create_record(f'message {index}'), True)
+            release.set()
+            handler.flush()
+
+        self.assertLessEqual(len(batches), 2)
+        self.assertEqual([f'message {index}' for index in range(10)],
+                         [record.message for batch in batches for record, _ in batch])
+        self.assertEqual(0, handler.pending)
+
+    def test_emit_respects_batch_size(self):
+        """Test if no batch holds more records than the batch size."""
+        handler = ProcessQueueHandler(self.queue, batch_size=3)
+        release = threading.Event()
+        batches = []
+
+        def put(batch):
+            release.wait()
+            batches.append(batch)
+
+        with patch.object(self.queue, 'put', side_effect=put):
+            for index in range(10):
+                handler.handle(UtilityClass.create_record(f'message {index}'), False)
+            release.set()
+            handler.close()
+
+        self.assertTrue(all(len(batch) <= 3 for batch in batches))
+        self.assertEqual(10, sum(len(batch) for batch in batches))
+        self.assertTrue(all(ignore_display is False for batch in batches for _, ignore_display in batch))
+
+    def test_emit_after_close(self):
+        """Test if records emitted after close are put on the queue directly."""
+        handler = ProcessQueueHandler(self.queue)
+        handler.close()
+        handler.emit(UtilityClass.create_record('late'), True)
+        batch = self.queue.get(timeout=5)
+        self.assertEqual(['late'], [record.message for record, _ in batch])
+
+    def test_emit_formats_traceback(self):
+        """Test if the traceback of a record is shipped as stack information."""
+        try:
+            raise ValueError('Test error')
+        except ValueError:
+            exec_info = sys.exc_info()
+        record = UtilityClass.create_record('failure', exec_info=exec_info)
+        record.exec_info = exec_info
+        handler = ProcessQueueHandler(self.queue)
+        handler.handle(record, True)
+        handler.flush()
+
+        shipped, _ = self.queue.get(timeout=5)[0]
+        self.assertIs(ValueError, shipped.exec_info[0])
+        self.assertEqual('Test error', str(shipped.exec_info[1]))
+        self.assertIsNone(shipped.exec_info[2])
+        self.assertIn('test_emit_formats_traceback', shipped.stack_info)
+        self.assertIsNotNone(record.exec_info[2])
+        self.assertEqual(os.getpid(), shipped.process_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
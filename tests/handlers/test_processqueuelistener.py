@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+import unittest
+
+from pyloggermanager import Logger
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import FileHandler, Handler, ProcessQueueHandler, ProcessQueueListener
+from utilityclass import UtilityClass
+
+
+def log_records(record_queue, worker: int, count: int) -> None:
+    """Logs records through a ProcessQueueHandler from a worker process."""
+    handler = ProcessQueueHandler(record_queue, batch_size=16)
+    logger = Logger(name=f'Worker{worker}')
+    logger.add_handler(handler)
+    for index in range(count):
+        logger.info(f'worker {worker} record {index}', ignore_display=True)
+    handler.close()
+
+
+class RecordingHandler(Handler):
+    """Handler recording the batches it receives."""
+
+    def __init__(self, level: int = 20) -> None:
+        super().__init__(level=level, formatter=DefaultFormatter('%(message)s'))
+        self.batches = []
+
+    def emit_batch(self, records: list, ignore_display: bool) -> None:
+        self.batches.append([self.format(record) for record in records])
+
+    def flush(self) -> None:
+        pass
+
+
+class TestProcessQueueListener(unittest.TestCase):
+    """Unit test cases for ProcessQueueListener class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        UtilityClass.delete_directory(self.directory)
+
+    def make_item(self, message: str, level_number: int = 20) -> tuple:
+        """Creates a queued item with the given message and level."""
+        return UtilityClass.create_record(message, level_number), True
+
+    def test_init_valid(self):
+        """Test if init method initializes all the required variables."""
+        handler = RecordingHandler()
+        listener = ProcessQueueListener([handler])
+        self.assertEqual((handler,), listener.handlers)
+        self.assertIsInstance(listener.queue, multiprocessing.queues.Queue)
+        self.assertEqual(1000, listener.batch_size)
+        self.assertFalse(listener.is_alive())
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            ProcessQueueListener('handlers')
+        with self.assertRaises(TypeError):
+            ProcessQueueListener(['handler'])
+        with self.assertRaises(TypeError):
+            ProcessQueueListener([], queue=[])
+        with self.assertRaises(TypeError):
+            ProcessQueueListener([], batch_size='10')
+        with self.assertRaises(ValueError):
+            ProcessQueueListener([], batch_size=0)
+
+    def test_start_twice(self):
+        """Test if starting a running listener raises RuntimeError."""
+        listener = ProcessQueueListener([RecordingHandler()])
+        listener.start()
+        try:
+            with self.assertRaises(RuntimeError):
+                listener.start()
+        finally:
+            listener.stop()
+        self.assertFalse(listener.is_alive())
+
+    def test_handle_batch_filters_levels(self):
+        """Test if every handler receives the records its level accepts."""
+        info_handler = RecordingHandler(level=20)
+        error_handler = RecordingHandler(level=40)
+        listener = ProcessQueueListener([info_handler, error_handler])
+        listener.handle_batch([self.make_item('info'), self.make_item('error', 40)])
+        self.assertEqual([['info', 'error']], info_handler.batches)
+        self.assertEqual([['error']], error_handler.batches)
+
+    def test_stop_combines_queued_batches(self):
+        """Test if batches already queued are combined and processed before stopping."""
+        handler = RecordingHandler()
+        listener = ProcessQueueListener([handler])
+        for index in range(3):
+            listener.queue.put([self.make_item(f'message {index}')])
+        listener.start()
+        listener.stop()
+        self.assertEqual(['message 0', 'message 1', 'message 2'],
+                         [message for batch in handler.batches for message in batch])
+        self.assertLessEqual(len(handler.batches), 3)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'requires the fork start method')
+    def test_single_writer_for_processes(self):
+        """Test if records of several processes are written by the listener without interleaving."""
+        file_name = os.path.join(self.directory, 'workers.log')
+        handler = FileHandler(file_name=file_name, keep_open=True,
+                              formatter=DefaultFormatter('%(process_id)d %(message)s'))
+        listener = ProcessQueueListener([handler])
+        listener.start()
+
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=log_records, args=(listener.queue, worker, 200)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+            self.assertEqual(0, process.exitcode)
+        listener.stop()
+        handler.close()
+
+        with open(file_name, 'r', encoding='UTF-8') as file:
+            lines = file.read().splitlines()
+        self.assertEqual(800, len(lines))
+        for worker, process in enumerate(processes):
+            messages = [line.split(' ', 1)[1] for line in lines if line.startswith(f'{process.pid} ')]
+            self.assertEqual([f'worker {worker} record {index}' for index in range(200)], messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
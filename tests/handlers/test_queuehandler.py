@@ -0,0 +1,173 @@
+import threading
+import time
+import unittest
+
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Handler, OverflowPolicy, QueueHandler, QueueListener
+from utilityclass import UtilityClass
+
+
+class TestQueueHandler(unittest.TestCase):
+    """Unit test cases for QueueHandler class."""
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+
+    def queued_messages(self, handler: QueueHandler) -> list:
+        """Returns the messages currently queued by the handler."""
+        return [record.message for record, _ in list(handler.queue.queue)]
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        handler = QueueHandler()
+        self.assertEqual(20, handler.level)
+        self.assertEqual(10000, handler.capacity)
+        self.assertEqual(OverflowPolicy.BLOCK, handler.overflow_policy)
+        self.assertEqual(30, handler.drop_level)
+        self.assertEqual(0, handler.dropped)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            QueueHandler(capacity='10')
+        with self.assertRaises(ValueError):
+            QueueHandler(capacity=0)
+        with self.assertRaises(ValueError):
+            QueueHandler(overflow_policy='drop_all')
+        with self.assertRaises(TypeError):
+            QueueHandler(drop_level='WARNING')
+
+    def test_emit_queues_record(self):
+        """Test if emit puts the record and the display flag on the queue."""
+        handler = QueueHandler()
+        record = UtilityClass.create_record('Hello %s', args=('world',))
+        handler.emit(record, True)
+        self.assertEqual((record, True), handler.queue.get_nowait())
+        self.assertEqual('Hello world', record.message)
+
+    def test_drop_newest(self):
+        """Test if the drop newest policy discards the records that do not fit."""
+        handler = QueueHandler(capacity=2, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        for message in ('first', 'second', 'third', 'fourth'):
+            handler.handle(UtilityClass.create_record(message), True)
+        self.assertEqual(['first', 'second'], self.queued_messages(handler))
+        self.assertEqual(2, handler.dropped)
+
+    def test_drop_oldest(self):
+        """Test if the drop oldest policy discards the oldest queued records."""
+        handler = QueueHandler(capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        for message in ('first', 'second', 'third', 'fourth'):
+            handler.handle(UtilityClass.create_record(message), True)
+        self.assertEqual(['third', 'fourth'], self.queued_messages(handler))
+        self.assertEqual(2, handler.dropped)
+        self.assertEqual(2, handler.queue.unfinished_tasks)
+
+    def test_drop_oldest_keeps_stop_sentinel(self):
+        """Test if the drop oldest policy never discards the stop sentinel of a stopping listener."""
+        entered = threading.Semaphore(0)
+        proceed = threading.Semaphore(0)
+        messages = []
+
+        class BlockingHandler(Handler):
+            def emit(self, record, ignore_display):
+                entered.release()
+                proceed.acquire()
+                messages.append(record.message)
+
+            def flush(self):
+                pass
+
+        handler = QueueHandler(capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        listener = QueueListener(handler, [BlockingHandler()])
+        listener.start()
+        handler.handle(UtilityClass.create_record('first'), True)
+        self.assertTrue(entered.acquire(timeout=5))
+        handler.handle(UtilityClass.create_record('second'), True)
+        handler.handle(UtilityClass.create_record('third'), True)
+
+        # The queue is full, so stop waits for the listener to take a record before queueing its sentinel
+        stopping = threading.Thread(target=listener.stop, daemon=True)
+        stopping.start()
+        proceed.release()
+        self.assertTrue(entered.acquire(timeout=5))
+        proceed.release()
+        self.assertTrue(entered.acquire(timeout=5))
+        deadline = time.monotonic() + 5
+        while list(handler.queue.queue) != [None] and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertEqual([None], list(handler.queue.queue))
+
+        # The sentinel is the oldest queued item of a full queue when the records overflow it
+        handler.handle(UtilityClass.create_record('fourth'), True)
+        handler.handle(UtilityClass.create_record('fifth'), True)
+        for _ in range(3):
+            proceed.release()
+        stopping.join(5)
+        self.assertFalse(stopping.is_alive())
+        self.assertEqual(['first', 'second', 'third', 'fourth'], messages)
+        self.assertEqual(1, handler.dropped)
+
+    def test_drop_below_level(self):
+        """Test if the drop below level policy discards low level records and blocks for the others."""
+        handler = QueueHandler(capacity=1, overflow_policy=OverflowPolicy.DROP_BELOW_LEVEL, drop_level=40)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.handle(UtilityClass.create_record('dropped', 30), True)
+        self.assertEqual(1, handler.dropped)
+
+        thread = threading.Thread(target=handler.handle, args=(UtilityClass.create_record('kept', 40), True))
+        thread.start()
+        thread.join(0.05)
+        self.assertTrue(thread.is_alive())
+        handler.queue.get_nowait()
+        thread.join()
+        self.assertEqual(['kept'], self.queued_messages(handler))
+        self.assertEqual(1, handler.dropped)
+
+    def test_blocked_producer_does_not_hold_up_dropped_records(self):
+        """Test if low level records are dropped at once while a high level record waits for room."""
+        handler = QueueHandler(capacity=1, overflow_policy=OverflowPolicy.DROP_BELOW_LEVEL, drop_level=40)
+        handler.handle(UtilityClass.create_record('first'), True)
+        blocked = threading.Thread(target=handler.handle, args=(UtilityClass.create_record('kept', 40), True))
+        blocked.start()
+        blocked.join(0.05)
+        self.assertTrue(blocked.is_alive())
+
+        producer = threading.Thread(
+            target=lambda: [handler.handle(UtilityClass.create_record('dropped', 10), True) for _ in range(100)]
+        )
+        producer.start()
+        producer.join(5)
+        alive = producer.is_alive()
+        handler.queue.get_nowait()
+        blocked.join()
+        producer.join()
+        self.assertFalse(alive)
+        self.assertEqual(100, handler.dropped)
+        self.assertEqual(['kept'], self.queued_messages(handler))
+
+    def test_block(self):
+        """Test if the block policy waits until the queue has room."""
+        handler = QueueHandler(capacity=1)
+        handler.handle(UtilityClass.create_record('first'), True)
+        thread = threading.Thread(target=handler.handle, args=(UtilityClass.create_record('second'), True))
+        thread.start()
+        thread.join(0.05)
+        self.assertTrue(thread.is_alive())
+        handler.queue.get_nowait()
+        thread.join()
+        self.assertEqual(['second'], self.queued_messages(handler))
+        self.assertEqual(0, handler.dropped)
+
+    def test_needs_caller_property(self):
+        """Test if needs caller follows the handlers of the attached listener."""
+        handler = QueueHandler()
+        self.assertTrue(handler.needs_caller)
+        target = Handler()
+        QueueListener(handler, [target])
+        self.assertFalse(handler.needs_caller)
+        target.formatter = DefaultFormatter('%(class_name)s :: %(message)s')
+        self.assertTrue(handler.needs_caller)
+
+
+if __name__ == "__main__":
+    unittest.main()
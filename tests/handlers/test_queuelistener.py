@@ -0,0 +1,94 @@
+import io
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager import Logger
+from pyloggermanager.handlers import Handler, QueueHandler, QueueListener
+from utilityclass import UtilityClass
+
+
+class RecordingHandler(Handler):
+    """Handler keeping the messages and threads of the records it emits."""
+
+    def __init__(self, level: int = 20) -> None:
+        super().__init__(level=level)
+        self.messages = []
+        self.threads = []
+        self.flushed = 0
+
+    def emit(self, record, ignore_display: bool) -> None:
+        self.messages.append(record.message)
+        self.threads.append(threading.current_thread().name)
+
+    def flush(self) -> None:
+        self.flushed += 1
+
+
+class TestQueueListener(unittest.TestCase):
+    """Unit test cases for QueueListener class."""
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            QueueListener(Handler(), [])
+        with self.assertRaises(TypeError):
+            QueueListener(QueueHandler(), 'handlers')
+        with self.assertRaises(TypeError):
+            QueueListener(QueueHandler(), ['handler'])
+
+    def test_start_stop(self):
+        """Test if the listener writes queued records on its own thread and drains the queue on stop."""
+        queue_handler = QueueHandler()
+        info_handler = RecordingHandler()
+        error_handler = RecordingHandler(level=40)
+        listener = QueueListener(queue_handler, [info_handler, error_handler])
+        logger = Logger(name='TestQueueLogger')
+        logger.add_handler(queue_handler)
+
+        listener.start()
+        self.assertTrue(listener.is_alive())
+        for index in range(100):
+            logger.info('Message %d', args=(index,))
+        logger.error('Error message')
+        listener.stop()
+
+        self.assertFalse(listener.is_alive())
+        self.assertEqual([f'Message {index}' for index in range(100)] + ['Error message'], info_handler.messages)
+        self.assertEqual(['Error message'], error_handler.messages)
+        self.assertEqual({'QueueListener'}, set(info_handler.threads))
+        self.assertEqual(1, info_handler.flushed)
+        self.assertEqual(0, queue_handler.queue.qsize())
+
+    def test_start_twice(self):
+        """Test if start raises RuntimeError when the listener is already running."""
+        listener = QueueListener(QueueHandler(), [RecordingHandler()])
+        listener.start()
+        try:
+            with self.assertRaises(RuntimeError):
+                listener.start()
+        finally:
+            listener.stop()
+
+    def test_handler_error_does_not_stop_listener(self):
+        """Test if a failing handler does not stop the records reaching the other handlers."""
+        queue_handler = QueueHandler()
+        recording_handler = RecordingHandler()
+        listener = QueueListener(queue_handler, [Handler(), recording_handler])
+        logger = Logger(name='TestQueueLogger')
+        logger.add_handler(queue_handler)
+
+        listener.start()
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            logger.info('First message')
+            logger.info('Second message')
+            listener.stop()
+        self.assertEqual(['First message', 'Second message'], recording_handler.messages)
+        self.assertIn('NotImplementedError', stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import RingBufferHandler
+from utilityclass import UtilityClass
+
+
+class TestRingBufferHandler(unittest.TestCase):
+    """Unit test cases for RingBufferHandler class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'flight.ring')
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        UtilityClass.delete_directory(self.directory)
+
+    def make_handler(self, size: int = 4096) -> RingBufferHandler:
+        """Creates a handler writing bare messages to the test ring buffer file."""
+        return RingBufferHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name, size=size)
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        handler = RingBufferHandler()
+        self.assertEqual(10, handler.level)
+        self.assertEqual('flight.ring', handler.filename)
+        self.assertEqual(8 * 1024 * 1024, handler.size)
+        self.assertEqual('UTF-8', handler.encoding)
+        self.assertEqual(0, handler.used)
+        self.assertFalse(os.path.exists('flight.ring'))
+
+    def test_init_invalid_inputs(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            RingBufferHandler(file_name=100)
+        with self.assertRaises(TypeError):
+            RingBufferHandler(size='4096')
+        with self.assertRaises(TypeError):
+            RingBufferHandler(size=True)
+        with self.assertRaises(TypeError):
+            RingBufferHandler(encoding=8)
+        with self.assertRaises(ValueError):
+            RingBufferHandler(size=1024)
+
+    def test_emit_and_dump(self):
+        """Test if dump returns the emitted records in order, without the handler being closed"""
+        handler = self.make_handler()
+        for index in range(5):
+            handler.handle(UtilityClass.create_record(f'message {index}', 10), True)
+
+        self.assertEqual(4096, os.path.getsize(self.file_name))
+        self.assertEqual([f'message {index}' for index in range(5)], RingBufferHandler.dump(self.file_name))
+
+    def test_emit_without_system_calls(self):
+        """Test if emitting a record into a mapped buffer does not write to the file"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        with patch('os.write') as write, patch('os.open') as open_file:
+            handler.handle(UtilityClass.create_record('second', 10), True)
+        write.assert_not_called()
+        open_file.assert_not_called()
+
+    def test_emit_wraps_around(self):
+        """Test if the oldest records are overwritten once the buffer is full"""
+        handler = self.make_handler()
+        messages = [f'message {index:05d} ' + 'x' * 40 for index in range(1000)]
+        for message in messages:
+            handler.handle(UtilityClass.create_record(message, 10), True)
+
+        records = RingBufferHandler.dump(self.file_name)
+        self.assertLess(len(records), 1000)
+        self.assertEqual(messages[-len(records):], records)
+        self.assertLessEqual(handler.used, 4096 - 32)
+        self.assertGreater(handler.used, 4096 - 32 - 64)
+
+    def test_emit_larger_than_buffer(self):
+        """Test if a record larger than the buffer is truncated and replaces all other records"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        handler.handle(UtilityClass.create_record('x' * 10000, 10), True)
+
+        self.assertEqual(['x' * (4096 - 32 - 4)], RingBufferHandler.dump(self.file_name))
+
+    def test_handle_batch(self):
+        """Test if handle batch copies every record of the batch into the buffer"""
+        handler = self.make_handler()
+        handler.handle_batch([UtilityClass.create_record(f'message {index}', 10) for index in range(3)], True)
+
+        self.assertEqual(['message 0', 'message 1', 'message 2'], RingBufferHandler.dump(self.file_name))
+
+    def test_reopen_keeps_records(self):
+        """Test if a new handler on an existing file appends after the records kept in it"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        handler.close()
+
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('second', 10), True)
+
+        self.assertEqual(['first', 'second'], RingBufferHandler.dump(self.file_name))
+
+    def test_reopen_with_other_size(self):
+        """Test if a new handler with another size starts with an empty buffer"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        handler.close()
+
+        handler = self.make_handler(8192)
+        handler.handle(UtilityClass.create_record('second', 10), True)
+
+        self.assertEqual(8192, os.path.getsize(self.file_name))
+        self.assertEqual(['second'], RingBufferHandler.dump(self.file_name))
+
+    def test_close_and_emit(self):
+        """Test if a closed handler maps the buffer again on the next record"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        handler.close()
+        handler.close()
+        handler.handle(UtilityClass.create_record('second', 10), True)
+
+        self.assertEqual(['first', 'second'], RingBufferHandler.dump(self.file_name))
+
+    def test_after_fork_in_child(self):
+        """Test if the handler stops recording in a forked child"""
+        handler = self.make_handler()
+        handler.handle(UtilityClass.create_record('first', 10), True)
+        handler._after_fork_in_child()
+        handler.handle(UtilityClass.create_record('second', 10), True)
+        handler.handle_batch([UtilityClass.create_record('third', 10)], True)
+
+        self.assertEqual(['first'], RingBufferHandler.dump(self.file_name))
+
+    def test_dump_invalid_file(self):
+        """Test if dump raises ValueError for a file that is not a ring buffer file"""
+        with open(self.file_name, 'w', encoding='UTF-8') as file:
+            file.write('not a ring buffer file' * 10)
+
+        with self.assertRaises(ValueError):
+            RingBufferHandler.dump(self.file_name)
+        with self.assertRaises(TypeError):
+            RingBufferHandler.dump(100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import gzip
+import io
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Compressor, FlushPolicy, RotatingFileHandler
+from utilityclass import UtilityClass
+
+
+class TestRotatingFileHandler(unittest.TestCase):
+    """Unit test cases for RotatingFileHandler class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'rotating.log')
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        UtilityClass.delete_directory(self.directory)
+
+    def read(self, file_name: str) -> str:
+        """Returns the content of the given file."""
+        with open(file_name, 'r', encoding='UTF-8') as file:
+            return file.read()
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        handler = RotatingFileHandler()
+        self.assertEqual(0, handler.max_bytes)
+        self.assertEqual(0, handler.backup_count)
+        self.assertEqual('a', handler.filemode)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            RotatingFileHandler(max_bytes='10')
+        with self.assertRaises(TypeError):
+            RotatingFileHandler(backup_count='1')
+        with self.assertRaises(ValueError):
+            RotatingFileHandler(max_bytes=-1)
+
+    def test_rollover_keeps_backups(self):
+        """Test if the file rolls over at the maximum size and keeps the newest backups."""
+        for keep_open, raw in ((False, False), (True, False), (False, True), (True, True)):
+            with self.subTest(keep_open=keep_open, raw=raw):
+                handler = RotatingFileHandler(
+                    formatter=DefaultFormatter('%(message)s'),
+                    file_name=self.file_name,
+                    keep_open=keep_open,
+                    max_bytes=20,
+                    backup_count=2,
+                    raw=raw
+                )
+                for index in range(8):
+                    handler.handle(UtilityClass.create_record(f'message {index}'), True)
+                handler.close()
+
+                self.assertEqual('message 6\nmessage 7\n', self.read(self.file_name))
+                self.assertEqual('message 4\nmessage 5\n', self.read(f'{self.file_name}.1'))
+                self.assertEqual('message 2\nmessage 3\n', self.read(f'{self.file_name}.2'))
+                self.assertEqual(['rotating.log', 'rotating.log.1', 'rotating.log.2'],
+                                 sorted(os.listdir(self.directory)))
+                for file_name in os.listdir(self.directory):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def test_rollover_without_backups(self):
+        """Test if the rolled over file is discarded when no backups are kept."""
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=20)
+        for index in range(3):
+            handler.handle(UtilityClass.create_record(f'message {index}'), True)
+        self.assertEqual('message 2\n', self.read(self.file_name))
+        self.assertEqual(['rotating.log'], os.listdir(self.directory))
+
+    def test_size_tracked_in_memory(self):
+        """Test if the file size is only inspected once instead of for every record."""
+        with open(self.file_name, 'w', encoding='UTF-8') as file:
+            file.write('existing 1\n')
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      keep_open=True, max_bytes=31, backup_count=1)
+        with patch('os.path.getsize', wraps=os.path.getsize) as getsize:
+            for index in range(4):
+                handler.handle(UtilityClass.create_record(f'message {index}'), True)
+        handler.close()
+        self.assertEqual(1, getsize.call_count)
+        self.assertEqual('existing 1\nmessage 0\nmessage 1\n', self.read(f'{self.file_name}.1'))
+        self.assertEqual('message 2\nmessage 3\n', self.read(self.file_name))
+
+    def test_size_counts_encoded_bytes(self):
+        """Test if the tracked size counts encoded bytes rather than characters."""
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=11, backup_count=1)
+        handler.handle(UtilityClass.create_record('éééé'), True)
+        handler.handle(UtilityClass.create_record('ab'), True)
+        self.assertEqual('éééé\n', self.read(f'{self.file_name}.1'))
+        self.assertEqual('ab\n', self.read(self.file_name))
+
+    def test_rollover_compresses_backups(self):
+        """Test if backups are compressed in the background and keep shifting once compressed."""
+        compressor = Compressor()
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=20, backup_count=2, compressor=compressor)
+        for index in range(8):
+            handler.handle(UtilityClass.create_record(f'message {index}'), True)
+        compressor.wait()
+
+        self.assertEqual(['rotating.log', 'rotating.log.1.gz', 'rotating.log.2.gz'],
+                         sorted(os.listdir(self.directory)))
+        with gzip.open(f'{self.file_name}.1.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('message 4\nmessage 5\n', file.read())
+        with gzip.open(f'{self.file_name}.2.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('message 2\nmessage 3\n', file.read())
+
+    def test_rollover_does_not_wait_for_compression(self):
+        """Test if roll overs go on while a backup is compressed and shift the backups once it is done."""
+        compressor = Compressor()
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=20, backup_count=2, compressor=compressor)
+        release = threading.Event()
+        compress = compressor._compress
+
+        def blocking_compress(file_name: str) -> str | None:
+            release.wait()
+            return compress(file_name)
+
+        def log() -> None:
+            for index in range(8):
+                handler.handle(UtilityClass.create_record(f'message {index}'), True)
+
+        with patch.object(compressor, '_compress', side_effect=blocking_compress):
+            thread = threading.Thread(target=log)
+            thread.start()
+            try:
+                thread.join(5)
+                self.assertFalse(thread.is_alive())
+                self.assertEqual('message 6\nmessage 7\n', self.read(self.file_name))
+            finally:
+                release.set()
+                thread.join()
+            compressor.wait()
+
+        self.assertEqual(['rotating.log', 'rotating.log.1.gz', 'rotating.log.2.gz'],
+                         sorted(os.listdir(self.directory)))
+        with gzip.open(f'{self.file_name}.1.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('message 4\nmessage 5\n', file.read())
+        with gzip.open(f'{self.file_name}.2.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('message 2\nmessage 3\n', file.read())
+
+    def test_rollover_keeps_backup_failing_compression(self):
+        """Test if a backup whose compression failed is reported, kept uncompressed and shifted."""
+        compressor = Compressor()
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=20, backup_count=2, compressor=compressor)
+        with patch.object(compressor, '_open', side_effect=OSError('disk full')), \
+                patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            for index in range(4):
+                handler.handle(UtilityClass.create_record(f'message {index}'), True)
+            compressor.wait()
+        self.assertIn('disk full', stderr.getvalue())
+        self.assertEqual('message 0\nmessage 1\n', self.read(f'{self.file_name}.1'))
+
+        for index in range(4, 6):
+            handler.handle(UtilityClass.create_record(f'message {index}'), True)
+        compressor.wait()
+        self.assertEqual(['rotating.log', 'rotating.log.1.gz', 'rotating.log.2'],
+                         sorted(os.listdir(self.directory)))
+        self.assertEqual('message 0\nmessage 1\n', self.read(f'{self.file_name}.2'))
+        with gzip.open(f'{self.file_name}.1.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('message 2\nmessage 3\n', file.read())
+
+    def test_handle_batch_rolls_over(self):
+        """Test if a batch is split at the maximum size like records handled one by one."""
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      keep_open=True, max_bytes=20, backup_count=3)
+        handler.handle(UtilityClass.create_record('message 0'), True)
+        handler.handle_batch([UtilityClass.create_record(f'message {index}') for index in range(1, 6)], True)
+        handler.close()
+
+        self.assertEqual('message 4\nmessage 5\n', self.read(self.file_name))
+        self.assertEqual('message 2\nmessage 3\n', self.read(f'{self.file_name}.1'))
+        self.assertEqual('message 0\nmessage 1\n', self.read(f'{self.file_name}.2'))
+
+    def test_handle_batch_flush_policy_records(self):
+        """Test if every record of a batch counts against the records threshold of the flush policy."""
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      keep_open=True, flush_policy=FlushPolicy(records=10), max_bytes=300,
+                                      backup_count=1)
+        handler.handle_batch([UtilityClass.create_record(f'message {index}') for index in range(50)], True)
+        self.assertEqual(0, handler._pending_records)
+        self.assertEqual(50, len(self.read(self.file_name).splitlines()) +
+                         len(self.read(f'{self.file_name}.1').splitlines()))
+
+    def test_do_rollover(self):
+        """Test if do rollover rolls the file over regardless of its size."""
+        handler = RotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                      max_bytes=1000, backup_count=1)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.do_rollover()
+        handler.handle(UtilityClass.create_record('second'), True)
+        self.assertEqual('first\n', self.read(f'{self.file_name}.1'))
+        self.assertEqual('second\n', self.read(self.file_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
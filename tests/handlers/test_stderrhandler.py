@@ -1,6 +1,10 @@
+import inspect
+import io
 import sys
 import unittest
+from unittest.mock import patch
 
+from pyloggermanager import CallerFrame, Record
 from pyloggermanager.handlers import Handler, StderrHandler
 
 
@@ -24,6 +28,19 @@ class TestStderrHandler(unittest.TestCase):
         expected_stream = sys.stderr
         self.assertEqual(handler.stream, expected_stream)
 
+    def test_emit(self):
+        """Test if emit writes the formatted record to stderr."""
+        handler = StderrHandler()
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=CallerFrame.get_caller_details(inspect.currentframe())
+        )
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            handler.emit(record, True)
+        self.assertEqual(handler.format(record) + '\n', stderr.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
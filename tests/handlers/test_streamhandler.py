@@ -6,7 +6,7 @@ import unittest
 from pycolorecho import ColorMapper, TextColor
 
 from pyloggermanager import CallerFrame, Record
-from pyloggermanager.formatters import Formatter
+from pyloggermanager.formatters import Formatter, DefaultFormatter
 from pyloggermanager.handlers import Handler, StreamHandler
 from pyloggermanager.streams import Stream, StderrStream
 
@@ -146,6 +146,32 @@ class TestStreamHandler(unittest.TestCase):
         handler = StreamHandler()
         handler.flush()
 
+    def test_emit_batch(self):
+        """Test if emit batch writes the whole batch to the stream at once."""
+        writes = []
+
+        class RecordingStream(Stream):
+            def write(self, message: str) -> None:
+                writes.append(message)
+
+            def flush(self) -> None:
+                pass
+
+        handler = StreamHandler(formatter=DefaultFormatter('%(message)s'), stream=RecordingStream())
+        caller_frame = CallerFrame().get_caller_details(inspect.currentframe())
+        records = [Record(
+            message=f'Test message {index}',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=caller_frame
+        ) for index in range(3)]
+        output_buffer = io.StringIO()
+        sys.stdout = output_buffer
+        handler.handle_batch(records, False)
+        sys.stdout = sys.__stdout__
+        self.assertEqual(['Test message 0\nTest message 1\nTest message 2\n'], writes)
+        self.assertEqual('Test message 0\nTest message 1\nTest message 2\n', output_buffer.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import unittest
+
+from pyloggermanager import Logger
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Handler, TailSamplingHandler
+from utilityclass import UtilityClass
+
+
+class RecordingHandler(Handler):
+    """Handler recording the messages it emits."""
+
+    def __init__(self, level: int = 10) -> None:
+        super().__init__(level=level, formatter=DefaultFormatter('%(message)s'))
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record, ignore_display: bool) -> None:
+        self.messages.append(self.format(record))
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class TestTailSamplingHandler(unittest.TestCase):
+    """Unit test cases for TailSamplingHandler class."""
+
+    def setUp(self) -> None:
+        self.target = RecordingHandler()
+        self.handler = TailSamplingHandler(self.target)
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+
+    def log(self, message: str, level_number: int = 10) -> None:
+        """Handles a record with the given message and level."""
+        self.handler.handle(UtilityClass.create_record(message, level_number), True)
+
+    def test_init_valid(self):
+        """Test if init method initializes all the required variables."""
+        self.assertIs(self.target, self.handler.target)
+        self.assertEqual(10, self.handler.level)
+        self.assertEqual(1000, self.handler.capacity)
+        self.assertEqual(30, self.handler.buffer_level)
+        self.assertEqual(40, self.handler.trigger_level)
+        self.assertEqual(0, self.handler.pending)
+        self.assertEqual(0, self.handler.discarded)
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            TailSamplingHandler('target')
+        with self.assertRaises(TypeError):
+            TailSamplingHandler(self.target, capacity='10')
+        with self.assertRaises(TypeError):
+            TailSamplingHandler(self.target, buffer_level='DEBUG')
+        with self.assertRaises(TypeError):
+            TailSamplingHandler(self.target, trigger_level='ERROR')
+        with self.assertRaises(ValueError):
+            TailSamplingHandler(self.target, capacity=0)
+        with self.assertRaises(ValueError):
+            TailSamplingHandler(self.target, buffer_level=50, trigger_level=40)
+
+    def test_context_invalid(self):
+        """Test if context raises TypeError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            with TailSamplingHandler.context(1.5):
+                pass
+
+    def test_context_generates_identifier(self):
+        """Test if context yields the given or a new unique identifier."""
+        with TailSamplingHandler.context('request-1') as context_id:
+            self.assertEqual('request-1', context_id)
+        with TailSamplingHandler.context() as first, TailSamplingHandler.context() as second:
+            self.assertNotEqual(first, second)
+
+    def test_outside_context_forwarded(self):
+        """Test if records logged outside a context are forwarded directly."""
+        self.log('debug')
+        self.assertEqual(['debug'], self.target.messages)
+
+    def test_context_without_trigger_discarded(self):
+        """Test if buffered records are discarded when the context ends without a trigger record."""
+        with TailSamplingHandler.context():
+            self.log('debug 0')
+            self.log('info', 20)
+            self.log('warning', 30)
+            self.assertEqual(2, self.handler.pending)
+        self.assertEqual(['warning'], self.target.messages)
+        self.assertEqual(0, self.handler.pending)
+        self.assertEqual(2, self.handler.discarded)
+
+    def test_trigger_forwards_context(self):
+        """Test if a trigger record forwards the buffered records of its context ahead of it."""
+        with TailSamplingHandler.context():
+            self.log('debug 0')
+            self.log('debug 1')
+            self.log('error', 40)
+            self.log('debug 2')
+        self.assertEqual(['debug 0', 'debug 1', 'error', 'debug 2'], self.target.messages)
+        self.assertEqual(1, self.target.flushes)
+        self.assertEqual(0, self.handler.discarded)
+
+    def test_ring_bounded(self):
+        """Test if only the newest records are kept per context."""
+        handler = TailSamplingHandler(self.target, capacity=2)
+        self.handler.close()
+        self.handler = handler
+        with TailSamplingHandler.context():
+            for index in range(4):
+                self.log(f'debug {index}')
+            self.log('error', 40)
+        self.assertEqual(['debug 2', 'debug 3', 'error'], self.target.messages)
+        self.assertEqual(2, handler.discarded)
+
+    def test_target_level(self):
+        """Test if records below the target's level are not forwarded."""
+        self.target.level = 20
+        with TailSamplingHandler.context():
+            self.log('debug')
+            self.log('info', 20)
+            self.log('error', 40)
+        self.assertEqual(['info', 'error'], self.target.messages)
+
+    def test_contexts_isolated_between_threads(self):
+        """Test if a trigger record only forwards the records of its own context."""
+        barrier = threading.Barrier(2)
+
+        def request(name: str, fail: bool) -> None:
+            with TailSamplingHandler.context(name):
+                self.log(f'{name} debug')
+                barrier.wait()
+                if fail:
+                    self.log(f'{name} error', 40)
+                barrier.wait()
+
+        threads = [threading.Thread(target=request, args=('ok', False)),
+                   threading.Thread(target=request, args=('failed', True))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(['failed debug', 'failed error'], self.target.messages)
+
+    def test_contexts_isolated_between_tasks(self):
+        """Test if sampling contexts follow asyncio tasks."""
+        async def request(name: str, fail: bool) -> None:
+            with TailSamplingHandler.context(name):
+                self.log(f'{name} debug')
+                await asyncio.sleep(0)
+                if fail:
+                    self.log(f'{name} error', 40)
+
+        async def main() -> None:
+            await asyncio.gather(request('ok', False), request('failed', True))
+
+        asyncio.run(main())
+        self.assertEqual(['failed debug', 'failed error'], self.target.messages)
+
+    def test_logger_integration(self):
+        """Test if the handler samples records logged through a logger."""
+        logger = Logger(name='TailSamplingLogger', level=10)
+        logger.add_handler(self.handler)
+        with TailSamplingHandler.context():
+            logger.debug('discarded', ignore_display=True)
+        with TailSamplingHandler.context():
+            logger.debug('kept', ignore_display=True)
+            logger.error('failed', ignore_display=True)
+        logger.remove_handler(self.handler)
+        self.assertEqual(['kept', 'failed'], self.target.messages)
+
+    def test_close_discards(self):
+        """Test if close discards the buffered records."""
+        with TailSamplingHandler.context():
+            self.log('debug')
+            self.handler.close()
+            self.assertEqual(0, self.handler.pending)
+        self.assertEqual([], self.target.messages)
+        self.assertEqual(1, self.handler.discarded)
+
+    def test_needs_caller_property(self):
+        """Test if needs caller follows the target handler."""
+        self.assertFalse(self.handler.needs_caller)
+        self.target.formatter = DefaultFormatter('%(message)s in %(function_name)s')
+        self.assertTrue(self.handler.needs_caller)
+
+
+if __name__ == "__main__":
+    unittest.main()
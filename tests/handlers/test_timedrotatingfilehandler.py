@@ -0,0 +1,206 @@
+import calendar
+import gzip
+import io
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import Compressor, TimedRotatingFileHandler
+from utilityclass import UtilityClass
+
+
+class TestTimedRotatingFileHandler(unittest.TestCase):
+    """Unit test cases for TimedRotatingFileHandler class."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'timed.log')
+
+    def tearDown(self) -> None:
+        UtilityClass.close_handlers()
+        UtilityClass.delete_directory(self.directory)
+
+    def read(self, file_name: str) -> str:
+        """Returns the content of the given file."""
+        with open(file_name, 'r', encoding='UTF-8') as file:
+            return file.read()
+
+    def test_init_no_input(self):
+        """Test if init method is initialized without inputs."""
+        handler = TimedRotatingFileHandler(file_name=self.file_name)
+        self.assertEqual('D', handler.when)
+        self.assertEqual(1, handler.interval)
+        self.assertFalse(handler.utc)
+        self.assertEqual(0, handler.backup_count)
+        self.assertEqual(0, handler.max_age)
+        self.assertEqual('a', handler.filemode)
+        self.assertGreater(handler.rollover_at, time.time())
+
+    def test_init_invalid(self):
+        """Test if init raises TypeError or ValueError when invalid inputs are provided."""
+        with self.assertRaises(TypeError):
+            TimedRotatingFileHandler(file_name=self.file_name, when=1)
+        with self.assertRaises(TypeError):
+            TimedRotatingFileHandler(file_name=self.file_name, interval='1')
+        with self.assertRaises(TypeError):
+            TimedRotatingFileHandler(file_name=self.file_name, utc='yes')
+        with self.assertRaises(TypeError):
+            TimedRotatingFileHandler(file_name=self.file_name, max_age='1')
+        with self.assertRaises(ValueError):
+            TimedRotatingFileHandler(file_name=self.file_name, when='W')
+        with self.assertRaises(ValueError):
+            TimedRotatingFileHandler(file_name=self.file_name, interval=0)
+        with self.assertRaises(ValueError):
+            TimedRotatingFileHandler(file_name=self.file_name, backup_count=-1)
+
+    def test_rollover_at_utc_boundaries(self):
+        """Test if the rollover timestamp is aligned to the UTC unit boundaries."""
+        now = calendar.timegm((2024, 3, 22, 23, 48, 30))
+        with patch('time.time', return_value=now):
+            hourly = TimedRotatingFileHandler(file_name=self.file_name, when='H', interval=2, utc=True)
+            daily = TimedRotatingFileHandler(file_name=self.file_name, when='d', utc=True)
+        self.assertEqual(calendar.timegm((2024, 3, 23, 0, 0, 0)), hourly.rollover_at)
+        self.assertEqual(calendar.timegm((2024, 3, 23, 0, 0, 0)), daily.rollover_at)
+
+    def test_rollover_at_local_midnight(self):
+        """Test if the daily rollover timestamp is the next local midnight."""
+        handler = TimedRotatingFileHandler(file_name=self.file_name)
+        midnight = time.localtime(handler.rollover_at)
+        self.assertEqual((0, 0, 0), (midnight.tm_hour, midnight.tm_min, midnight.tm_sec))
+        self.assertLessEqual(handler.rollover_at - time.time(), 86400 + 3600)
+
+    def test_rollover_renames_after_period(self):
+        """Test if the log file is renamed after the period it covers once the period ends."""
+        start = calendar.timegm((2024, 3, 22, 10, 15, 0))
+        for keep_open in (False, True):
+            with self.subTest(keep_open=keep_open):
+                with patch('time.time', return_value=start):
+                    handler = TimedRotatingFileHandler(
+                        formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                        keep_open=keep_open, when='H', utc=True
+                    )
+                    handler.handle(UtilityClass.create_record('first'), True)
+                with patch('time.time', return_value=start + 3600):
+                    handler.handle(UtilityClass.create_record('second'), True)
+                handler.close()
+
+                self.assertEqual('first\n', self.read(f'{self.file_name}.2024-03-22_10'))
+                self.assertEqual('second\n', self.read(self.file_name))
+                self.assertEqual(calendar.timegm((2024, 3, 22, 12, 0, 0)), handler.rollover_at)
+                for file_name in os.listdir(self.directory):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def test_existing_file_continues_its_period(self):
+        """Test if an existing log file is rolled over according to its modification time."""
+        with open(self.file_name, 'w', encoding='UTF-8') as file:
+            file.write('old\n')
+        old = calendar.timegm((2024, 3, 21, 8, 0, 0))
+        os.utime(self.file_name, (old, old))
+
+        handler = TimedRotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                           utc=True)
+        handler.handle(UtilityClass.create_record('new'), True)
+        self.assertEqual('old\n', self.read(f'{self.file_name}.2024-03-21'))
+        self.assertEqual('new\n', self.read(self.file_name))
+
+    def test_rollover_compresses_backups(self):
+        """Test if backups are compressed in the background and still counted as backups."""
+        compressor = Compressor(codec=Compressor.GZIP)
+        with open(f'{self.file_name}.2024-03-01.gz', 'wb') as file:
+            file.write(gzip.compress(b'old\n'))
+
+        handler = TimedRotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                           utc=True, backup_count=1, compressor=compressor)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.do_rollover()
+        compressor.wait()
+        handler.close()
+
+        backups = handler.get_backups()
+        self.assertEqual(1, len(backups))
+        self.assertTrue(backups[0].endswith('.gz'))
+        with gzip.open(backups[0], 'rt', encoding='UTF-8') as file:
+            self.assertEqual('first\n', file.read())
+
+    def test_retention_waits_for_compression(self):
+        """Test if backups are only deleted by the retention once their compression is done."""
+        compressor = Compressor(codec=Compressor.GZIP)
+        release = threading.Event()
+        compress = compressor._compress
+
+        def blocking_compress(file_name: str) -> str | None:
+            release.wait(5)
+            return compress(file_name)
+
+        start = calendar.timegm((2024, 3, 22, 10, 15, 0))
+        with patch.object(compressor, '_compress', side_effect=blocking_compress), \
+                patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with patch('time.time', return_value=start):
+                handler = TimedRotatingFileHandler(formatter=DefaultFormatter('%(message)s'),
+                                                   file_name=self.file_name, when='S', utc=True, backup_count=1,
+                                                   compressor=compressor)
+                handler.handle(UtilityClass.create_record('first'), True)
+            with patch('time.time', return_value=start + 1):
+                handler.handle(UtilityClass.create_record('second'), True)
+            with patch('time.time', return_value=start + 2):
+                handler.handle(UtilityClass.create_record('third'), True)
+            release.set()
+            handler.close()
+            compressor.wait()
+
+        self.assertEqual('', stderr.getvalue())
+        self.assertEqual(['timed.log', 'timed.log.2024-03-22_10-15-01.gz'], sorted(os.listdir(self.directory)))
+        with gzip.open(f'{self.file_name}.2024-03-22_10-15-01.gz', 'rt', encoding='UTF-8') as file:
+            self.assertEqual('second\n', file.read())
+
+    def test_retention_by_count(self):
+        """Test if only the newest backups are kept."""
+        for day in range(1, 5):
+            with open(f'{self.file_name}.2024-03-0{day}', 'w', encoding='UTF-8') as file:
+                file.write('old\n')
+        with open(f'{self.file_name}.unrelated', 'w', encoding='UTF-8') as file:
+            file.write('kept\n')
+
+        handler = TimedRotatingFileHandler(formatter=DefaultFormatter('%(message)s'), file_name=self.file_name,
+                                           utc=True, backup_count=2)
+        handler.handle(UtilityClass.create_record('first'), True)
+        handler.do_rollover()
+        handler.close()
+
+        backups = [os.path.basename(backup) for backup in handler.get_backups()]
+        self.assertEqual(2, len(backups))
+        self.assertEqual('timed.log.2024-03-04', backups[0])
+        self.assertTrue(os.path.exists(f'{self.file_name}.unrelated'))
+
+    def test_retention_by_age(self):
+        """Test if backups older than the maximum age are deleted."""
+        expired = f'{self.file_name}.2024-03-01'
+        recent = f'{self.file_name}.2024-03-02'
+        for file_name in (expired, recent):
+            with open(file_name, 'w', encoding='UTF-8') as file:
+                file.write('old\n')
+        os.utime(expired, (time.time() - 7200, time.time() - 7200))
+
+        handler = TimedRotatingFileHandler(file_name=self.file_name, utc=True, max_age=3600)
+        handler.do_rollover()
+        handler.close()
+
+        self.assertFalse(os.path.exists(expired))
+        self.assertTrue(os.path.exists(recent))
+
+    def test_expired_deleted_off_logging_thread(self):
+        """Test if expired backups are deleted by a background worker."""
+        threads = []
+        handler = TimedRotatingFileHandler(file_name=self.file_name, utc=True, backup_count=1)
+        with patch.object(handler, '_remove_expired', side_effect=lambda: threads.append(threading.current_thread())):
+            handler.do_rollover()
+            handler.close()
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(threading.main_thread(), threads[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
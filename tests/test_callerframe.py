@@ -1,3 +1,4 @@
+import gc
 import inspect
 import unittest
 
@@ -35,6 +36,65 @@ class TestCallerFrame(unittest.TestCase):
         self.assertEqual(caller_frame.module_name, expected_module_name)
         assert caller_frame.path_name.endswith(expected_path_name)
 
+    def test_get_caller_details_cached(self):
+        """Test if the caller details of a code object are resolved once and reused."""
+        frame = inspect.currentframe()
+        CallerFrame.clear_cache()
+        first = CallerFrame.get_caller_details(frame)
+        self.assertIn(frame.f_code, CallerFrame._cache)
+        second = CallerFrame.get_caller_details(frame)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.__dict__, second.__dict__)
+
+    def test_get_caller_details_function_without_self(self):
+        """Test if frames without a 'self' local are skipped up to the calling method."""
+        def helper():
+            return CallerFrame.get_caller_details(inspect.currentframe())
+
+        caller_frame = helper()
+        self.assertEqual(caller_frame.class_name, 'TestCallerFrame')
+        self.assertEqual(caller_frame.function_name, 'test_get_caller_details_function_without_self')
+
+    def test_get_caller_details_closure_with_self(self):
+        """Test if a closure referencing 'self' is reported as the caller."""
+        def helper():
+            return self, CallerFrame.get_caller_details(inspect.currentframe())
+
+        _, caller_frame = helper()
+        self.assertEqual(caller_frame.class_name, 'TestCallerFrame')
+        self.assertEqual(caller_frame.function_name, 'helper')
+
+    def test_get_caller_details_class_name_per_instance(self):
+        """Test if the class name follows the instance even when the code object is cached."""
+        class Base:
+            def details(self):
+                return CallerFrame.get_caller_details(inspect.currentframe())
+
+        class Child(Base):
+            pass
+
+        self.assertEqual(Base().details().class_name, 'Base')
+        self.assertEqual(Child().details().class_name, 'Child')
+
+    def test_cache_entries_dropped_with_code(self):
+        """Test if entries for discarded code objects, e.g. of reloaded modules, are dropped."""
+        namespace = {'__file__': 'reloaded_module.py', 'CallerFrame': CallerFrame, 'inspect': inspect}
+        exec('class Reloaded:\n'
+             '    def details(self):\n'
+             '        return CallerFrame.get_caller_details(inspect.currentframe())\n', namespace)
+        caller_frame = namespace['Reloaded']().details()
+        self.assertEqual(caller_frame.file_name, 'reloaded_module')
+        size = len(CallerFrame._cache)
+        namespace.clear()
+        gc.collect()
+        self.assertLess(len(CallerFrame._cache), size)
+
+    def test_clear_cache(self):
+        """Test if clear cache removes all the cached caller details."""
+        CallerFrame.get_caller_details(inspect.currentframe())
+        CallerFrame.clear_cache()
+        self.assertEqual(len(CallerFrame._cache), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
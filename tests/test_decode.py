@@ -0,0 +1,106 @@
+import gzip
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from pyloggermanager import decode
+from pyloggermanager.formatters import BinaryFormatter, DefaultFormatter
+from utilityclass import UtilityClass
+
+
+class TestDecode(unittest.TestCase):
+    """Unit test cases for the decode command line tool."""
+
+    def setUp(self) -> None:
+        self.directory = UtilityClass.create_directory()
+        self.file_name = os.path.join(self.directory, 'app.bin')
+        formatter = BinaryFormatter()
+        table = {}
+        self.data = BinaryFormatter.MAGIC + b''.join(
+            formatter.encode(UtilityClass.create_record(f'message {index}'), table)
+            for index in range(3)
+        )
+        with open(self.file_name, 'wb') as file:
+            file.write(self.data)
+
+    def tearDown(self) -> None:
+        UtilityClass.delete_directory(self.directory)
+
+    def run_main(self, argv: list) -> tuple:
+        """Runs the decoder and returns its exit status and output."""
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            status = decode.main(argv)
+        return status, stdout.getvalue()
+
+    def test_decode(self):
+        """Test if decode renders every record with the given formatter"""
+        output = io.StringIO()
+        with open(self.file_name, 'rb') as file:
+            count = decode.decode(file, DefaultFormatter('%(level_name)s %(message)s'), output)
+        self.assertEqual(3, count)
+        self.assertEqual('INFO message 0\nINFO message 1\nINFO message 2\n', output.getvalue())
+
+    def test_decode_invalid_formatter(self):
+        """Test if decode raises TypeError for a binary formatter"""
+        with self.assertRaises(TypeError):
+            decode.decode(io.BytesIO(self.data), BinaryFormatter(), io.StringIO())
+
+    def test_main(self):
+        """Test if main renders a file with the default formatter"""
+        status, output = self.run_main([self.file_name])
+        self.assertEqual(0, status)
+        self.assertEqual(3, len(output.splitlines()))
+        self.assertTrue(output.splitlines()[0].endswith(' :: INFO :: message 0'))
+
+    def test_main_format(self):
+        """Test if main renders records with the given formatter and format string"""
+        status, output = self.run_main(['--formatter', 'csv', '--format', '%(logger_name)s,%(message)s',
+                                        self.file_name])
+        self.assertEqual(0, status)
+        self.assertEqual('TestLogger,message 0\nTestLogger,message 1\nTestLogger,message 2\n', output)
+
+        status, output = self.run_main(['--formatter', 'json', '--format', '{"m": "%(message)s"}', self.file_name])
+        self.assertEqual(0, status)
+        self.assertEqual(3, output.count('"m": "message'))
+
+    def test_main_compressed(self):
+        """Test if main decompresses files compressed by a Compressor"""
+        with gzip.open(self.file_name + '.gz', 'wb') as file:
+            file.write(self.data)
+
+        status, output = self.run_main([self.file_name + '.gz', self.file_name])
+        self.assertEqual(0, status)
+        self.assertEqual(6, len(output.splitlines()))
+
+    def test_main_stdin(self):
+        """Test if main reads the standard input without files"""
+        with patch('sys.stdin', io.TextIOWrapper(io.BytesIO(self.data))):
+            status, output = self.run_main(['--format', '%(message)s'])
+        self.assertEqual(0, status)
+        self.assertEqual('message 0\nmessage 1\nmessage 2\n', output)
+
+    def test_main_errors(self):
+        """Test if main reports missing files and invalid formats"""
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status, _ = self.run_main([os.path.join(self.directory, 'missing.bin')])
+        self.assertEqual(1, status)
+        self.assertIn('missing.bin', stderr.getvalue())
+
+        with patch('sys.stderr', new_callable=io.StringIO), self.assertRaises(SystemExit):
+            self.run_main(['--formatter', 'csv', '--format', 'no comma', self.file_name])
+
+    def test_main_missing_string(self):
+        """Test if main reports records referring to strings their segment does not hold"""
+        index = self.data.index(b'\x02', len(BinaryFormatter.MAGIC))
+        with open(self.file_name, 'wb') as file:
+            file.write(BinaryFormatter.MAGIC + self.data[index:])
+
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status, _ = self.run_main([self.file_name])
+        self.assertEqual(1, status)
+        self.assertIn('strings of the segment', stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import gc
+import threading
+import unittest
+
+from pyloggermanager import Lock, Logger, Manager
+from pyloggermanager.handlers import Handler
+
+
+class TestLock(unittest.TestCase):
+    """Unit test cases for Lock class."""
+
+    def tearDown(self) -> None:
+        handlers = Handler.get_handlers()
+        for handler in handlers:
+            handler.close()
+
+    def test_create_valid(self):
+        """Test if create returns a lock registered under the given name."""
+        lock = Lock.create('test_lock')
+        self.assertIs(lock, Lock._get_lock('test_lock'))
+
+    def test_create_existing_lock(self):
+        """Test if create registers the provided lock under the given name."""
+        lock = threading.RLock()
+        self.assertIs(lock, Lock.create('test_existing', lock))
+        self.assertIs(lock, Lock._get_lock('TEST_EXISTING'))
+
+    def test_acquire_release(self):
+        """Test if acquire and release lock and unlock the named lock."""
+        lock = Lock.create('test_acquire')
+        self.assertTrue(Lock.acquire('test_acquire'))
+        self.assertTrue(Lock.locked('test_acquire'))
+        Lock.release('test_acquire')
+        self.assertFalse(Lock.locked('test_acquire'))
+        self.assertIsNotNone(lock)
+
+    def test_acquire_not_found(self):
+        """Test if acquire raises ValueError when the lock does not exist."""
+        with self.assertRaises(ValueError):
+            Lock.acquire('test_missing')
+
+    def test_registry_keeps_created_locks(self):
+        """Test if a lock created by the registry is kept without any reference held by the caller."""
+        Lock.create('test_kept')
+        gc.collect()
+        self.assertTrue(Lock.acquire('test_kept'))
+        Lock.release('test_kept')
+
+    def test_registry_is_weak(self):
+        """Test if registered locks are removed from the registry once their owner is discarded."""
+        Lock.create('test_weak', threading.RLock())
+        gc.collect()
+        with self.assertRaises(ValueError):
+            Lock._get_lock('test_weak')
+
+    def test_owner_locks_are_weak(self):
+        """Test if the locks of loggers and handlers are removed from the registry once they are discarded."""
+        handler = Handler()
+        logger = Logger(name='TestWeakLogger')
+        names = (handler._lock_name, logger._lock_name)
+        handler.close()
+        del handler, logger
+        gc.collect()
+        for name in names:
+            with self.assertRaises(ValueError):
+                Lock._get_lock(name)
+
+    def test_logger_lock_is_persistent(self):
+        """Test if a logger keeps the same lock and does not register new ones while logging."""
+        logger = Logger(name='TestLockLogger')
+        lock = logger._lock
+        logger.is_enabled_for(10)
+        logger.add_handler(Handler())
+        registered = len(Lock._locks)
+        for level in (20, 30, 40, 50):
+            logger.cache.clear()
+            logger.is_enabled_for(level)
+        self.assertIs(lock, logger._lock)
+        self.assertEqual(registered, len(Lock._locks))
+
+    def test_manager_lock_is_mutually_exclusive(self):
+        """Test if the manager lock blocks other threads while it is held."""
+        manager = Manager(Logger(name='TestLockLogger'))
+        acquired = []
+        manager._acquire_lock()
+        try:
+            thread = threading.Thread(target=lambda: acquired.append(manager._lock.acquire(timeout=0.05)))
+            thread.start()
+            thread.join()
+        finally:
+            manager._release_lock()
+        self.assertEqual([False], acquired)
+
+
+if __name__ == "__main__":
+    unittest.main()
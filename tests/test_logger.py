@@ -3,10 +3,11 @@ import io
 import os
 import sys
 import unittest
+import warnings
 
-from pyloggermanager import Logger, Manager, CallerFrame, Record
+from pyloggermanager import Logger, Manager, CallerFrame, Record, get_last_resort, set_last_resort
 from pyloggermanager.formatters import DefaultFormatter
-from pyloggermanager.handlers import FileHandler
+from pyloggermanager.handlers import FileHandler, Handler
 from utilityclass import UtilityClass
 
 
@@ -548,6 +549,157 @@ class TestLogger(unittest.TestCase):
                 'StackInfo', 'level'
             )
 
+    def test_info_args_valid(self):
+        """Test if info interpolates args into the message"""
+        try:
+            handler = FileHandler()
+            handler.formatter = DefaultFormatter('%(message)s')
+            self.logger.add_handler(handler)
+            self.logger.info('User %s logged in %d times', True, args=('alice', 3))
+            self.logger.info('User %(user)s logged out', True, args={'user': 'alice'})
+
+            with open(handler.filename, 'r') as file:
+                file_content = file.read()
+                self.assertIn('User alice logged in 3 times\nUser alice logged out\n', file_content)
+        finally:
+            UtilityClass.delete_file('default.log')
+
+    def test_debug_args_not_rendered_when_filtered(self):
+        """Test if args are never rendered when no handler emits the record"""
+        class Argument:
+            rendered = 0
+
+            def __str__(self):
+                Argument.rendered += 1
+                return 'argument'
+
+        try:
+            handler = FileHandler(level=20)
+            self.logger.level = 10
+            self.logger.add_handler(handler)
+            self.logger.debug('Value %s', args=(Argument(),))
+            self.assertEqual(0, Argument.rendered)
+        finally:
+            UtilityClass.delete_file('default.log')
+
+    def test_info_args_invalid(self):
+        """Test if info raises TypeError when invalid args are provided"""
+        with self.assertRaises(TypeError):
+            self.logger.info('Value %s', args='value')
+
+    def test__log_skips_caller_lookup(self):
+        """Test if caller details are only resolved when a formatter uses them"""
+        class RecordingHandler(Handler):
+            def emit(self, record, ignore_display):
+                self.records.append(record)
+
+            def flush(self):
+                pass
+
+        handler = RecordingHandler()
+        handler.records = []
+        self.logger.add_handler(handler)
+        self.logger.info('Test message')
+        self.assertEqual('Unknown Class', handler.records[-1].class_name)
+
+        handler.formatter = DefaultFormatter('%(class_name)s :: %(message)s')
+        self.logger.info('Test message')
+        self.assertEqual('TestLogger', handler.records[-1].class_name)
+        self.assertEqual('test__log_skips_caller_lookup', handler.records[-1].function_name)
+
+    def test__needs_caller_cached(self):
+        """Test if whether caller details are needed is cached with the handler chain and follows formatter changes"""
+        class CountingHandler(Handler):
+            checks = 0
+
+            @property
+            def needs_caller(self):
+                CountingHandler.checks += 1
+                return self.formatter.needs_caller
+
+            def emit(self, record, ignore_display):
+                self.records.append(record)
+
+            def flush(self):
+                pass
+
+        formatter = DefaultFormatter('%(message)s')
+        handler = CountingHandler(formatter=formatter)
+        handler.records = []
+        self.logger.add_handler(handler)
+        for _ in range(3):
+            self.logger.info('Test message')
+        self.assertEqual(1, CountingHandler.checks)
+        self.assertEqual('Unknown Class', handler.records[-1].class_name)
+
+        formatter.format_str = '%(class_name)s :: %(message)s'
+        self.logger.info('Test message')
+        self.assertEqual('TestLogger', handler.records[-1].class_name)
+
+        handler.formatter = DefaultFormatter('%(message)s')
+        self.logger.info('Test message')
+        self.assertEqual('Unknown Class', handler.records[-1].class_name)
+        self.assertEqual(3, CountingHandler.checks)
+
+    def test__log_last_resort_caller_lookup(self):
+        """Test if caller details are resolved for a last resort handler whose formatter uses them"""
+        class RecordingHandler(Handler):
+            def emit(self, record, ignore_display):
+                self.records.append(record)
+
+            def flush(self):
+                pass
+
+        handler = RecordingHandler(level=30, formatter=DefaultFormatter('%(file_name)s :: %(message)s'))
+        handler.records = []
+        last_resort = get_last_resort()
+        set_last_resort(handler)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self.logger.info('Filtered message')
+                self.logger.warning('Test message')
+        finally:
+            set_last_resort(last_resort)
+        self.assertEqual(1, len(handler.records))
+        self.assertEqual('test_logger', handler.records[0].file_name)
+        self.assertEqual('test__log_last_resort_caller_lookup', handler.records[0].function_name)
+
+    def test_call_handlers_chain_cached(self):
+        """Test if the handler chain is reused and rebuilt after the hierarchy changes"""
+        parent = Logger(name='ParentLogger')
+        parent_handler = FileHandler(file_name='parent.log')
+        handler = FileHandler()
+        try:
+            self.logger.add_handler(handler)
+            chain = self.logger._get_handler_chain()
+            self.assertEqual(((handler, handler.level),), chain)
+            self.assertIs(chain, self.logger._get_handler_chain())
+
+            parent.add_handler(parent_handler)
+            self.logger.parent = parent
+            self.assertEqual(((handler, 20), (parent_handler, 20)), self.logger._get_handler_chain())
+
+            parent_handler.level = 40
+            self.assertEqual(((handler, 20), (parent_handler, 40)), self.logger._get_handler_chain())
+
+            self.logger.propagate = False
+            self.assertEqual(((handler, 20),), self.logger._get_handler_chain())
+
+            self.logger.remove_handler(handler)
+            self.assertEqual((), self.logger._get_handler_chain())
+            self.assertFalse(self.logger.has_handlers())
+        finally:
+            parent_handler.close()
+            handler.close()
+            UtilityClass.delete_file('parent.log')
+            UtilityClass.delete_file('default.log')
+
+    def test_propagate_property_invalid(self):
+        """Test if propagate property raises TypeError"""
+        with self.assertRaises(TypeError):
+            self.logger.propagate = 'propagate'
+
     def test_find_caller_valid(self):
         """Test if the find caller works as expected"""
         caller_frame, stack_info = self.logger.find_caller(True)
@@ -640,6 +792,17 @@ class TestLogger(unittest.TestCase):
         self.logger.disabled = True
         self.assertFalse(self.logger.is_enabled_for(20))
 
+    def test_is_enabled_for_follows_configuration(self):
+        """Test if cached level decisions are discarded when the configuration changes"""
+        self.assertFalse(self.logger.is_enabled_for(10))
+        self.logger.level = 10
+        self.assertTrue(self.logger.is_enabled_for(10))
+        self.logger.manager.disable = 10
+        self.assertFalse(self.logger.is_enabled_for(10))
+        self.assertTrue(self.logger.is_enabled_for(20))
+        self.logger.manager.disable = 0
+        self.assertTrue(self.logger.is_enabled_for(10))
+
     def test_is_enabled_for_invalid(self):
         """Test if is enabled for raises TypeError"""
         with self.assertRaises(TypeError):
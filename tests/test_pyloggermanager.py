@@ -1,11 +1,18 @@
+import asyncio
+import inspect
 import io
 import os
 import sys
+import threading
 import unittest
+import warnings
+from unittest.mock import patch
 
 import pyloggermanager
-from pyloggermanager import Logger, LogLevel
-from pyloggermanager.handlers import FileHandler
+from pyloggermanager import CallerFrame, Logger, LogLevel, Record
+from pyloggermanager.formatters import DefaultFormatter
+from pyloggermanager.handlers import AsyncHandler, FileHandler, FlushPolicy, Handler, QueueHandler, QueueListener, \
+    StderrHandler
 from utilityclass import UtilityClass
 
 
@@ -53,6 +60,95 @@ class TestPyLoggerManager(unittest.TestCase):
                 handler.close()
             UtilityClass.delete_file('default.log')
 
+    def test_last_resort_unconfigured_logging(self):
+        """Test if unconfigured logging reuses the last resort handler and warns only once"""
+        sys.modules['pyloggermanager.__main__']._last_resort_warned = False
+        logger = Logger(name='UnconfiguredLogger')
+        with self.assertWarns(RuntimeWarning), patch('sys.stderr', new_callable=io.StringIO):
+            logger.warning('Warm up')
+        handlers_count = len(Handler.get_handlers())
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr, warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(1000):
+                logger.warning('Unconfigured message')
+        self.assertEqual(handlers_count, len(Handler.get_handlers()))
+        self.assertEqual(1000, stderr.getvalue().count('Unconfigured message'))
+        self.assertEqual(0, len(caught))
+        self.assertIsInstance(pyloggermanager.get_last_resort(), StderrHandler)
+
+    def test_set_last_resort(self):
+        """Test if the last resort handler can be replaced and disabled"""
+        last_resort = pyloggermanager.get_last_resort()
+        logger = Logger(name='UnconfiguredLogger')
+        try:
+            pyloggermanager.set_last_resort(None)
+            with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                logger.warning('Dropped message')
+            self.assertEqual('', stderr.getvalue())
+
+            handler = StderrHandler(LogLevel.ERROR)
+            pyloggermanager.set_last_resort(handler)
+            self.assertIs(handler, pyloggermanager.get_last_resort())
+            with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                logger.warning('Filtered message')
+                logger.error('Error message')
+            self.assertNotIn('Filtered message', stderr.getvalue())
+            self.assertIn('Error message', stderr.getvalue())
+        finally:
+            pyloggermanager.set_last_resort(last_resort)
+
+    def test_set_last_resort_invalid(self):
+        """Test if set last resort raises TypeError"""
+        with self.assertRaises(TypeError):
+            pyloggermanager.set_last_resort('handler')
+
+    def test_shutdown_reverse_creation_order(self):
+        """Test if shutdown flushes and closes live handlers in reverse creation order"""
+        calls = []
+
+        class RecordingHandler(Handler):
+            def flush(self):
+                calls.append(('flush', self.name))
+
+            def close(self):
+                calls.append(('close', self.name))
+                super().close()
+
+        handlers = [RecordingHandler(name=name) for name in ('first', 'second', 'third')]
+        pyloggermanager.shutdown()
+        self.assertEqual([
+            ('flush', 'third'), ('close', 'third'),
+            ('flush', 'second'), ('close', 'second'),
+            ('flush', 'first'), ('close', 'first')
+        ], calls)
+        self.assertFalse(any(handler in Handler.get_handlers() for handler in handlers))
+
+    def test_shutdown_async(self):
+        """Test if shutdown async awaits pending asynchronous records before closing the handlers"""
+        messages = []
+
+        class RecordingHandler(Handler):
+            def emit(self, record, ignore_display):
+                messages.append(record.message)
+
+            def flush(self):
+                pass
+
+        target = RecordingHandler()
+        handler = AsyncHandler([target])
+        logger = Logger(name='TestAsyncLogger')
+        logger.add_handler(handler)
+
+        async def main():
+            for index in range(20):
+                logger.info(f'Message {index}')
+            await pyloggermanager.shutdown_async()
+
+        asyncio.run(main())
+        self.assertEqual([f'Message {index}' for index in range(20)], messages)
+        self.assertNotIn(handler, Handler.get_handlers())
+        self.assertNotIn(target, Handler.get_handlers())
+
     def test_get_logger_invalid(self):
         """Test if the get logger raises TypeError"""
         with self.assertRaises(TypeError):
@@ -156,6 +252,141 @@ class TestPyLoggerManager(unittest.TestCase):
         finally:
             UtilityClass.delete_file('default.log')
 
+    @staticmethod
+    def run_in_child(function) -> str:
+        """Runs a function in a forked child process and returns the repr of its result."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                result = repr(function())
+            except BaseException as error:
+                result = f'error: {error!r}'
+            os.write(write_fd, result.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            result = pipe.read()
+        os.waitpid(pid, 0)
+        return result
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_reinitializes_locks(self):
+        """Test if locks held by another thread of the parent can be acquired in a forked child"""
+        self.logger = Logger(name='ForkLogger')
+        handler = StderrHandler()
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with handler._lock, self.logger._lock:
+                held.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait()
+        try:
+            result = self.run_in_child(lambda: (
+                handler._lock.acquire(timeout=1), self.logger._lock.acquire(timeout=1)
+            ))
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual('(True, True)', result)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_caches_process_id(self):
+        """Test if records created in a forked child carry the process ID of the child"""
+        caller_frame = CallerFrame.get_caller_details(inspect.currentframe())
+
+        def create_record():
+            with patch('os.getpid', side_effect=AssertionError('os.getpid called')):
+                process_id = Record('Test message', 'TestLogger', 20, caller_frame).process_id
+            return process_id == os.getpid() and process_id != os.getppid()
+
+        self.assertEqual('True', self.run_in_child(create_record))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_detaches_file_stream(self):
+        """Test if a forked child does not write the buffered output of the parent again"""
+        file_name = 'fork_stream.log'
+        self.addCleanup(UtilityClass.delete_file, file_name)
+        caller_frame = CallerFrame.get_caller_details(inspect.currentframe())
+        handler = FileHandler(file_name=file_name, file_mode='a', keep_open=True,
+                              formatter=DefaultFormatter('%(message)s'), flush_policy=FlushPolicy(records=100))
+        handler.handle(Record('parent before', 'TestLogger', 20, caller_frame), True)
+
+        def write():
+            handler.handle(Record('child', 'TestLogger', 20, caller_frame), True)
+            handler.close()
+            return handler.filemode
+
+        self.assertEqual("'a'", self.run_in_child(write))
+        handler.handle(Record('parent after', 'TestLogger', 20, caller_frame), True)
+        handler.close()
+        with open(file_name, 'r') as file:
+            self.assertEqual(['parent before', 'child', 'parent after'], file.read().splitlines())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_discards_output_buffered_before_fork(self):
+        """Test if a forked child does not write output another thread buffered while the process forked"""
+        caller_frame = CallerFrame.get_caller_details(inspect.currentframe())
+        for raw in (False, True):
+            with self.subTest(raw=raw):
+                file_name = f'fork_buffered_{raw}.log'
+                self.addCleanup(UtilityClass.delete_file, file_name)
+                handler = FileHandler(file_name=file_name, file_mode='a', keep_open=True, raw=raw,
+                                      formatter=DefaultFormatter('%(message)s'),
+                                      flush_policy=FlushPolicy(records=100))
+                handler.handle(Record('parent before', 'TestLogger', 20, caller_frame), True)
+                before_fork = handler._before_fork
+
+                def buffer_late_record():
+                    before_fork()
+                    thread = threading.Thread(target=handler.handle, args=(
+                        Record('parent late', 'TestLogger', 20, caller_frame), True
+                    ))
+                    thread.start()
+                    thread.join()
+
+                def write():
+                    handler.handle(Record('child', 'TestLogger', 20, caller_frame), True)
+                    handler.close()
+
+                with patch.object(handler, '_before_fork', buffer_late_record):
+                    self.run_in_child(write)
+                handler.close()
+                with open(file_name, 'r') as file:
+                    self.assertEqual(['parent before', 'child', 'parent late'], file.read().splitlines())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_restarts_queue_listener(self):
+        """Test if a forked child restarts the queue listener and only handles its own records"""
+        caller_frame = CallerFrame.get_caller_details(inspect.currentframe())
+        messages = []
+
+        class RecordingHandler(Handler):
+            def emit(self, record, ignore_display: bool) -> None:
+                messages.append(record.message)
+
+            def flush(self) -> None:
+                pass
+
+        queue_handler = QueueHandler()
+        listener = QueueListener(queue_handler, [RecordingHandler()])
+        listener.start()
+        self.addCleanup(listener.stop)
+
+        def log():
+            queue_handler.handle(Record('child', 'TestLogger', 20, caller_frame), True)
+            listener.stop()
+            return messages
+
+        self.assertEqual("['child']", self.run_in_child(log))
+
 
 if __name__ == "__main__":
     unittest.main()
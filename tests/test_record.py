@@ -1,4 +1,6 @@
 import inspect
+import pickle
+import threading
 import unittest
 from datetime import datetime
 from unittest.mock import ANY
@@ -152,6 +154,111 @@ class TestRecord(unittest.TestCase):
         """Test level name property"""
         self.assertEqual(self.record.level_name, 'INFO')
 
+    def test_message_property_args(self):
+        """Test if message interpolates args once and keeps the result"""
+        record = Record(
+            message='Hello %s',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=self.caller_frame,
+            args=('world',)
+        )
+        self.assertEqual('Hello world', record.message)
+        self.assertEqual('Hello world', record.message)
+        record.message = '100%'
+        self.assertEqual('100%', record.message)
+
+    def test_message_property_args_concurrent(self):
+        """Test if a read racing with the first read of the message still gets the message interpolated once"""
+        checking = threading.Event()
+        resume = threading.Event()
+
+        class Args(dict):
+            def __len__(self):
+                # Pauses the racing thread between checking for arguments and interpolating them
+                if threading.current_thread().name == 'racing':
+                    checking.set()
+                    resume.wait(5)
+                return dict.__len__(self)
+
+        record = Record(
+            message='%(count)d of 100%%',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=self.caller_frame,
+            args=Args(count=5)
+        )
+        results = []
+        thread = threading.Thread(target=lambda: results.append(record.message), name='racing')
+        thread.start()
+        self.assertTrue(checking.wait(5))
+        self.assertEqual('5 of 100%', record.message)
+        resume.set()
+        thread.join()
+        self.assertEqual(['5 of 100%'], results)
+        self.assertEqual('5 of 100%', record.message)
+
+    def test_init_invalid_args(self):
+        """Test if init raises TypeError when invalid args are provided"""
+        with self.assertRaises(TypeError):
+            Record(
+                message='Hello %s',
+                logger_name='TestLogger',
+                level_number=20,
+                caller_frame=self.caller_frame,
+                args='world'
+            )
+
+    def test_level_name_property_after_level_number(self):
+        """Test if level name follows a changed level number"""
+        self.assertEqual(self.record.level_name, 'INFO')
+        self.record.level_number = 40
+        self.assertEqual(self.record.level_name, 'ERROR')
+
+    def test_slots(self):
+        """Test if records are slotted and do not carry an instance dictionary"""
+        with self.assertRaises(AttributeError):
+            self.record.custom_attribute = 'value'
+
+    def test_caller_detail_setter_does_not_change_caller_frame(self):
+        """Test if overriding a caller detail keeps the shared caller frame untouched"""
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=self.caller_frame
+        )
+        record.function_name = 'TestFunction'
+        self.assertEqual('TestFunction', record.function_name)
+        self.assertEqual('setUp', self.caller_frame.function_name)
+        self.assertEqual('setUp', self.record.function_name)
+        self.assertEqual('TestRecord', record.class_name)
+
+    def test_thread_name_resolved_for_creating_thread(self):
+        """Test if thread name is the one of the thread that created the record"""
+        records = []
+        thread = threading.Thread(target=lambda: records.append(Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=20,
+            caller_frame=self.caller_frame
+        )), name='RecordThread')
+        thread.start()
+        thread.join()
+        self.assertEqual('RecordThread', records[0].thread_name)
+        self.assertEqual(thread.ident, records[0].thread)
+
+    def test_pickle(self):
+        """Test if a record survives pickling with its lazy details resolved"""
+        record = Record(
+            message='Test message',
+            logger_name='TestLogger',
+            level_number=30,
+            caller_frame=self.caller_frame
+        )
+        restored = pickle.loads(pickle.dumps(record))
+        self.assertDictEqual(record.to_dict(), restored.to_dict())
+
     def test_file_name_property_valid(self):
         """Test file name property"""
         self.record.file_name = 'TestFileName'
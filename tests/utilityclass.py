@@ -1,6 +1,12 @@
+import inspect
 import os
 import random
+import shutil
 import string
+import tempfile
+
+from pyloggermanager import CallerFrame, Record
+from pyloggermanager.handlers import Handler
 
 
 class UtilityClass:
@@ -29,3 +35,49 @@ class UtilityClass:
             os.remove(file_name)
         except (FileNotFoundError, PermissionError, IsADirectoryError):
             pass
+
+    @staticmethod
+    def create_directory() -> str:
+        """
+        Creates a temporary directory for the files of a test.
+
+        :return: Path of the created directory.
+        :rtype: str
+        """
+        return tempfile.mkdtemp()
+
+    @staticmethod
+    def delete_directory(directory: str) -> None:
+        """
+        Deletes the specified directory with its content, if exists.
+
+        :param directory: Directory path to delete.
+        :type directory: str
+        """
+        shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    def create_record(message: str = 'Test message', level_number: int = 20, **kwargs) -> Record:
+        """
+        Creates a log record of the 'TestLogger' logger, carrying the caller details of the calling test.
+
+        :param message: Message of the record. Defaults to 'Test message'.
+        :type message: str
+        :param level_number: Log level of the record. Defaults to 20.
+        :type level_number: int
+        :param kwargs: Other arguments of the record, such as logger_name, caller_frame or args.
+        :return: Log record.
+        :rtype: Record
+        """
+        kwargs.setdefault('logger_name', 'TestLogger')
+        if 'caller_frame' not in kwargs:
+            kwargs['caller_frame'] = CallerFrame.get_caller_details(inspect.currentframe())
+        return Record(message=message, level_number=level_number, **kwargs)
+
+    @staticmethod
+    def close_handlers() -> None:
+        """
+        Closes every registered handler.
+        """
+        for handler in Handler.get_handlers():
+            handler.close()